@@ -5,11 +5,49 @@ COEFFICIENT_PATH = './back_end/data/coefficient.json'
 EVOLUTION_STAGE_PATH = './back_end/data/evolution_stage.json'
 TYPES_PATH = './back_end/data/types_probability.json'
 WORLD_POKEMON_PATH = './back_end/data/pokemons.json'
-PLAYER_POKEDEX = './back_end/data/player_pokedex.json'
+PLAYER_POKEDEX = './back_end/data/player_pokedex.json' # Legacy single-file save, split on first load
+PLAYER_INDEX = './back_end/data/player_index.json'
+PLAYER_SAVE_DIR = './back_end/data/players/'
+PLAYER_JOURNAL = './back_end/data/player_journal.log'
 NAME_LIST_PATH = './back_end/data/pet_names.json'
 ABSOLUTE_IMAGE_PATH = "./assets/pokemon_image/"
 
 
+"""
+WILD POKEMONS
+"""
+WILD_POOL_REFILL_THRESHOLD = 4 # A new batch is generated once this many wild Pokemon (or less) remain
+WILD_POOL_SAVE_INTERVAL = 30.0 # Seconds between two writes of the wild pool file
+
+
+"""
+SAVES
+"""
+SAVE_BACKEND = "json" # "json" (one file per player) or "sqlite"
+SQLITE_SAVE_PATH = './back_end/data/player_saves.db'
+SAVE_FLUSH_DELAY = 2.0 # Seconds without new write before pending saves are flushed to disk
+SAVE_JOURNAL_COMPACT_SIZE = 256 * 1024 # Bytes of journal before it is folded into the player files
+RECORD_BATTLES = True # Every battle is appended to the player's replay file
+REPLAY_DIR = './back_end/data/replays/'
+
+
+"""
+RANDOM
+"""
+RNG_SEED = None # Fixed seed for every session (reproducible runs), None for a fresh seed each time
+RNG_BLOCK_SIZE = 1024 # Random words pre-drawn at once by the RNG service
+
+
+"""
+WILD BOT
+"""
+BOT_MODE = "random" # "random" (random type among its types) or "expectimax" (searched attack)
+BOT_NODE_BUDGET = 600 # Positions searched per turn (about 2 ms at worst, the same choices on any CPU)
+BOT_TIME_BUDGET = None # Optional wall-clock cap of the game's bot in seconds (choices then depend on the CPU)
+BOT_MAX_DEPTH = 8 # Plies searched at most (iterative deepening stops earlier when out of budget)
+BOT_HP_BUCKETS = 32 # HP resolution of the transposition table (buckets per hp_max)
+
+
 """
 FONTS
 """
@@ -17,6 +55,7 @@ FONTS
 # REGULAR_FONT = "./assets/fonts/CreatoDisplay-Medium.otf"
 REGULAR_FONT = "./assets/fonts/Pixellari.ttf"
 POKE_FONT = "./assets/fonts/Pokemon_Solid.ttf"
+TEXT_CACHE_SIZE = 512 # Rendered strings kept in memory (least recently used evicted first)
 
 
 """
@@ -54,5 +93,8 @@ LIGHT_RED = (218,131,131)
 """
 IMAGES
 """
+ASSET_CACHE_MAX_BYTES = 64 * 1024 * 1024 # Decoded surfaces kept in memory (least recently used evicted first)
+TRANSFORM_CACHE_MAX_BYTES = 32 * 1024 * 1024 # Scaled / flipped copies of those surfaces drawn in battle
+BACKGROUND_CACHE_SIZE = 8 # Full-screen backgrounds kept scaled, with their overlay
 CHEN = "./assets/backgrounds/professor_oak.png"
 POKEBALL = "./assets/backgrounds/pokeball.png"
\ No newline at end of file
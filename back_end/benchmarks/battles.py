@@ -0,0 +1,33 @@
+"""
+Headless battle benchmark.
+Plays N wild battles with the BattleEngine (no display): a random low-level Pokemon against another one,
+the player always attacking with its first type. Prints the battles per second and the outcomes.
+
+    python -m back_end.benchmarks.battles [count] [seed]
+"""
+
+import sys, time
+from ..generate_pokemon.create_pokemon import create_low_level_world_pokemons
+from ..models.battle_engine import run_battle
+from ..models.bag import Bag
+from ..models.rng import RngService
+
+def play(count, seed=None):
+    rng = RngService(seed)
+    pokemons = []
+    while len(pokemons) < 2 * count:
+        pokemons.extend(create_low_level_world_pokemons(rng))
+
+    outcomes = {"player" : 0, "enemy" : 0, None : 0}
+    start = time.perf_counter()
+    for index in range(count):
+        engine = run_battle(pokemons[2 * index], pokemons[2 * index + 1], Bag(), rng=rng)
+        outcomes[engine.winner] += 1
+    return count / (time.perf_counter() - start), outcomes
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    battles_per_second, outcomes = play(count, seed)
+    print(f"{count} battles: {battles_per_second:.0f} battles/s "
+          f"(player wins {outcomes['player']}, enemy wins {outcomes['enemy']}, unfinished {outcomes[None]})")
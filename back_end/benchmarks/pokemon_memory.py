@@ -0,0 +1,40 @@
+"""
+Memory benchmark of the Pokemon objects.
+Mimics a wild pool / save being loaded: N records are parsed from JSON (each with its own strings,
+like a file read) and hydrated, then the records are dropped and only the Pokemon objects are kept.
+Prints the traced bytes per Pokemon.
+
+    python -m back_end.benchmarks.pokemon_memory [count]
+"""
+
+import gc, json, sys, tracemalloc
+from ..generate_pokemon.create_pokemon import create_low_level_world_pokemons
+from ..data_access.util import instanciate_pokemon
+
+def build_records(count):
+    """Returns count serialized pokemon records (cycling over the base species)."""
+    records = []
+    while len(records) < count:
+        records.extend(pokemon.pokemon_dict() for pokemon in create_low_level_world_pokemons())
+    return json.dumps(records[:count])
+
+def measure(count):
+    serialized = build_records(count)
+    gc.collect()
+
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    records = json.loads(serialized)
+    pokemons = [instanciate_pokemon(record) for record in records]
+    del records
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+
+    has_dict = hasattr(pokemons[0], "__dict__")
+    return used / len(pokemons), has_dict
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    bytes_per_pokemon, has_dict = measure(count)
+    print(f"{count} Pokemon: {bytes_per_pokemon:.0f} bytes per Pokemon (instance __dict__: {has_dict})")
@@ -2,24 +2,36 @@ import back_end.data_access.player_pokedex_service as player_pokedex_service
 import back_end.data_access.pokemon_pokedex_service as pokemon_pokedex_service
 import back_end.data_access.wild_pokemons as wild_pokemons
 import back_end.data_access.bag_pokedex_service as bag_pokedex_service
-import json
-import os
+import back_end.data_access.replay_store as replay_store
+from back_end.models.rng import seed_session, choose_session_seed, get_rng
+from back_end.models.battle_log import BattleRecorder
+from __settings__ import SAVE_BACKEND, RECORD_BATTLES
+
+# --- Storage backend selection ---
+# Both backends expose the same service functions
+if SAVE_BACKEND == "sqlite":
+    import back_end.data_access.sqlite_service as sqlite_service
+    player_service = pokemon_service = bag_service = sqlite_service
+else:
+    player_service = player_pokedex_service
+    pokemon_service = pokemon_pokedex_service
+    bag_service = bag_pokedex_service
 
 # --- Player Pokedex Service ---
 
 def get_player_names():
     """Retrieves the list of all existing player profile names."""
-    player_names = list(player_pokedex_service.get_player_names())
+    player_names = list(player_service.get_player_names())
     return player_names
 
 def get_player_pokemons(player):
     """Retrieves the current team of Pokemon for a specific player."""
-    player_pokemons = list(player_pokedex_service.get_player_pokemons(player))
+    player_pokemons = list(player_service.get_player_pokemons(player))
     return player_pokemons
 
 def create_player(player, pokemon):
     """Initializes a new player profile with their chosen starter."""
-    player_pokedex_service.create_player(player, pokemon)
+    player_service.create_player(player, pokemon)
 
 def get_starter_pokemons():
     """Retrieves the standard selection of 3 starter Pokemon."""
@@ -31,24 +43,28 @@ def get_starter_pokemons():
 
 def does_player_exist(player):
     """Checks if a player name is already registered in the database."""
-    is_player = player_pokedex_service.does_player_exist(player)
+    is_player = player_service.does_player_exist(player)
     return is_player
 
 # --- Pokemon Pokedex Service ---
 
 def get_all_pokemons_from_pokedex(player_name):
     """Fetches the full collection of Pokemon associated with a player."""
-    pokemon_list = pokemon_pokedex_service.get_all_pokemons_from_pokedex(player_name)
+    pokemon_list = pokemon_service.get_all_pokemons_from_pokedex(player_name)
     return pokemon_list
 
 def get_first_pokemon(player_name):
     """Gets the lead Pokemon from the player's team."""
-    pokemon = pokemon_pokedex_service.get_first_pokemon(player_name)
+    pokemon = pokemon_service.get_first_pokemon(player_name)
     return pokemon
 
+def get_pokemon_from_pokedex(player_name, pet_name):
+    """Gets one Pokemon of the player by its pet name."""
+    return pokemon_service.get_pokemon_from_pokedex(player_name, pet_name)
+
 def save_pokemon_to_pokedex(player, pokemon):
     """Persists a new or updated Pokemon to the player's collection."""
-    pokemon_pokedex_service.save_pokemon_to_pokedex(player, pokemon)
+    pokemon_service.save_pokemon_to_pokedex(player, pokemon)
 
 # --- Wild Pokemon ---
 
@@ -64,12 +80,12 @@ def save_wild_pokemon(my_pokemon):
 
 def get_bag_from_pokedex(player):
     """Retrieves the player's inventory (items, potions, etc.)."""
-    bag = bag_pokedex_service.get_bag_from_pokedex(player)
+    bag = bag_service.get_bag_from_pokedex(player)
     return bag
 
 def save_bag_to_pokedex(player, bag):
     """Saves the current state of the player's inventory."""
-    bag_pokedex_service.save_bag_to_pokedex(player, bag)
+    bag_service.save_bag_to_pokedex(player, bag)
 
 
 
@@ -78,32 +94,17 @@ def save_bag_to_pokedex(player, bag):
 
 def save_player_data(player_name, data):
     """
-    Updates the 'player_pokedex' (the list of seen/caught IDs) in the JSON database.
+    Updates the 'player_pokedex' (the list of seen/caught IDs) in the save.
     """
     try:
-        json_path = "back_end/data/player_pokedex.json"
-        
-        # Check if the database file exists
-        if not os.path.exists(json_path):
-            print(f" Error: The file {json_path} was not found.")
-            return False
-
-        # Load current database state
-        with open(json_path, 'r', encoding='utf-8') as f:
-            all_data = json.load(f)
-        
         # Validate that the player exists in the record
-        if player_name not in all_data:
-            print(f"⚠ Player {player_name} does not exist in player_pokedex.json")
+        if not player_service.does_player_exist(player_name):
+            print(f"⚠ Player {player_name} does not exist in the saves")
             return False
         
         # Update the specific Pokedex discovery list
         if "player_pokedex" in data:
-            all_data[player_name]["player_pokedex"] = data["player_pokedex"]
-        
-        # Write back to JSON file
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(all_data, f, indent=4, ensure_ascii=False)
+            player_service.save_discoveries(player_name, data["player_pokedex"])
         
         print(f" Pokedex successfully saved for {player_name}")
         return True
@@ -118,22 +119,52 @@ def load_player_data(player_name):
     Returns a dictionary structured for the UI components.
     """
     try:
-        json_path = "back_end/data/player_pokedex.json"
-        
-        with open(json_path, 'r', encoding='utf-8') as f:
-            all_data = json.load(f)
-        
-        if player_name not in all_data:
+        if not player_service.does_player_exist(player_name):
             return None
         
-        player_data = all_data[player_name]
-        
         # Return the structure required by the Pause Menu and Pokedex UI
         return {
             "player_name": player_name,
-            "player_pokedex": player_data.get("player_pokedex", [])
+            "player_pokedex": player_service.get_discoveries(player_name)
         }
         
     except Exception as e:
         print(f"❌ Error during loading: {e}")
-        return None
\ No newline at end of file
+        return None
+
+# --- Session RNG ---
+
+def start_session_rng(player_name):
+    """
+    Seeds the random source of a game session (fights, wild Pokemon, evolutions...).
+    The seed comes from the command line / RNG_SEED, from the player's save when replaying, or is fresh.
+    It is recorded in the save, so the session can be replayed with --replay-seed.
+    """
+    is_player = player_service.does_player_exist(player_name)
+    saved_seed = player_service.get_rng_seed(player_name) if is_player else None
+    rng = seed_session(choose_session_seed(saved_seed))
+    if is_player:
+        player_service.save_rng_seed(player_name, rng.seed)
+    print(f"🎲 Session seed: {rng.seed}")
+    return rng.seed
+
+# --- Battle replays ---
+
+def new_battle_rng():
+    """Random source of one battle: its own stream, so the battle can be replayed from its seed."""
+    return get_rng().spawn()
+
+def new_battle_recorder():
+    """Recorder of the next battle, None when RECORD_BATTLES is off."""
+    return BattleRecorder() if RECORD_BATTLES else None
+
+def save_battle_replay(player_name, recorder):
+    """Appends a finished battle to the player's replay file."""
+    if recorder is not None and recorder.finished:
+        replay_store.append_replay(player_name, recorder.to_bytes())
+
+# --- Pending saves ---
+
+def flush_saves():
+    """Writes pending saves to disk now (scene change, return to menu...)."""
+    player_service.flush_saves()
@@ -0,0 +1,110 @@
+import json
+from types import MappingProxyType
+from __settings__ import COEFFICIENT_PATH, EVOLUTION_STAGE_PATH, TYPES_PATH, NAME_LIST_PATH
+
+def freeze(data):
+    """Recursively turns parsed JSON into read-only structures (dicts -> mapping proxies, lists -> tuples)."""
+    if isinstance(data, dict):
+        return MappingProxyType({key : freeze(value) for key, value in data.items()})
+    if isinstance(data, list):
+        return tuple(freeze(value) for value in data)
+    return data
+
+def load_json(path):
+    with open(path, 'r', encoding="UTF-8") as file:
+        return json.load(file)
+
+class GameData:
+    """
+    Static game data (type chart, evolution lines, type/species probabilities, pet names).
+    Every file is parsed exactly once into immutable structures, plus a few lookup indexes,
+    so building or evolving a Pokemon never touches the disk.
+    """
+    def __init__(self):
+        # attack type -> defender type -> coefficient
+        self.coefficients = freeze(load_json(COEFFICIENT_PATH))
+        # first stage name -> evolution name -> stage
+        self.evolution_stages = freeze(load_json(EVOLUTION_STAGE_PATH))
+        # first type -> second type (or "alone") -> {"probability", "names" : first stage name -> name -> stage}
+        self.types = freeze(load_json(TYPES_PATH))
+        self.pet_names = freeze(load_json(NAME_LIST_PATH))
+
+        self.type_names = tuple(self.types.keys())
+        # Every species of the evolution lines (file order) gets an integer id, used by the columnar tables
+        self.species_names = tuple(dict.fromkeys(
+            name for evolution_stage in self.evolution_stages.values() for name in evolution_stage))
+        self.__species_ids = MappingProxyType({name : species_id for species_id, name in enumerate(self.species_names)})
+        self.__stage_names = self.__index_stage_names()
+        self.__second_types = self.__index_second_types()
+        self.__base_species = self.__index_base_species()
+
+    def __index_stage_names(self):
+        """(first stage name, stage) -> name of the Pokemon at that stage (first one listed wins)."""
+        stage_names = {}
+        for original_name, evolution_stage in self.evolution_stages.items():
+            for name, stage in evolution_stage.items():
+                stage_names.setdefault((original_name, stage), name)
+        return MappingProxyType(stage_names)
+
+    def __index_second_types(self):
+        """(first type, first stage name, name) -> second types that list this evolution, in file order."""
+        second_types = {}
+        for first_type, sub_types in self.types.items():
+            for sub_type, sub_type_dict in sub_types.items():
+                if sub_type == "alone":
+                    continue
+                for original_name, names in sub_type_dict["names"].items():
+                    for name in names:
+                        key = (first_type, original_name, name)
+                        second_types[key] = second_types.get(key, ()) + (sub_type,)
+        return MappingProxyType(second_types)
+
+    def __index_base_species(self):
+        """
+        Base species name -> (first type, second type or "alone", stage, evolution line).
+        A line is filed under its first stage 1 name, the first (first type, second type) listing it wins.
+        """
+        base_species = {}
+        for first_type, sub_types in self.types.items():
+            for sub_type, sub_type_dict in sub_types.items():
+                for names in sub_type_dict["names"].values():
+                    for name, stage in names.items():
+                        if stage == 1:
+                            base_species.setdefault(name, (first_type, sub_type, stage, names))
+                            break
+        return MappingProxyType(base_species)
+
+    # --- Evolution lines ---
+
+    def get_evolution_stage(self, original_name):
+        """Returns the evolution line of a Pokemon (name -> stage)."""
+        return self.evolution_stages[original_name]
+
+    def get_species_id(self, name):
+        return self.__species_ids[name]
+
+    def get_stage_name(self, original_name, stage):
+        return self.__stage_names[(original_name, stage)]
+
+    def get_second_types(self, first_type, original_name, name):
+        """Second types an evolution gains when its line is listed under first_type (empty if none)."""
+        return self.__second_types.get((first_type, original_name, name), ())
+
+    # --- Types ---
+
+    def get_first_type_dict(self, first_type):
+        return self.types[first_type]
+
+    def get_base_species(self, name):
+        """Returns (first type, second type or "alone", stage, evolution line) of a base species, None if unlisted."""
+        return self.__base_species.get(name)
+
+
+_game_data = None
+
+def get_game_data():
+    """Returns the process-wide GameData, parsing the data files on first use."""
+    global _game_data
+    if _game_data is None:
+        _game_data = GameData()
+    return _game_data
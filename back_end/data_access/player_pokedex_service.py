@@ -1,33 +1,31 @@
-import json, os, random
-from __settings__ import PLAYER_POKEDEX
 from .wild_pokemons import get_random_wild_pokemon
-from .pokemon_pokedex_service import save_pokemon_to_pokedex
+from .pokemon_pokedex_service import save_pokemon_to_pokedex, get_player_pokemons
 from .bag_pokedex_service import save_bag_to_pokedex
+from .save_store import get_save_store
 from ..models.bag import Bag
 from ..generate_pokemon.create_pokemon import level_from_stage
 from ..models.pokemon import Pokemon
+from ..models.rng import get_rng
 
 # --- Back-to-Front (Data Retrieval) ---
 
 def get_player_names():
-    """Retrieves all registered player names from the Pokedex JSON file."""
-    with open(PLAYER_POKEDEX, "r", encoding="UTF-8") as file:
-        player_keys_dictionary = json.load(file)
-    return player_keys_dictionary.keys()
+    """Retrieves all registered player names from the save store."""
+    return get_save_store().get_player_names()
 
 def does_player_exist(player):
-    """
-    Checks if a player name is already taken.
-    Initializes an empty Pokedex file if it doesn't exist.
-    """
-    if not os.path.exists(PLAYER_POKEDEX):
-        with open(PLAYER_POKEDEX, "w", encoding="UTF-8") as file:
-            json.dump({}, file)
+    """Checks if a player name is already taken."""
+    return get_save_store().has_player(player)
+
+
+def get_discoveries(player):
+    """Returns the list of Pokedex entries discovered by the player."""
+    return get_save_store().get_discoveries(player)
 
-    with open(PLAYER_POKEDEX, "r", encoding="UTF-8") as file:
-        player_keys_dictionary = list(json.load(file).keys())
 
-    return player in player_keys_dictionary
+def get_rng_seed(player):
+    """Returns the seed of the player's last session (None if never recorded)."""
+    return get_save_store().get_rng_seed(player)
 
 
 # --- Front-to-Back (Data Storage) ---
@@ -37,45 +35,46 @@ def create_player(player, pokemon):
     Registers a new player with a default inventory and their first Pokemon.
     Saves the profile to the Pokedex database.
     """
-    with open(PLAYER_POKEDEX, "r", encoding="UTF-8") as file:
-        players_dictionary = json.load(file)
-
     # Only create if the name is unique
-    if player not in players_dictionary.keys():
-        player_bag = Bag()
-        players_dictionary[player] = {
-            "bag" : {},
-            "pokemons" : {}
-            }
-    else:
+    if not get_save_store().add_player(player):
         return # Abort if player exists
-            
-    with open(PLAYER_POKEDEX, "w", encoding="UTF-8") as file:
-        json.dump(players_dictionary, file, indent=4)
+    player_bag = Bag()
     
     # Save the associated starter and the new bag
     save_pokemon_to_pokedex(player, pokemon)
     save_bag_to_pokedex(player, player_bag)
 
+def save_discoveries(player, player_pokedex):
+    """Replaces the list of Pokedex entries discovered by the player."""
+    get_save_store().set_discoveries(player, player_pokedex)
+
+def save_rng_seed(player, seed):
+    get_save_store().set_rng_seed(player, seed)
+
+def flush_saves():
+    """Writes the pending changes of the save store to disk."""
+    get_save_store().flush()
+
 
-def create_specific_starter(name, first_stage_name, type_list, stage):
+def create_specific_starter(name, first_stage_name, type_list, stage, rng=None):
     """
     Factory function to create a standardized Level 5 starter Pokemon.
     Calculates randomized base stats.
     """
+    rng = rng or get_rng()
     level = 5  # Fixed starting level
     
     # Calculate base stats with a random variance
-    hp = random.randrange(10, 31) + level * 3
-    strength = random.randrange(2, 31) + level * 3
-    speed = random.randrange(2, 31) + level * 3
-    defense_point = random.randrange(2, 21) + level * 3
+    hp = rng.randrange(10, 31) + level * 3
+    strength = rng.randrange(2, 31) + level * 3
+    speed = rng.randrange(2, 31) + level * 3
+    defense_point = rng.randrange(2, 21) + level * 3
     
     # Instantiate the Pokemon object
     my_pokemon = Pokemon(name, first_stage_name, hp, hp, strength, defense_point, type_list, level, speed, stage)
     
     # Set experience points appropriate for Level 5
-    xp = random.randrange(my_pokemon.get_level()**3, (my_pokemon.get_level()+1)**3)
+    xp = rng.randrange(my_pokemon.get_level()**3, (my_pokemon.get_level()+1)**3)
     my_pokemon.set_xp(xp)
     
     return my_pokemon
@@ -0,0 +1,70 @@
+"""
+On-disk layout of the player saves:
+    PLAYER_INDEX              -> {"players": {"<player>": "<shard file>", ...}}
+    PLAYER_SAVE_DIR/<shard>   -> one player record {"bag": ..., "pokemons": ..., ...}
+The index only holds the names, so listing or checking players never reads team data.
+"""
+
+import hashlib, json, os
+from .util import atomic_write_json
+
+def player_file_stem(player):
+    """
+    File name (without extension) of a player's files, derived from the exact UTF-8 name.
+    Lowercase hex only: "Red" and "red" never share a file on case-insensitive file systems,
+    and no name ends up as a reserved Windows device name (CON, NUL...).
+    """
+    return "player-" + hashlib.sha256(player.encode("utf-8")).hexdigest()[:24]
+
+def shard_file_name(player, index=None):
+    """
+    Shard file of a new player, unique (case-insensitively) among the shards of index.
+    Existing players keep the shard listed in the index, even one named by an older version.
+    """
+    used = {shard.casefold() for shard in index.values()} if index else set()
+    stem = player_file_stem(player)
+    shard, suffix = stem + ".json", 1
+    while shard.casefold() in used:
+        suffix += 1
+        shard = f"{stem}-{suffix}.json"
+    return shard
+
+def read_index(index_path):
+    """Returns the player -> shard file mapping, or None if the index does not exist yet."""
+    if not os.path.exists(index_path):
+        return None
+    with open(index_path, "r", encoding="UTF-8") as file:
+        return json.load(file)["players"]
+
+def write_index(index_path, players):
+    atomic_write_json(index_path, {"players" : players})
+
+def read_shard(save_dir, shard):
+    with open(os.path.join(save_dir, shard), "r", encoding="UTF-8") as file:
+        return json.load(file)
+
+def write_shard(save_dir, shard, player_data):
+    atomic_write_json(os.path.join(save_dir, shard), player_data)
+
+def migrate_monolithic_save(legacy_path, index_path, save_dir):
+    """
+    Splits the old single-file save (every player in one document) into one shard per player
+    and writes the matching index. The legacy file is left untouched.
+    Returns the new index.
+    """
+    os.makedirs(save_dir, exist_ok=True)
+
+    players = {}
+    if os.path.exists(legacy_path):
+        with open(legacy_path, "r", encoding="UTF-8") as file:
+            all_players = json.load(file)
+
+        for player, player_data in all_players.items():
+            shard = shard_file_name(player, players)
+            write_shard(save_dir, shard, player_data)
+            players[player] = shard
+
+    # The index is written last: a crash during the split simply restarts the migration
+    write_index(index_path, players)
+    print(f"✓ Save migrated: {len(players)} player(s) split into {save_dir}")
+    return players
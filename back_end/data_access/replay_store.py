@@ -0,0 +1,64 @@
+"""
+Battle replays, one append-only binary file per player:
+    REPLAY_DIR/<player file stem>.replays -> MAGIC, then for every battle: u32 length + encoded battle (battle_log)
+The file is named like the player's shard (player_file_stem), so players whose names only differ
+by case never share a replay file.
+A battle is appended in a single write once it is over; a file cut in the middle of a record
+(crash) simply ends at the last complete battle.
+"""
+
+import os, struct
+from urllib.parse import quote
+from .player_shards import player_file_stem
+from __settings__ import REPLAY_DIR
+
+MAGIC = b"PKRP"
+LENGTH = struct.Struct("<I")
+
+def replay_file_path(player, replay_dir=REPLAY_DIR):
+    """File-system safe replay file of a player (names may contain any unicode letter)."""
+    return os.path.join(replay_dir, player_file_stem(player) + ".replays")
+
+def __adopt_legacy_replays(player, replay_dir):
+    """
+    Renames a replay file named by an older version (quote(player), case preserving) to the current
+    name. Only an exact, case-sensitive match of the directory listing is adopted: on a case-insensitive
+    file system, "red" must not take over the battles of "Red".
+    """
+    path = replay_file_path(player, replay_dir)
+    legacy_name = quote(player, safe='') + ".replays"
+    if os.path.exists(path) or not os.path.isdir(replay_dir) or legacy_name not in os.listdir(replay_dir):
+        return
+    os.replace(os.path.join(replay_dir, legacy_name), path)
+
+def append_replay(player, data, replay_dir=REPLAY_DIR):
+    """Appends one encoded battle to the player's replay file."""
+    os.makedirs(replay_dir, exist_ok=True)
+    __adopt_legacy_replays(player, replay_dir)
+    path = replay_file_path(player, replay_dir)
+    with open(path, "ab") as file:
+        if file.tell() == 0:
+            file.write(MAGIC)
+        file.write(LENGTH.pack(len(data)) + data)
+
+def load_replays(player, replay_dir=REPLAY_DIR):
+    """Returns the encoded battles of a player, oldest first (empty list without replay file)."""
+    __adopt_legacy_replays(player, replay_dir)
+    path = replay_file_path(player, replay_dir)
+    if not os.path.exists(path):
+        return []
+    with open(path, "rb") as file:
+        content = file.read()
+    if content[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} is not a replay file")
+
+    replays = []
+    offset = len(MAGIC)
+    while offset + LENGTH.size <= len(content):
+        length, = LENGTH.unpack_from(content, offset)
+        offset += LENGTH.size
+        if offset + length > len(content):
+            break
+        replays.append(content[offset:offset + length])
+        offset += length
+    return replays
@@ -0,0 +1,81 @@
+"""
+Append-only journal of save operations.
+Each line is one JSON operation ("add_player", "set_pokemon", "set_bag", "set_discoveries", "set_rng_seed").
+A batch of operations is appended and fsync'd in one go, so a save never rewrites existing data.
+Compaction renames the journal aside (rotation) before folding it into the player shards:
+operations written meanwhile go to a fresh journal, and a crash at any point is recovered by
+replaying the rotated journal, then the current one.
+"""
+
+import json, os
+
+class SaveJournal:
+    def __init__(self, path):
+        self.path = path
+        self.rotated_path = path + ".compacting"
+
+    def append(self, operations):
+        """Appends a batch of operations and forces it to disk."""
+        if not operations:
+            return
+        lines = "".join(json.dumps(operation) + "\n" for operation in operations)
+        with open(self.path, "a", encoding="UTF-8") as file:
+            file.write(lines)
+            file.flush()
+            os.fsync(file.fileno())
+
+    def size(self):
+        """Current size of the journal in bytes."""
+        return os.path.getsize(self.path) if os.path.exists(self.path) else 0
+
+    def replay(self):
+        """Yields every recorded operation, oldest first (rotated journal, then current one)."""
+        for path in (self.rotated_path, self.path):
+            if not os.path.exists(path):
+                continue
+            with open(path, "r", encoding="UTF-8") as file:
+                for line in file:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn last line of a batch interrupted by a crash: the batch was never acknowledged
+                        # (a merged rotated journal goes on after it, see rotate)
+                        continue
+
+    def has_rotated(self):
+        return os.path.exists(self.rotated_path)
+
+    def rotate(self):
+        """
+        Moves the current journal aside so it can be compacted while new operations keep being appended.
+        If a failed compaction left a rotated journal, the current one is appended to it instead of
+        replacing it (a crash in between replays the current operations twice, which ends in the same state).
+        """
+        if not os.path.exists(self.path):
+            return
+        if not self.has_rotated():
+            os.replace(self.path, self.rotated_path)
+            return
+        with open(self.path, "r", encoding="UTF-8") as file:
+            lines = file.read()
+        with open(self.rotated_path, "rb") as file:
+            content = file.read()
+        with open(self.rotated_path, "a", encoding="UTF-8") as file:
+            # Keeps a torn last line apart from the appended operations
+            if content and not content.endswith(b"\n"):
+                lines = "\n" + lines
+            file.write(lines)
+            file.flush()
+            os.fsync(file.fileno())
+        os.remove(self.path)
+
+    def discard_rotated(self):
+        """Drops the rotated journal once its content is safely stored in the snapshot."""
+        if os.path.exists(self.rotated_path):
+            os.remove(self.rotated_path)
+
+    def discard(self):
+        """Drops both journals (after a full compaction done while nothing else could write)."""
+        self.discard_rotated()
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,263 @@
+import atexit, copy, os, threading
+from __settings__ import PLAYER_POKEDEX, PLAYER_INDEX, PLAYER_SAVE_DIR, PLAYER_JOURNAL, SAVE_FLUSH_DELAY,\
+    SAVE_JOURNAL_COMPACT_SIZE
+from .player_shards import shard_file_name, read_index, write_index, read_shard, write_shard,\
+    migrate_monolithic_save
+from .save_journal import SaveJournal
+
+class SaveStore:
+    """
+    Process-wide write-behind cache of the player saves.
+    The snapshot is one shard file per player, listed by a small index. The index is read once,
+    shards are read the first time the player is used, every read is then served from memory.
+    Writes are recorded as operations: after a short debounce delay, on scene change or when the
+    process exits, the pending operations are appended to the save journal (one fsync per batch).
+    Once the journal grows past SAVE_JOURNAL_COMPACT_SIZE, it is folded into the shards in the background.
+    """
+    def __init__(self, index_path=PLAYER_INDEX, save_dir=PLAYER_SAVE_DIR, legacy_path=PLAYER_POKEDEX,
+                 journal_path=PLAYER_JOURNAL, flush_delay=SAVE_FLUSH_DELAY, compact_size=SAVE_JOURNAL_COMPACT_SIZE):
+        self.index_path = index_path
+        self.save_dir = save_dir
+        self.legacy_path = legacy_path
+        self.flush_delay = flush_delay
+        self.compact_size = compact_size
+        self.journal = SaveJournal(journal_path)
+        self.__index = None
+        self.__players = {}
+        self.__pending = []       # Operations not yet in the journal
+        self.__stale = {}         # Players whose shard is older than the journal -> change count
+        self.__timer = None
+        self.__compaction = None
+        self.__lock = threading.RLock()
+
+    # --- Loading ---
+
+    def __load_index(self):
+        """
+        Reads the player index the first time it is needed (migrating the old single-file save if any),
+        then replays the journal over the snapshot.
+        """
+        if self.__index is None:
+            self.__index = read_index(self.index_path)
+            if self.__index is None:
+                self.__index = migrate_monolithic_save(self.legacy_path, self.index_path, self.save_dir)
+
+            for operation in self.journal.replay():
+                self.__apply(operation)
+
+            # Left over by an interrupted compaction: finish it now, before new operations arrive
+            if self.journal.has_rotated():
+                snapshot = self.__take_snapshot()
+                self.__write_snapshot(snapshot)
+                self.__mark_compacted(snapshot)
+                self.journal.discard()
+        return self.__index
+
+    def __load(self, player):
+        """Returns a player's record, reading its shard on first access."""
+        # Index first: replaying the journal may already bring the player's record
+        index = self.__load_index()
+        if player not in self.__players:
+            self.__players[player] = read_shard(self.save_dir, index[player])
+        return self.__players[player]
+
+    # --- Reads (served from memory) ---
+
+    def get_player_names(self):
+        """Returns the registered player names in save order (index only, no team data)."""
+        with self.__lock:
+            return list(self.__load_index().keys())
+
+    def has_player(self, player):
+        with self.__lock:
+            return player in self.__load_index()
+
+    def get_player(self, player):
+        """
+        Returns the raw record of a player ('bag', 'pokemons', ...).
+        The record is owned by the store: callers must go through the setters to modify it.
+        """
+        with self.__lock:
+            return self.__load(player)
+
+    def get_pokemons(self, player):
+        """Returns the player's pokemon records keyed by pet name."""
+        return self.get_player(player)["pokemons"]
+
+    def get_bag(self, player):
+        return self.get_player(player)["bag"]
+
+    def get_discoveries(self, player):
+        return self.get_player(player).get("player_pokedex", [])
+
+    def get_rng_seed(self, player):
+        return self.get_player(player).get("rng_seed")
+
+    # --- Writes (recorded, flushed later) ---
+
+    def add_player(self, player):
+        """Registers an empty profile. Returns False if the name is already taken."""
+        with self.__lock:
+            index = self.__load_index()
+            if player in index:
+                return False
+            self.__record({"op" : "add_player", "player" : player, "shard" : shard_file_name(player, index)})
+            return True
+
+    def set_pokemon(self, player, pet_name, pokemon_data):
+        """Inserts or replaces one pokemon record of a player."""
+        self.__record({"op" : "set_pokemon", "player" : player, "pet_name" : pet_name,
+                       "value" : copy.deepcopy(pokemon_data)})
+
+    def set_bag(self, player, bag_data):
+        """Updates the item counts of a player's bag."""
+        self.__record({"op" : "set_bag", "player" : player, "value" : dict(bag_data)})
+
+    def set_discoveries(self, player, player_pokedex):
+        """Replaces the list of Pokedex entries discovered by a player."""
+        self.__record({"op" : "set_discoveries", "player" : player, "value" : copy.deepcopy(player_pokedex)})
+
+    def set_rng_seed(self, player, seed):
+        """Records the seed of the player's last session (to replay it)."""
+        self.__record({"op" : "set_rng_seed", "player" : player, "value" : seed})
+
+    def __record(self, operation):
+        """Applies an operation in memory, queues it for the journal and (re)arms the debounce timer."""
+        with self.__lock:
+            self.__load_index()
+            self.__apply(operation)
+            self.__pending.append(operation)
+            self.__schedule_flush()
+
+    def __apply(self, operation):
+        """Plays one journal operation on the in-memory state (used for new writes and for replay)."""
+        player = operation["player"]
+        match operation["op"]:
+            case "add_player":
+                self.__index[player] = operation["shard"]
+                self.__players[player] = {
+                    "bag" : {},
+                    "pokemons" : {}
+                }
+            case "set_pokemon":
+                self.__load(player)["pokemons"][operation["pet_name"]] = copy.deepcopy(operation["value"])
+            case "set_bag":
+                self.__load(player)["bag"].update(operation["value"])
+            case "set_discoveries":
+                self.__load(player)["player_pokedex"] = copy.deepcopy(operation["value"])
+            case "set_rng_seed":
+                self.__load(player)["rng_seed"] = operation["value"]
+        self.__stale[player] = self.__stale.get(player, 0) + 1
+
+    def is_dirty(self):
+        with self.__lock:
+            return bool(self.__pending)
+
+    # --- Persistence ---
+
+    def __schedule_flush(self):
+        if self.flush_delay is None:
+            return
+        if self.__timer:
+            self.__timer.cancel()
+        self.__timer = threading.Timer(self.flush_delay, self.flush)
+        self.__timer.daemon = True
+        self.__timer.start()
+
+    def flush(self):
+        """
+        Appends the pending operations to the journal (a single fsync'd batch).
+        Starts a background compaction if the journal got too big.
+        """
+        with self.__lock:
+            if self.__timer:
+                self.__timer.cancel()
+                self.__timer = None
+            if not self.__pending:
+                return False
+
+            os.makedirs(os.path.dirname(self.journal.path) or ".", exist_ok=True)
+            self.journal.append(self.__pending)
+            self.__pending = []
+
+            if self.journal.size() >= self.compact_size:
+                self.compact(background=True)
+            return True
+
+    def compact(self, background=False):
+        """
+        Folds the journal into the shard snapshot.
+        The journal is rotated and the stale players copied under the lock, the (slow) atomic
+        shard writes then happen outside of it so the game keeps saving meanwhile.
+        """
+        with self.__lock:
+            if self.__compaction and self.__compaction.is_alive():
+                return
+            self.__load_index()
+            # Make sure everything the snapshot will contain is already journaled
+            if self.__pending:
+                self.journal.append(self.__pending)
+                self.__pending = []
+            # A failed compaction left its rotated journal: the new one is appended to it, so the
+            # next snapshot (its players are still stale) folds both
+            self.journal.rotate()
+            snapshot = self.__take_snapshot()
+
+        if background:
+            self.__compaction = threading.Thread(target=self.__finish_compaction, args=(snapshot, False))
+            self.__compaction.start()
+        else:
+            self.__finish_compaction(snapshot)
+
+    def __take_snapshot(self):
+        """
+        Copies the index and the records of the stale players (caller holds the lock).
+        The players stay stale until the snapshot is written (see __mark_compacted).
+        """
+        players = {player : copy.deepcopy(self.__players[player]) for player in self.__stale}
+        return dict(self.__index), players, dict(self.__stale)
+
+    def __mark_compacted(self, snapshot):
+        """Clears the stale players of a written snapshot, unless they changed since it was taken."""
+        with self.__lock:
+            for player, changes in snapshot[2].items():
+                if self.__stale.get(player) == changes:
+                    del self.__stale[player]
+
+    def __finish_compaction(self, snapshot, raise_errors=True):
+        try:
+            self.__write_snapshot(snapshot)
+        except OSError as error:
+            # The rotated journal and the stale players stay: the next compaction retries
+            if raise_errors:
+                raise
+            print(f"⚠ Save compaction failed, retried on the next one: {error}")
+            return
+        self.__mark_compacted(snapshot)
+        self.journal.discard_rotated()
+
+    def __write_snapshot(self, snapshot):
+        index, players, changes = snapshot
+        os.makedirs(self.save_dir, exist_ok=True)
+        for player, player_data in players.items():
+            write_shard(self.save_dir, index[player], player_data)
+        # New players only become visible once their shard exists
+        write_index(self.index_path, index)
+
+    def close(self):
+        """Flushes pending operations and waits for a running compaction."""
+        self.flush()
+        if self.__compaction:
+            self.__compaction.join()
+
+
+_save_store = None
+
+def get_save_store():
+    """Returns the process-wide SaveStore, creating it on first use."""
+    global _save_store
+    if _save_store is None:
+        _save_store = SaveStore()
+        # Never lose pending writes when the game closes
+        atexit.register(_save_store.close)
+    return _save_store
@@ -0,0 +1,249 @@
+"""
+SQLite save backend.
+Exposes the same functions as the JSON services (player / pokemon / bag) so the controller
+can use either one. Every write is a small transaction touching only the affected rows.
+"""
+
+import json, os, sqlite3
+from __settings__ import SQLITE_SAVE_PATH
+from .util import instanciate_pokemon, instanciate_bag
+from .save_store import get_save_store
+from ..models.bag import Bag
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    name TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    rng_seed INTEGER
+);
+CREATE TABLE IF NOT EXISTS bags (
+    player TEXT PRIMARY KEY REFERENCES players(name),
+    potions INTEGER NOT NULL,
+    pokeball INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pokemons (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    player TEXT NOT NULL REFERENCES players(name),
+    pet_name TEXT NOT NULL,
+    name TEXT NOT NULL,
+    original_name TEXT NOT NULL,
+    hp_max INTEGER NOT NULL,
+    hp INTEGER NOT NULL,
+    xp INTEGER NOT NULL,
+    strength INTEGER NOT NULL,
+    defense INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    speed INTEGER NOT NULL,
+    stage INTEGER NOT NULL,
+    ev_hp INTEGER NOT NULL,
+    ev_strength INTEGER NOT NULL,
+    ev_defense INTEGER NOT NULL,
+    ev_speed INTEGER NOT NULL,
+    ev_xp INTEGER NOT NULL,
+    state TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS pokemons_player_pet_name ON pokemons(player, pet_name);
+CREATE INDEX IF NOT EXISTS pokemons_player_order ON pokemons(player, id);
+CREATE TABLE IF NOT EXISTS discoveries (
+    player TEXT NOT NULL REFERENCES players(name),
+    pokemon_id INTEGER NOT NULL,
+    found INTEGER NOT NULL,
+    entry TEXT,
+    PRIMARY KEY (player, pokemon_id)
+);
+"""
+
+POKEMON_COLUMNS = ("pet_name", "name", "original_name", "hp_max", "hp", "xp", "strength", "defense", "type",
+                   "level", "speed", "stage", "ev_hp", "ev_strength", "ev_defense", "ev_speed", "ev_xp", "state")
+
+UPSERT_POKEMON = f"""
+INSERT INTO pokemons (player, {", ".join(POKEMON_COLUMNS)})
+VALUES (?, {", ".join("?" for column in POKEMON_COLUMNS)})
+ON CONFLICT (player, pet_name) DO UPDATE SET
+{", ".join(f"{column} = excluded.{column}" for column in POKEMON_COLUMNS if column != "pet_name")}
+"""
+
+SELECT_POKEMON = f"SELECT {', '.join(POKEMON_COLUMNS)} FROM pokemons"
+
+_connection = None
+
+def get_connection(path=SQLITE_SAVE_PATH):
+    """
+    Returns the shared connection, creating the schema on first use.
+    A brand new database is filled with the existing JSON saves so switching backend keeps every player.
+    """
+    global _connection
+    if _connection is None:
+        is_new = not os.path.exists(path)
+        _connection = sqlite3.connect(path)
+        _connection.executescript(SCHEMA)
+        # Databases created before the seed column
+        columns = [row[1] for row in _connection.execute("PRAGMA table_info(players)")]
+        if "rng_seed" not in columns:
+            _connection.execute("ALTER TABLE players ADD COLUMN rng_seed INTEGER")
+        # Databases created before the full discovery entries (only id and found are known for those)
+        columns = [row[1] for row in _connection.execute("PRAGMA table_info(discoveries)")]
+        if "entry" not in columns:
+            _connection.execute("ALTER TABLE discoveries ADD COLUMN entry TEXT")
+        if is_new:
+            import_json_saves(_connection)
+    return _connection
+
+def import_json_saves(connection):
+    """Copies every player of the JSON save store into the database."""
+    store = get_save_store()
+    with connection:
+        for player in store.get_player_names():
+            __insert_player(connection, player)
+            bag = store.get_bag(player)
+            __write_bag(connection, player, bag.get("potions", 0), bag.get("pokeball", 0))
+            for pokemon in store.get_pokemons(player).values():
+                connection.execute(UPSERT_POKEMON, __pokemon_row(player, pokemon))
+            __write_discoveries(connection, player, store.get_discoveries(player))
+            connection.execute("UPDATE players SET rng_seed = ? WHERE name = ?", (store.get_rng_seed(player), player))
+
+# --- Row conversions ---
+
+def __pokemon_row(player, pokemon):
+    """Flattens a pokemon_dict() into the pokemons table columns."""
+    return (
+        player,
+        pokemon["pet_name"],
+        pokemon["name"],
+        pokemon["original_name"],
+        pokemon["hp_max"],
+        pokemon["hp"],
+        pokemon["xp"],
+        pokemon["strength"],
+        pokemon["defense"],
+        json.dumps(pokemon["type"]),
+        pokemon["level"],
+        pokemon["speed"],
+        pokemon["stage"],
+        pokemon["ev"]["hp"],
+        pokemon["ev"]["strength"],
+        pokemon["ev"]["defense"],
+        pokemon["ev"]["speed"],
+        pokemon["ev"]["xp"],
+        pokemon["state"]
+    )
+
+def __pokemon_from_row(row):
+    """Rebuilds the pokemon_dict() layout from a pokemons row and hydrates it."""
+    pokemon = dict(zip(POKEMON_COLUMNS, row))
+    pokemon["type"] = json.loads(pokemon["type"])
+    pokemon["ev"] = {
+        "hp" : pokemon.pop("ev_hp"),
+        "strength" : pokemon.pop("ev_strength"),
+        "defense" : pokemon.pop("ev_defense"),
+        "speed" : pokemon.pop("ev_speed"),
+        "xp" : pokemon.pop("ev_xp")
+    }
+    return instanciate_pokemon(pokemon)
+
+def __insert_player(connection, player):
+    connection.execute(
+        "INSERT INTO players (name, position) VALUES (?, (SELECT COUNT(*) FROM players))", (player,))
+
+def __write_bag(connection, player, potions, pokeball):
+    connection.execute(
+        "INSERT INTO bags (player, potions, pokeball) VALUES (?, ?, ?) "
+        "ON CONFLICT (player) DO UPDATE SET potions = excluded.potions, pokeball = excluded.pokeball",
+        (player, potions, pokeball))
+
+def __write_discoveries(connection, player, player_pokedex):
+    connection.execute("DELETE FROM discoveries WHERE player = ?", (player,))
+    connection.executemany(
+        "INSERT INTO discoveries (player, pokemon_id, found, entry) VALUES (?, ?, ?, ?)",
+        [(player, entry["id"], int(entry.get("stats", {}).get("found", False)), json.dumps(entry))
+         for entry in player_pokedex])
+
+# --- Players ---
+
+def get_player_names():
+    """Retrieves all registered player names in creation order."""
+    rows = get_connection().execute("SELECT name FROM players ORDER BY position")
+    return [row[0] for row in rows]
+
+def does_player_exist(player):
+    row = get_connection().execute("SELECT 1 FROM players WHERE name = ?", (player,)).fetchone()
+    return row is not None
+
+def get_rng_seed(player):
+    row = get_connection().execute("SELECT rng_seed FROM players WHERE name = ?", (player,)).fetchone()
+    return row[0] if row else None
+
+def save_rng_seed(player, seed):
+    with get_connection() as connection:
+        connection.execute("UPDATE players SET rng_seed = ? WHERE name = ?", (seed, player))
+
+def create_player(player, pokemon):
+    """Registers a new player with a default bag and their starter, in a single transaction."""
+    connection = get_connection()
+    if does_player_exist(player):
+        return # Abort if player exists
+
+    player_bag = Bag()
+    pokemon.set_state('domesticated')
+    with connection:
+        __insert_player(connection, player)
+        __write_bag(connection, player, player_bag.get_potion(), player_bag.get_pokeball())
+        connection.execute(UPSERT_POKEMON, __pokemon_row(player, pokemon.pokemon_dict()))
+
+# --- Pokemons ---
+
+def save_pokemon_to_pokedex(player, pokemon):
+    """Inserts or updates a single pokemon row (keyed by player and pet name)."""
+    pokemon.set_state('domesticated')
+    with get_connection() as connection:
+        connection.execute(UPSERT_POKEMON, __pokemon_row(player, pokemon.pokemon_dict()))
+
+def get_pokemon_from_pokedex(player_name, pokemon_pet_name):
+    """Indexed lookup of one pokemon by pet name."""
+    row = get_connection().execute(
+        SELECT_POKEMON + " WHERE player = ? AND pet_name = ?", (player_name, pokemon_pet_name)).fetchone()
+    if row:
+        return __pokemon_from_row(row)
+
+def get_all_pokemons_from_pokedex(player_name):
+    rows = get_connection().execute(SELECT_POKEMON + " WHERE player = ? ORDER BY id", (player_name,))
+    return [__pokemon_from_row(row) for row in rows]
+
+def get_first_pokemon(player_name):
+    """Indexed lookup of the oldest pokemon of the player (the lead pokemon)."""
+    row = get_connection().execute(
+        SELECT_POKEMON + " WHERE player = ? ORDER BY id LIMIT 1", (player_name,)).fetchone()
+    return __pokemon_from_row(row)
+
+def get_player_pokemons(player):
+    """Returns the pet names owned by the player."""
+    rows = get_connection().execute("SELECT pet_name FROM pokemons WHERE player = ? ORDER BY id", (player,))
+    return [row[0] for row in rows]
+
+# --- Bag ---
+
+def save_bag_to_pokedex(player, bag):
+    with get_connection() as connection:
+        __write_bag(connection, player, bag.get_potion(), bag.get_pokeball())
+
+def get_bag_from_pokedex(player):
+    row = get_connection().execute("SELECT potions, pokeball FROM bags WHERE player = ?", (player,)).fetchone()
+    return instanciate_bag({"potions" : row[0], "pokeball" : row[1]})
+
+# --- Discovered Pokedex ---
+
+def save_discoveries(player, player_pokedex):
+    with get_connection() as connection:
+        __write_discoveries(connection, player, player_pokedex)
+
+def get_discoveries(player):
+    """Returns the Pokedex entries discovered by the player, in the order they were saved."""
+    rows = get_connection().execute(
+        "SELECT pokemon_id, found, entry FROM discoveries WHERE player = ? ORDER BY rowid", (player,))
+    return [json.loads(row[2]) if row[2] is not None else {"id" : row[0], "stats" : {"found" : bool(row[1])}}
+            for row in rows]
+
+def flush_saves():
+    """Every write is already committed: nothing is pending."""
+    pass
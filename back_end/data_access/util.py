@@ -1,3 +1,4 @@
+import json, os
 from back_end.models.pokemon import Pokemon
 from ..models.bag import Bag
 
@@ -45,4 +46,16 @@ def instanciate_bag(player):
     player_bag.set_potion(player["potions"])
     player_bag.set_pokeball(player["pokeball"])
 
-    return player_bag
\ No newline at end of file
+    return player_bag
+
+def atomic_write_json(path, data):
+    """
+    Writes a JSON file through a temporary file renamed over the target:
+    readers (and a crash) only ever see the old or the new complete file.
+    """
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="UTF-8") as file:
+        json.dump(data, file, indent=4)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
@@ -1,80 +1,148 @@
-import json, os, random, time
-from __settings__ import WORLD_POKEMON_PATH, NAME_LIST_PATH
-from ..generate_pokemon.create_pokemon import create_low_level_world_pokemons
-from .util import instanciate_pokemon
+import atexit, json, os, threading
+from __settings__ import WORLD_POKEMON_PATH, WILD_POOL_REFILL_THRESHOLD, WILD_POOL_SAVE_INTERVAL
+from ..generate_pokemon.batch_generator import get_wild_batch_generator
+from .util import instanciate_pokemon, atomic_write_json
+from ..models.rng import get_rng
 
-def generate_pokemons_dict():
+def generate_pokemons_dict(rng=None):
     """
-    Populates a list of Pokemon dictionaries by generating new low-level Pokemon.
-    Assigns unique 'Jean-X' pet names based on a name list and a timestamp for uniqueness.
+    Generates a fresh set of low-level wild Pokemon (one per base species, in random order)
+    as dictionaries ready for JSON storage.
+    The whole batch is drawn at once by the batch generator; each Pokemon gets a unique
+    'Jean-X' pet name built from the name list, a timestamp and its index.
     """
-    with open(NAME_LIST_PATH, 'r', encoding="UTF-8") as file:
-        name_list = json.load(file)
+    return get_wild_batch_generator().generate_dicts(rng=rng)
 
-    # Generate a fresh set of starting Pokemon
-    all_pokemons = create_low_level_world_pokemons()
-    pokemons_dict_list = []
-    
-    for index, each_pokemon in enumerate(all_pokemons):
-        # Reset name index if we have more Pokemon than names in the list
-        if index >= len(name_list):
-            index = index % len(name_list)
-
-        # Give the Pokemon a unique pet name (e.g., Jean-Luc 1708392.42)
-        each_pokemon.set_pet_name("Jean-" + name_list[index] + " " + str(time.time()))
-        
-        # Convert the object to a dictionary for JSON storage
-        a_pokemon = each_pokemon.pokemon_dict()
-        pokemons_dict_list.append(a_pokemon)
-    
-    return pokemons_dict_list
+class WildPool:
+    """
+    Resident pool of wild Pokemon waiting to be encountered.
+    The world file is read once. Drawing swaps the chosen Pokemon with the last one and pops it (O(1)),
+    and a new batch is generated on a background thread as soon as the pool runs low.
+    The file is only rewritten every WILD_POOL_SAVE_INTERVAL seconds when the pool changed, and at exit.
+    """
+    def __init__(self, path=WORLD_POKEMON_PATH, refill_threshold=WILD_POOL_REFILL_THRESHOLD,
+                 save_interval=WILD_POOL_SAVE_INTERVAL):
+        self.path = path
+        self.refill_threshold = refill_threshold
+        self.save_interval = save_interval
+        self.__pokemons = None
+        self.__refill = None
+        self.__save_timer = None
+        self.__dirty = False
+        self.__lock = threading.RLock()
+
+    def __load(self):
+        if self.__pokemons is None:
+            if os.path.exists(self.path):
+                with open(self.path, "r") as file:
+                    self.__pokemons = json.load(file)
+            else:
+                self.__pokemons = []
+        return self.__pokemons
+
+    def __len__(self):
+        with self.__lock:
+            return len(self.__load())
+
+    # --- Encounters ---
+
+    def draw(self):
+        """Removes a random Pokemon from the pool and returns its data."""
+        with self.__lock:
+            pokemons = self.__load()
+            if not pokemons:
+                # Nothing left to draw: the encounter has to wait for the refill
+                self.__refill_now()
+
+            # Swap-remove: move the last Pokemon into the chosen slot
+            index = get_rng().randrange(len(pokemons))
+            a_pokemon_data = pokemons[index]
+            pokemons[index] = pokemons[-1]
+            pokemons.pop()
+            self.__changed()
+
+            if len(pokemons) <= self.refill_threshold:
+                self.__start_refill()
+            return a_pokemon_data
+
+    def add(self, pokemon_data):
+        """Puts a Pokemon (back) into the pool."""
+        with self.__lock:
+            self.__load().append(pokemon_data)
+            self.__changed()
 
-def save_world_pokemons(pokemons_dict_list):
-    """Overwrites the world Pokemon storage file with a new list of Pokemon data."""
-    if not os.path.exists(WORLD_POKEMON_PATH):
-        with open(WORLD_POKEMON_PATH, "w", encoding="UTF-8") as file:
-            json.dump({}, file)
-            
-    with open(WORLD_POKEMON_PATH, "w", encoding="UTF-8") as file:
-        json.dump(pokemons_dict_list, file, indent=4)
+    # --- World Replenishment ---
+
+    def __start_refill(self):
+        if self.__refill and self.__refill.is_alive():
+            return
+        # The batch gets its own stream, drawn now: the thread timing never changes the session draws
+        self.__refill = threading.Thread(target=self.__generate, args=(get_rng().spawn(),), daemon=True)
+        self.__refill.start()
+
+    def __refill_now(self):
+        # Called with the lock held: the background batch can only land once we wait for it outside of it
+        if self.__refill and self.__refill.is_alive():
+            self.__lock.release()
+            try:
+                self.__refill.join()
+            finally:
+                self.__lock.acquire()
+        if not self.__pokemons:
+            self.__generate(get_rng().spawn())
+
+    def __generate(self, rng):
+        """Generates a fresh batch (slow, done without holding the lock) and adds it to the pool."""
+        other_pokemons = generate_pokemons_dict(rng)
+        with self.__lock:
+            self.__load().extend(other_pokemons)
+            self.__changed()
+
+    # --- Lazy Persistence ---
+
+    def __changed(self):
+        self.__dirty = True
+        if self.save_interval is not None and self.__save_timer is None:
+            self.__save_timer = threading.Timer(self.save_interval, self.save)
+            self.__save_timer.daemon = True
+            self.__save_timer.start()
+
+    def save(self):
+        """Writes the pool to the world file if it changed since the last save."""
+        with self.__lock:
+            if self.__save_timer:
+                self.__save_timer.cancel()
+                self.__save_timer = None
+            if not self.__dirty:
+                return False
+            atomic_write_json(self.path, self.__pokemons)
+            self.__dirty = False
+            return True
+
+
+_wild_pool = None
+
+def get_wild_pool():
+    """Returns the process-wide WildPool, creating it on first use."""
+    global _wild_pool
+    if _wild_pool is None:
+        _wild_pool = WildPool()
+        atexit.register(_wild_pool.save)
+    return _wild_pool
 
 def save_wild_pokemon(my_pokemon):
-    """Appends a single Pokemon back into the world file and ensures its state is 'wild'."""
-    with open(WORLD_POKEMON_PATH, "r") as file:
-        pokemons_dict_list = json.load(file)
-    
+    """Puts a single Pokemon back into the wild pool and ensures its state is 'wild'."""
     my_pokemon.set_state('wild')
-    pokemons_dict_list.append(my_pokemon.pokemon_dict())
-
-    with open(WORLD_POKEMON_PATH, "w", encoding="UTF-8") as file:
-        json.dump(pokemons_dict_list, file, indent=4)
+    get_wild_pool().add(my_pokemon.pokemon_dict())
 
 def get_random_wild_pokemon():
     """
     Retrieves a random Pokemon from the wild pool for an encounter.
-    If the pool is empty or nearly depleted, it triggers a generation of new Pokemon.
+    When the pool is nearly depleted, a new generation of Pokemon is started in the background.
     """
-    # Initialize file if it doesn't exist
-    if not os.path.exists(WORLD_POKEMON_PATH):
-        with open(WORLD_POKEMON_PATH, "w", encoding="UTF-8") as file:
-            json.dump([], file)
-
-    with open(WORLD_POKEMON_PATH, "r") as file:
-        pokemons = json.load(file)
-
-    # World Replenishment Logic: If 4 or fewer remain, generate a new batch
-    if not pokemons or len(pokemons) <= 4:
-        other_pokemons = generate_pokemons_dict()
-        pokemons = pokemons + other_pokemons
-        
-    # Select one Pokemon for the encounter and remove it from the 'wild' file
-    a_pokemon_data = random.choice(pokemons)
-    pokemons.pop(pokemons.index(a_pokemon_data))
-
-    # Save the updated list (minus the selected Pokemon)
-    save_world_pokemons(pokemons)
+    a_pokemon_data = get_wild_pool().draw()
     
     # Transform dictionary data back into a Pokemon object instance
     my_pokemon = instanciate_pokemon(a_pokemon_data)
 
-    return my_pokemon
\ No newline at end of file
+    return my_pokemon
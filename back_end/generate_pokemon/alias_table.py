@@ -0,0 +1,47 @@
+"""
+Walker alias tables: weighted random draws in O(1).
+The table is built once from (outcome, weight) pairs (Vose's construction). A draw then costs one
+random number, one index and one comparison, without building any list.
+"""
+
+from ..models.rng import get_rng
+
+class AliasTable:
+    def __init__(self, outcomes, weights):
+        self.outcomes = tuple(outcomes)
+        size = len(self.outcomes)
+        total = sum(weights)
+        if size == 0 or total <= 0:
+            raise ValueError("An alias table needs at least one outcome with a positive weight")
+
+        # Each slot keeps its own outcome with probability __probability[slot], otherwise its alias
+        self.__probability = [0.0] * size
+        self.__alias = list(range(size))
+        scaled = [weight * size / total for weight in weights]
+        small = [index for index, value in enumerate(scaled) if value < 1.0]
+        large = [index for index, value in enumerate(scaled) if value >= 1.0]
+
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self.__probability[less] = scaled[less]
+            self.__alias[less] = more
+            scaled[more] = (scaled[more] + scaled[less]) - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+        # What is left is full (up to rounding errors)
+        for index in large + small:
+            self.__probability[index] = 1.0
+
+    def __len__(self):
+        return len(self.outcomes)
+
+    def draw(self, rng=None):
+        """Returns one outcome, following the weights given at construction."""
+        value = (rng or get_rng()).random() * len(self.outcomes)
+        slot = int(value)
+        if value - slot < self.__probability[slot]:
+            return self.outcomes[slot]
+        return self.outcomes[self.__alias[slot]]
@@ -0,0 +1,130 @@
+import time
+from ..data_access.game_data import get_game_data
+from ..models.type_chart import get_type_chart
+from ..models.pokemon_table import PokemonTable, COLUMNS, new_column, resolve_rng, np
+
+# stage -> [low, high) level range, as in level_from_stage
+LEVEL_RANGES = {1 : (1, 10), 2 : (12, 20), 3 : (25, 36), 4 : (40, 50)}
+
+class WildBatchGenerator:
+    """
+    Generates many wild low-level Pokemon at once, straight into a PokemonTable.
+    Same rules as create_low_level_world_pokemons (base species, level from the stage, random stats
+    on top of 3 points per level, XP within the level), but every stat is drawn for the whole batch
+    in one go. Restricting the candidate species gives zone-specific pools.
+    """
+    def __init__(self, species=None):
+        game_data = get_game_data()
+        type_chart = get_type_chart()
+        if species is None:
+            species = [name for name, evolution_stage in game_data.evolution_stages.items()
+                       if evolution_stage[name] == 1]
+        self.species = tuple(species)
+
+        species_ids, first_types, second_types, stages = [], [], [], []
+        for name in self.species:
+            first_type, second_type, stage, evolution_line = game_data.get_base_species(name)
+            species_ids.append(game_data.get_species_id(name))
+            first_types.append(type_chart.get_type_id(first_type))
+            second_types.append(type_chart.no_type if second_type == "alone" else type_chart.get_type_id(second_type))
+            stages.append(stage)
+        self.__species_ids = new_column(species_ids)
+        self.__first_types = new_column(first_types)
+        self.__second_types = new_column(second_types)
+        self.__stages = new_column(stages)
+        # Level bounds indexed by stage
+        self.__level_low = new_column(LEVEL_RANGES.get(stage, (1, 10))[0] for stage in range(5))
+        self.__level_high = new_column(LEVEL_RANGES.get(stage, (1, 10))[1] for stage in range(5))
+
+    def generate(self, count=None, rng=None):
+        """
+        Returns a PokemonTable of wild Pokemon.
+        count=None gives one Pokemon per candidate species in random order (the world replenishment),
+        otherwise count Pokemon of uniformly drawn species.
+        rng is an RngService or a NumPy Generator (the session RNG by default).
+        """
+        rng = resolve_rng(rng)
+        if np is not None:
+            columns = self.__generate_columns(count, rng)
+        else:
+            columns = self.__generate_rows(count, rng)
+
+        size = len(columns["species"])
+        name_list = get_game_data().pet_names
+        stamp = str(time.time())
+        pet_names = [f"Jean-{name_list[index % len(name_list)]} {stamp}-{index}" for index in range(size)]
+        return PokemonTable(columns, pet_names)
+
+    def generate_dicts(self, count=None, rng=None):
+        """Same as generate, as pokemon_dict() records ready to be serialized."""
+        return self.generate(count, rng).to_dicts()
+
+    def __generate_columns(self, count, rng):
+        if count is None:
+            picks = rng.permutation(len(self.species))
+        else:
+            picks = rng.integers(0, len(self.species), count)
+        size = len(picks)
+        stage = self.__stages[picks]
+        level = rng.integers(self.__level_low[stage], self.__level_high[stage])
+        species = self.__species_ids[picks]
+        zeros = np.zeros(size, dtype=np.int64)
+        hp = rng.integers(10, 31, size) + level*3
+
+        columns = dict.fromkeys(COLUMNS, zeros)
+        columns.update({
+            "hp" : hp,
+            "hp_max" : hp.copy(),
+            "strength" : rng.integers(2, 31, size) + level*3,
+            "speed" : rng.integers(2, 31, size) + level*3,
+            "defense" : rng.integers(2, 21, size) + level*3,
+            "xp" : rng.integers(level**3, (level+1)**3),
+            "level" : level,
+            "stage" : stage,
+            "species" : species,
+            "original" : species.copy(),
+            "first_type" : self.__first_types[picks],
+            "second_type" : self.__second_types[picks]
+        })
+        # Every column owns its buffer (the bulk operations update them in place)
+        return {name : column.copy() if column is zeros else column for name, column in columns.items()}
+
+    def __generate_rows(self, count, rng):
+        if count is None:
+            picks = list(range(len(self.species)))
+            rng.shuffle(picks)
+        else:
+            picks = [rng.randrange(len(self.species)) for index in range(count)]
+
+        columns = {name : new_column() for name in COLUMNS}
+        for pick in picks:
+            stage = self.__stages[pick]
+            level = rng.randrange(self.__level_low[stage], self.__level_high[stage])
+            hp = rng.randrange(10, 31) + level*3
+            row = {
+                "hp" : hp,
+                "hp_max" : hp,
+                "strength" : rng.randrange(2, 31) + level*3,
+                "speed" : rng.randrange(2, 31) + level*3,
+                "defense" : rng.randrange(2, 21) + level*3,
+                "xp" : rng.randrange(level**3, (level+1)**3),
+                "level" : level,
+                "stage" : stage,
+                "species" : self.__species_ids[pick],
+                "original" : self.__species_ids[pick],
+                "first_type" : self.__first_types[pick],
+                "second_type" : self.__second_types[pick]
+            }
+            for name in COLUMNS:
+                columns[name].append(row.get(name, 0))
+        return columns
+
+
+_wild_batch_generator = None
+
+def get_wild_batch_generator():
+    """Returns the process-wide generator over every base species."""
+    global _wild_batch_generator
+    if _wild_batch_generator is None:
+        _wild_batch_generator = WildBatchGenerator()
+    return _wild_batch_generator
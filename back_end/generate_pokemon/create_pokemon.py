@@ -1,86 +1,65 @@
-import random, json
-from __settings__ import TYPES_PATH, EVOLUTION_STAGE_PATH
 from back_end.models.pokemon import Pokemon
+from back_end.models.rng import get_rng
+from ..data_access.game_data import get_game_data
+from .generation_tables import get_generation_tables
 
 def get_first_type_dict(first_type):
-     with open(TYPES_PATH, 'r') as file:
-        second_type_dict = json.load(file)[first_type]
-        return second_type_dict
+     return get_game_data().get_first_type_dict(first_type)
      
-def __get_pokemon_from_type(type_list):
-    type_name_dictionary = get_first_type_dict(type_list[0])
+def __get_pokemon_from_type(type_list, rng=None):
+    second_type = type_list[1] if len(type_list) == 2 else "alone"
+    return get_generation_tables().draw_species(type_list[0], second_type, rng)
 
-    if len(type_list) == 2:
-        get_name_list = type_name_dictionary[type_list[1]]["names"]     
-    else:
-        get_name_list = type_name_dictionary["alone"]["names"]
-    
-    choice_list = list(get_name_list.keys())
-    first_stage_name = random.choice(choice_list)
-    name = random.choice(list(get_name_list[first_stage_name].keys()))
-    stage = get_name_list[first_stage_name][name]
-    
-    return name, first_stage_name, stage
-
-def level_from_stage(stage):
+def level_from_stage(stage, rng=None):
+    rng = rng or get_rng()
     if stage == 4:
-        level = random.randrange(40, 50)
+        level = rng.randrange(40, 50)
     elif stage == 3:
-        level = random.randrange(25, 36)
+        level = rng.randrange(25, 36)
     elif stage == 2:
-        level = random.randrange(12, 20)
+        level = rng.randrange(12, 20)
     else:
-        level = random.randrange(1, 10) 
+        level = rng.randrange(1, 10) 
     return level
 
-def create_pokemon(first_type):
+def create_pokemon(first_type, rng=None):
+    rng = rng or get_rng()
     final_type_list = [first_type]
 
-    get_second_type_dict = get_first_type_dict(first_type)
-    
-    second_type_list = []
-
-    for type in get_second_type_dict:
-        value = get_second_type_dict[type]["probability"]
-        for index in range(value):
-            second_type_list.append(type)
-    
-    second_type_random = random.choice(second_type_list)
+    second_type_random = get_generation_tables().draw_second_type(first_type, rng)
     if second_type_random != "alone":
         final_type_list.append(second_type_random)
 
-    name, first_stage_name, stage = __get_pokemon_from_type(final_type_list)
-    level = level_from_stage(stage)
+    name, first_stage_name, stage = __get_pokemon_from_type(final_type_list, rng)
+    level = level_from_stage(stage, rng)
 
-    hp = random.randrange(10, 31) + level*3
-    strength = random.randrange(2,31) + level*3
-    speed = random.randrange(2,31) + level*3
-    defense_point = random.randrange(2,15) + level*3
+    hp = rng.randrange(10, 31) + level*3
+    strength = rng.randrange(2,31) + level*3
+    speed = rng.randrange(2,31) + level*3
+    defense_point = rng.randrange(2,15) + level*3
 
     my_pokemon = Pokemon(name, first_stage_name, hp, hp, strength, defense_point, final_type_list, level, speed, stage)
     
-    xp = random.randrange(my_pokemon.get_level()**3, (my_pokemon.get_level()+1)**3)
+    xp = rng.randrange(my_pokemon.get_level()**3, (my_pokemon.get_level()+1)**3)
     my_pokemon.set_xp(xp)
 
     return my_pokemon
 
-def create_world_pokemons():
+def create_world_pokemons(rng=None):
 
-    with open(TYPES_PATH, 'r') as file:
-        types = json.load(file)
-        type_list = list(types.keys())
+    type_list = get_game_data().type_names
 
     all_pokemons = []
     for type in type_list:
-        a_pokemon = create_pokemon(type)
+        a_pokemon = create_pokemon(type, rng)
         all_pokemons.append(a_pokemon)
     
     return all_pokemons
 
-def create_low_level_world_pokemons():
-    with open(EVOLUTION_STAGE_PATH, 'r') as file:
-        pokemons_original_name = json.load(file)
-        pokemons_original_name_list = list(pokemons_original_name.keys()) 
+def create_low_level_world_pokemons(rng=None):
+    rng = rng or get_rng()
+    pokemons_original_name = get_game_data().evolution_stages
+    pokemons_original_name_list = list(pokemons_original_name.keys()) 
 
     all_pokemons = []
     for name in pokemons_original_name_list:
@@ -92,37 +71,38 @@ def create_low_level_world_pokemons():
             if second_type != "alone":
                 type_list.append(second_type)
 
-            level = level_from_stage(stage)
+            level = level_from_stage(stage, rng)
 
-            hp = random.randrange(10, 31) + level*3
-            strength = random.randrange(2,31) + level*3
-            speed = random.randrange(2,31) + level*3
-            defense_point = random.randrange(2,21) + level*3
+            hp = rng.randrange(10, 31) + level*3
+            strength = rng.randrange(2,31) + level*3
+            speed = rng.randrange(2,31) + level*3
+            defense_point = rng.randrange(2,21) + level*3
 
             my_pokemon = Pokemon(name, name, hp, hp, strength, defense_point, type_list, level, speed, stage)
             
-            xp = random.randrange(my_pokemon.get_level()**3, (my_pokemon.get_level()+1)**3)
+            xp = rng.randrange(my_pokemon.get_level()**3, (my_pokemon.get_level()+1)**3)
             my_pokemon.set_xp(xp)
             all_pokemons.append(my_pokemon)
-    random.shuffle(all_pokemons)
+    rng.shuffle(all_pokemons)
     return all_pokemons
 
-def get_type_low_level_pokemon(original_name):
-    with open(TYPES_PATH, 'r') as file:
-        types = json.load(file)
-        type_list = list(types.keys())
-
-    for first_type in type_list:
-        second_type_list = list(types[first_type].keys())
+def create_species_pokemon(name, level, rng=None):
+    """A Pokemon of the base species name at that level, with the stats of a low level wild Pokemon."""
+    rng = rng or get_rng()
+    first_type, second_type, stage = get_type_low_level_pokemon(name)
+    type_list = [first_type] if second_type == "alone" else [first_type, second_type]
 
-        for second_type in second_type_list:
-            names_list = list(types[first_type][second_type]["names"].keys())
+    hp = rng.randrange(10, 31) + level*3
+    strength = rng.randrange(2,31) + level*3
+    speed = rng.randrange(2,31) + level*3
+    defense_point = rng.randrange(2,21) + level*3
 
-            for name in names_list:
-                final_name_list = list(types[first_type][second_type]["names"][name].keys())
-                final_name_dict = types[first_type][second_type]["names"][name]
-                if 1 in list(final_name_dict.values()):
-                    final_name = final_name_list[list(final_name_dict.values()).index(1)]
+    my_pokemon = Pokemon(name, name, hp, hp, strength, defense_point, type_list, level, speed, stage)
+    my_pokemon.set_xp(rng.randrange(level**3, (level+1)**3))
+    return my_pokemon
 
-                    if final_name == original_name:
-                        return first_type, second_type, 1
\ No newline at end of file
+def get_type_low_level_pokemon(original_name):
+    base_species = get_game_data().get_base_species(original_name)
+    if base_species:
+        first_type, second_type, stage, evolution_line = base_species
+        return first_type, second_type, stage
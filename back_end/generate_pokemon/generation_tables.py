@@ -0,0 +1,43 @@
+from .alias_table import AliasTable
+from ..data_access.game_data import get_game_data
+
+class GenerationTables:
+    """
+    Alias tables built once from types_probability.json.
+        second types  -> first type -> second type (or "alone"), weighted by its "probability"
+        species       -> (first type, second type or "alone") -> (name, first stage name, stage)
+    A species is drawn exactly like before: an evolution line uniformly, then a name of that line uniformly.
+    """
+    def __init__(self, types):
+        self.__second_types = {}
+        self.__species = {}
+        for first_type, sub_types in types.items():
+            self.__second_types[first_type] = AliasTable(
+                sub_types.keys(), [sub_type_dict["probability"] for sub_type_dict in sub_types.values()])
+
+            for sub_type, sub_type_dict in sub_types.items():
+                species, weights = [], []
+                lines = sub_type_dict["names"]
+                for first_stage_name, names in lines.items():
+                    for name, stage in names.items():
+                        species.append((name, first_stage_name, stage))
+                        weights.append(1 / (len(lines) * len(names)))
+                self.__species[(first_type, sub_type)] = AliasTable(species, weights)
+
+    def draw_second_type(self, first_type, rng=None):
+        """Returns a second type for a Pokemon of first_type ("alone" for a single type Pokemon)."""
+        return self.__second_types[first_type].draw(rng)
+
+    def draw_species(self, first_type, second_type="alone", rng=None):
+        """Returns (name, first stage name, stage) of a random Pokemon of that type pair."""
+        return self.__species[(first_type, second_type)].draw(rng)
+
+
+_generation_tables = None
+
+def get_generation_tables():
+    """Returns the process-wide GenerationTables, built from the game data on first use."""
+    global _generation_tables
+    if _generation_tables is None:
+        _generation_tables = GenerationTables(get_game_data().types)
+    return _generation_tables
@@ -0,0 +1,167 @@
+import math, time
+from .type_chart import get_type_chart
+from __settings__ import BOT_MODE, BOT_NODE_BUDGET, BOT_TIME_BUDGET, BOT_MAX_DEPTH, BOT_HP_BUCKETS
+
+# Chance of a missed attack (randint(1, 8) == 1)
+MISS_CHANCE = 1 / 8
+# Values of the end of a battle, beyond any evaluation of a running one (in [-1, 1])
+WIN = 2.0
+LOSS = -2.0
+
+def critical_chance(speed):
+    """Chance of randint(1, 255) < speed / 2."""
+    return max(0, min(255, math.ceil(speed / 2) - 1)) / 255
+
+def hit_damage(damage, hp, critical):
+    """Damage of an attack that did not miss (Fight.attack), damage being strength * coefficient - defense."""
+    if damage > 0:
+        if hp - damage >= 0:
+            return math.ceil(damage * 2 if critical else damage)
+        return math.ceil(hp)
+    if critical:
+        return hp if hp - 20 < 0 else 20
+    return 0 if hp - 1 < 0 else 1
+
+class _OutOfBudget(Exception):
+    pass
+
+class ExpectimaxBot:
+    """
+    Wild bot choosing its attack type with a depth-limited expectimax search.
+    Each attack is a chance node over Fight.attack's outcomes (miss 1 in 8, then critical or not);
+    the bot maximizes, the player is assumed to answer with its most harmful type. Leaves are scored
+    by the HP ratio difference, a KO by WIN / LOSS.
+    The search deepens one ply at a time until node_budget positions were searched and plays the
+    move of the deepest completed search, so a choice only depends on the two Pokemon (seeded battles
+    replay). time_budget (seconds, None for none) adds a wall-clock cap for interactive play, at the
+    cost of choices depending on the CPU. Values are memoized for the current search in a
+    transposition table keyed on the HP buckets of both Pokemon, the side to play and the remaining depth.
+    """
+    def __init__(self, node_budget=BOT_NODE_BUDGET, time_budget=None, max_depth=BOT_MAX_DEPTH,
+                 hp_buckets=BOT_HP_BUCKETS):
+        self.node_budget = node_budget
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.hp_buckets = hp_buckets
+        self.table = {}
+        # Depth of the last completed search (0: out of budget at once, greedy choice)
+        self.last_depth = 0
+        self.__nodes = 0
+        self.__deadline = None
+
+    def __call__(self, bot, player):
+        return self.choose_attack(bot, player)
+
+    def choose_attack(self, bot, player):
+        """Attack type of bot against player."""
+        if len(bot.type) == 1:
+            return bot.type[0]
+        # Bucketed values are only reused within a search: they never depend on earlier battles
+        self.table.clear()
+        self.__nodes = 0
+        self.__deadline = time.perf_counter() + self.time_budget if self.time_budget is not None else None
+        self.__prepare(bot, player)
+        best_type = max(bot.type, key=lambda attack_type: self.__expected_damage(0, attack_type))
+        self.last_depth = 0
+        for depth in range(1, self.max_depth + 1):
+            try:
+                best_type = self.__best_move(bot.get_hp(), player.get_hp(), depth)
+            except _OutOfBudget:
+                break
+            self.last_depth = depth
+        return best_type
+
+    def __prepare(self, bot, player):
+        """Per-search constants: index 0 is the bot, 1 the player."""
+        type_chart = get_type_chart()
+        pokemons = (bot, player)
+        self.__hp_max = tuple(max(pokemon.get_hp_max(), 1) for pokemon in pokemons)
+        self.__bucket_size = tuple(max(hp_max / self.hp_buckets, 1) for hp_max in self.__hp_max)
+        self.__critical = tuple(critical_chance(pokemon.get_speed()) for pokemon in pokemons)
+        # Raw damage (before the hp rules) of every attack type of each side
+        self.__damages = []
+        for side, pokemon in enumerate(pokemons):
+            defender = pokemons[1 - side]
+            self.__damages.append({
+                attack_type : pokemon.get_strength() * type_chart.get_coefficient(
+                    type_chart.get_type_id(attack_type), defender.get_combo_id()) - defender.get_defense()
+                for attack_type in pokemon.type})
+
+    def __outcomes(self, side, attack_type, defender_hp):
+        """(chance, damage) of an attack of side against a defender with defender_hp."""
+        damage = self.__damages[side][attack_type]
+        critical = self.__critical[side]
+        hit = 1 - MISS_CHANCE
+        return ((MISS_CHANCE, 0),
+                (hit * critical, hit_damage(damage, defender_hp, True)),
+                (hit * (1 - critical), hit_damage(damage, defender_hp, False)))
+
+    def __expected_damage(self, side, attack_type):
+        return sum(chance * damage for chance, damage in self.__outcomes(side, attack_type, 1 << 30))
+
+    def __best_move(self, bot_hp, player_hp, depth):
+        best_type, best_value = None, None
+        for attack_type in self.__damages[0]:
+            value = self.__attack_value(0, attack_type, bot_hp, player_hp, depth)
+            if best_value is None or value > best_value:
+                best_type, best_value = attack_type, value
+        return best_type
+
+    def __attack_value(self, side, attack_type, bot_hp, player_hp, depth):
+        """Expected value of side attacking with attack_type (chance node)."""
+        value = 0.0
+        if side == 0:
+            for chance, damage in self.__outcomes(0, attack_type, player_hp):
+                if chance:
+                    value += chance * self.__value(bot_hp, player_hp - damage, 1, depth - 1)
+        else:
+            for chance, damage in self.__outcomes(1, attack_type, bot_hp):
+                if chance:
+                    value += chance * self.__value(bot_hp - damage, player_hp, 0, depth - 1)
+        return value
+
+    def __value(self, bot_hp, player_hp, side, depth):
+        if player_hp <= 0:
+            return WIN
+        if bot_hp <= 0:
+            return LOSS
+        if depth == 0:
+            return bot_hp / self.__hp_max[0] - player_hp / self.__hp_max[1]
+        self.__nodes += 1
+        if self.__nodes > self.node_budget or (self.__deadline is not None and time.perf_counter() > self.__deadline):
+            raise _OutOfBudget()
+
+        key = (int(bot_hp // self.__bucket_size[0]), int(player_hp // self.__bucket_size[1]), side, depth)
+        value = self.table.get(key)
+        if value is None:
+            values = [self.__attack_value(side, attack_type, bot_hp, player_hp, depth)
+                      for attack_type in self.__damages[side]]
+            # The bot takes its best attack, the player is assumed to take the worst one for the bot
+            value = max(values) if side == 0 else min(values)
+            self.table[key] = value
+        return value
+
+
+_expectimax_bot = None
+_interactive_bot = None
+
+def get_expectimax_bot():
+    """Returns the process-wide deterministic ExpectimaxBot (node budget only, for simulations)."""
+    global _expectimax_bot
+    if _expectimax_bot is None:
+        _expectimax_bot = ExpectimaxBot()
+    return _expectimax_bot
+
+def get_default_bot():
+    """
+    Attack chooser of the wild bot set by BOT_MODE, None for the random type rule.
+    With BOT_TIME_BUDGET, the game's bot also stops on the clock.
+    """
+    global _interactive_bot
+    if BOT_MODE != "expectimax":
+        return None
+    if BOT_TIME_BUDGET is None:
+        return get_expectimax_bot()
+    if _interactive_bot is None:
+        _interactive_bot = ExpectimaxBot(time_budget=BOT_TIME_BUDGET)
+    return _interactive_bot
@@ -0,0 +1,203 @@
+from .fight import Fight
+
+# Player actions given to BattleEngine.step (the bot turn is step() without action)
+ATTACK = "attack"
+POTION = "potion"
+POKEBALL = "pokeball"
+SWITCH = "switch"
+FLEE = "flee"
+
+class BattleEvent:
+    """
+    Something that happened during a step, for the view (or a log) to show.
+    kind is one of:
+        attack          pokemon attacked (attack_type, efficiency, damage and the two fight messages)
+        counter_attack  the enemy hit back during a failed capture or flee (not announced in game)
+        potion          pokemon was healed
+        bag_empty       no item left of that kind, the player keeps the turn
+        capture         capture succeeded
+        capture_failed  capture failed
+        flee            the player escaped
+        flee_failed     the player did not escape
+        switch          pokemon is now the active Pokemon
+        end             the battle is over, the winner is in message ("player" or "enemy")
+    """
+    __slots__ = ("kind", "pokemon", "attack_type", "efficiency", "damage", "message", "damage_message")
+
+    def __init__(self, kind, pokemon=None, attack_type="", efficiency="", damage=0, message="", damage_message=""):
+        self.kind = kind
+        self.pokemon = pokemon
+        self.attack_type = attack_type
+        self.efficiency = efficiency
+        self.damage = damage
+        self.message = message
+        self.damage_message = damage_message
+
+    def __repr__(self):
+        return f"BattleEvent({self.kind!r}, {self.message!r})"
+
+
+class BattleEngine:
+    """
+    Rules of a wild battle, without any display: the state lives here and the view (InFight) only
+    draws it. step(action) plays the player's action, step() plays the enemy's turn, and both return
+    the list of BattleEvent that happened.
+        engine = BattleEngine(pokemon, enemy, bag)
+        while not engine.over:
+            events = engine.step((ATTACK, "fire")) if engine.player_turn else engine.step()
+    """
+    def __init__(self, pokemon, enemy, bag=None, team=None, rng=None, enemy_policy=None, bot=None, recorder=None):
+        # enemy_policy(engine) -> attack type of every enemy attack, counter-attacks included
+        # (None: the Fight's bot, itself the BOT_MODE default when bot is None)
+        self.enemy_policy = enemy_policy
+        if enemy_policy is not None:
+            bot = lambda bot_pokemon, player_pokemon: enemy_policy(self)
+        self.fight = Fight(pokemon, enemy, rng, bot)
+        self.enemy = enemy
+        self.bag = bag
+        self.team = team if team is not None else [pokemon]
+        self.player_turn = self.fight.is_player_first()
+        self.winner = None
+        self.captured = False
+        self.fled = False
+        # recorder.start(engine) / record(action, events, engine): replay log of the battle
+        self.recorder = recorder
+        if recorder is not None:
+            recorder.start(self)
+
+    @property
+    def pokemon(self):
+        """Active Pokemon of the player."""
+        return self.fight.first_pokemon
+
+    @property
+    def over(self):
+        return self.winner is not None or self.fled
+
+    def step(self, action=None):
+        """
+        Plays one turn and returns its events.
+        action is None for the enemy turn, otherwise (kind, argument) or a kind alone:
+        (ATTACK, attack type), POTION, POKEBALL, (SWITCH, pokemon) or FLEE.
+        """
+        if self.over:
+            raise ValueError("The battle is over")
+        if action is None:
+            if self.player_turn:
+                raise ValueError("It is the player's turn")
+            return self.__record(None, self.__enemy_turn())
+        if not self.player_turn:
+            raise ValueError("It is the enemy's turn")
+
+        kind, argument = (action, None) if isinstance(action, str) else action
+        match kind:
+            case "attack":
+                events = self.__attack(argument)
+            case "potion":
+                events = self.__use_potion()
+            case "pokeball":
+                events = self.__use_pokeball()
+            case "switch":
+                events = self.__switch(argument)
+            case "flee":
+                events = self.__flee()
+            case _:
+                raise ValueError(f"Unknown battle action: {kind}")
+        return self.__record((kind, argument), events)
+
+    def __record(self, action, events):
+        if self.recorder is not None:
+            self.recorder.record(action, events, self)
+        return events
+
+    def __attack_event(self, kind, attacker):
+        info = self.fight.fightinfo
+        return BattleEvent(kind, attacker, info.attack_type, info.efficiency, info.total_damage,
+                           info.set_who_attack_message(attacker), info.get_damage_message())
+
+    def __end(self, winner, events):
+        self.winner = winner
+        self.player_turn = True
+        events.append(BattleEvent("end", message=winner))
+        return events
+
+    def __attack(self, attack_type):
+        pokemon = self.pokemon
+        if pokemon.get_hp() <= 0:
+            # Active Pokemon already KO (switched to a fainted one)
+            return self.__end("enemy", [])
+
+        self.fight.player_attack(attack_type)
+        events = [self.__attack_event("attack", pokemon)]
+        if self.enemy.get_hp() > 0:
+            self.player_turn = False
+            return events
+        pokemon.update_xp(self.enemy, self.fight.rng)
+        return self.__end("player", events)
+
+    def __use_potion(self):
+        if self.fight.use_potion(self.pokemon, self.bag):
+            return [BattleEvent("bag_empty", self.pokemon, message="Potions")]
+        self.player_turn = False
+        return [BattleEvent("potion", self.pokemon)]
+
+    def __use_pokeball(self):
+        result = self.fight.use_pokeball(None, self.bag, self.pokemon, self.enemy)
+        match result:
+            case "Success":
+                self.captured = True
+                self.pokemon.update_xp(self.enemy, self.fight.rng)
+                return self.__end("player", [BattleEvent("capture", self.enemy,
+                                                         message="The pokemon has been captured successfully !")])
+            case "Fail":
+                # The enemy hits back, then plays its own turn
+                self.player_turn = False
+                return [self.__attack_event("counter_attack", self.enemy),
+                        BattleEvent("capture_failed", self.enemy, message=f"You failed to capture {self.enemy.name}...")]
+        return [BattleEvent("bag_empty", self.pokemon, message="Pokeball")]
+
+    def __switch(self, pokemon):
+        self.fight.set_first_pokemon(pokemon)
+        return [BattleEvent("switch", pokemon)]
+
+    def __flee(self):
+        # run_away lets the enemy attack when a wild Pokemon blocks the escape
+        counter_attack = self.enemy.get_state() != "domesticated"
+        self.fled = self.fight.run_away()
+        message = self.fight.fightinfo.flee_message
+        if self.fled:
+            return [BattleEvent("flee", self.pokemon, message=message)]
+
+        self.player_turn = False
+        events = [self.__attack_event("counter_attack", self.enemy)] if counter_attack else []
+        events.append(BattleEvent("flee_failed", self.pokemon, message=message))
+        return events
+
+    def __enemy_turn(self):
+        pokemon = self.pokemon
+        events = []
+        if pokemon.get_hp() > 0:
+            self.fight.bot_attack()
+            events.append(self.__attack_event("attack", self.enemy))
+            if pokemon.get_hp() > 0:
+                self.player_turn = True
+                return events
+        self.enemy.update_xp(pokemon, self.fight.rng)
+        return self.__end("enemy", events)
+
+
+def first_type_policy(engine):
+    """Default headless policy: always attack with the first type of the active Pokemon."""
+    return (ATTACK, engine.pokemon.type[0])
+
+def run_battle(pokemon, enemy, bag=None, policy=first_type_policy, rng=None, max_turns=1000, enemy_policy=None):
+    """
+    Plays a whole battle without display, the player's actions coming from policy(engine).
+    Returns the engine (winner, captured, fled...) once the battle is over or after max_turns steps.
+    """
+    engine = BattleEngine(pokemon, enemy, bag, rng=rng, enemy_policy=enemy_policy)
+    for turn in range(max_turns):
+        if engine.over:
+            break
+        engine.step(policy(engine) if engine.player_turn else None)
+    return engine
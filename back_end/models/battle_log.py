@@ -0,0 +1,227 @@
+"""
+Compact binary log of a battle, and its headless replay.
+A battle is fully determined by its starting state, its RNG seed, the player's actions and, when a
+bot chose them, the enemy's attack types; the log stores exactly that, plus the HP of both active
+Pokemon after each step and a checksum of the final state so a replay can prove it matches.
+Layout (little-endian):
+    header      version u8, seed u64, flags u8 (1: enemy types scripted by a bot, 2: with a bag),
+                potions u16, pokeballs u16, team size u8, active index u8,
+                the team then the enemy as POKEMON records (+ pet name: u16 length + UTF-8)
+    step        opcode u8, argument u8 (type id / team index, 255 for none),
+                enemy attack count u8 + that many type ids u8, player hp i32, enemy hp i32
+    end         END u8, winner u8, outcome u8 (1: captured, 2: fled), state checksum u32
+"""
+
+import json, struct, zlib
+from .bag import Bag
+from .battle_engine import BattleEngine
+from .rng import RngService
+from .type_chart import get_type_chart
+from ..data_access.game_data import get_game_data
+from ..data_access.util import instanciate_pokemon
+
+VERSION = 1
+SCRIPTED = 1
+WITH_BAG = 2
+CAPTURED = 1
+FLED = 2
+NONE = 255
+
+# Step opcodes (ENEMY is the enemy turn)
+OPCODES = {None : 0, "attack" : 1, "potion" : 2, "pokeball" : 3, "switch" : 4, "flee" : 5}
+ACTIONS = {opcode : kind for kind, opcode in OPCODES.items()}
+END = 255
+WINNERS = (None, "player", "enemy")
+STATES = ("wild", "domesticated")
+
+HEADER = struct.Struct("<BQBHHBB")
+POKEMON = struct.Struct("<HHiiqiiiiiiiiiiBBB")
+STEP = struct.Struct("<BBB")
+HPS = struct.Struct("<ii")
+FOOTER = struct.Struct("<BBBI")
+TEXT_LENGTH = struct.Struct("<H")
+
+class ReplayMismatch(ValueError):
+    """A replay did not reproduce the recorded battle."""
+
+def state_digest(engine):
+    """Checksum of the team, the enemy and the bag of a battle."""
+    state = {
+        "team" : [pokemon.pokemon_dict() for pokemon in engine.team],
+        "enemy" : engine.enemy.pokemon_dict(),
+        "bag" : engine.bag.get_dict() if engine.bag is not None else None
+    }
+    return zlib.crc32(json.dumps(state, sort_keys=True).encode("utf-8"))
+
+def encode_pokemon(record):
+    game_data = get_game_data()
+    type_ids = get_type_chart().get_type_ids(record["type"])
+    ev = record["ev"]
+    pet_name = record["pet_name"].encode("utf-8")
+    return POKEMON.pack(
+        game_data.get_species_id(record["name"]), game_data.get_species_id(record["original_name"]),
+        record["hp_max"], record["hp"], record["xp"], record["strength"], record["defense"],
+        record["level"], record["speed"], record["stage"],
+        ev["hp"], ev["strength"], ev["defense"], ev["speed"], ev["xp"],
+        type_ids[0], type_ids[1] if len(type_ids) == 2 else NONE, STATES.index(record["state"])
+    ) + TEXT_LENGTH.pack(len(pet_name)) + pet_name
+
+def decode_pokemon(data, offset):
+    """Returns (pokemon_dict() record, offset after it)."""
+    species_names = get_game_data().species_names
+    type_names = get_type_chart().type_names
+    (name, original_name, hp_max, hp, xp, strength, defense, level, speed, stage,
+     ev_hp, ev_strength, ev_defense, ev_speed, ev_xp, first_type, second_type, state) = POKEMON.unpack_from(data, offset)
+    offset += POKEMON.size
+    length, = TEXT_LENGTH.unpack_from(data, offset)
+    offset += TEXT_LENGTH.size
+    record = {
+        "name" : species_names[name],
+        "original_name" : species_names[original_name],
+        "pet_name" : data[offset:offset + length].decode("utf-8"),
+        "hp_max" : hp_max,
+        "hp" : hp,
+        "xp" : xp,
+        "strength" : strength,
+        "defense" : defense,
+        "type" : [type_names[first_type]] + ([type_names[second_type]] if second_type != NONE else []),
+        "level" : level,
+        "speed" : speed,
+        "stage" : stage,
+        "ev" : {"hp" : ev_hp, "strength" : ev_strength, "defense" : ev_defense, "speed" : ev_speed, "xp" : ev_xp},
+        "state" : STATES[state]
+    }
+    return record, offset + length
+
+
+class BattleRecorder:
+    """
+    Records a BattleEngine (given as its recorder) into a battle log.
+    The engine must draw from its own RngService: its seed replays every draw of the battle.
+    """
+    def __init__(self):
+        self.data = bytearray()
+        self.finished = False
+
+    def start(self, engine):
+        rng = engine.fight.rng
+        if not isinstance(rng, RngService):
+            raise ValueError("Recording a battle needs an RngService")
+        bag = engine.bag
+        flags = (SCRIPTED if engine.fight.bot is not None else 0) | (WITH_BAG if bag is not None else 0)
+        self.data += HEADER.pack(VERSION, rng.seed, flags,
+                                 bag.get_potion() if bag else 0, bag.get_pokeball() if bag else 0,
+                                 len(engine.team), engine.team.index(engine.pokemon))
+        for pokemon in engine.team + [engine.enemy]:
+            self.data += encode_pokemon(pokemon.pokemon_dict())
+
+    def record(self, action, events, engine):
+        type_chart = get_type_chart()
+        kind, argument = action if action is not None else (None, None)
+        if kind == "attack":
+            argument = type_chart.get_type_id(argument) if argument is not None else NONE
+        elif kind == "switch":
+            argument = engine.team.index(argument)
+        else:
+            argument = NONE
+        enemy_types = [type_chart.get_type_id(event.attack_type) for event in events
+                       if event.kind in ("attack", "counter_attack") and event.pokemon is engine.enemy]
+        self.data += STEP.pack(OPCODES[kind], argument, len(enemy_types)) + bytes(enemy_types)
+        self.data += HPS.pack(engine.pokemon.get_hp(), engine.enemy.get_hp())
+        if engine.over:
+            self.finish(engine)
+
+    def finish(self, engine):
+        if not self.finished:
+            outcome = (CAPTURED if engine.captured else 0) | (FLED if engine.fled else 0)
+            self.data += FOOTER.pack(END, WINNERS.index(engine.winner), outcome, state_digest(engine))
+            self.finished = True
+
+    def to_bytes(self):
+        return bytes(self.data)
+
+
+class BattleLog:
+    """Decoded battle log: starting state, steps (opcode, argument, enemy type ids, hps) and outcome."""
+    def __init__(self, data):
+        (version, self.seed, flags, potions, pokeballs, team_size, self.active) = HEADER.unpack_from(data, 0)
+        if version != VERSION:
+            raise ValueError(f"Unknown battle log version: {version}")
+        self.scripted = bool(flags & SCRIPTED)
+        self.bag = (potions, pokeballs) if flags & WITH_BAG else None
+        offset = HEADER.size
+        records = []
+        for index in range(team_size + 1):
+            record, offset = decode_pokemon(data, offset)
+            records.append(record)
+        self.team, self.enemy = records[:-1], records[-1]
+
+        self.steps = []
+        self.winner = self.outcome = self.digest = None
+        while offset < len(data):
+            if data[offset] == END:
+                end, winner, self.outcome, self.digest = FOOTER.unpack_from(data, offset)
+                self.winner = WINNERS[winner]
+                break
+            opcode, argument, count = STEP.unpack_from(data, offset)
+            offset += STEP.size
+            enemy_types = tuple(data[offset:offset + count])
+            offset += count
+            self.steps.append((opcode, argument, enemy_types, HPS.unpack_from(data, offset)))
+            offset += HPS.size
+
+    @property
+    def finished(self):
+        return self.digest is not None
+
+
+class ScriptedBot:
+    """Bot replaying recorded enemy attack types, in order."""
+    def __init__(self, type_ids):
+        self.type_ids = iter(type_ids)
+
+    def __call__(self, bot, player):
+        type_id = next(self.type_ids, None)
+        if type_id is None:
+            raise ReplayMismatch("The replay attacks more often than the recorded battle")
+        return get_type_chart().type_names[type_id]
+
+def replay(data, verify=True):
+    """
+    Replays an encoded battle headlessly and returns the engine, in the state the battle ended in.
+    With verify, raises ReplayMismatch as soon as the replay leaves the recorded battle.
+    """
+    log = data if isinstance(data, BattleLog) else BattleLog(data)
+    type_chart = get_type_chart()
+    team = [instanciate_pokemon(record) for record in log.team]
+    bag = None
+    if log.bag is not None:
+        bag = Bag()
+        bag.set_potion(log.bag[0])
+        bag.set_pokeball(log.bag[1])
+
+    engine = BattleEngine(team[log.active], instanciate_pokemon(log.enemy), bag, team, RngService(log.seed))
+    engine.fight.bot = ScriptedBot(
+        type_id for opcode, argument, enemy_types, hps in log.steps for type_id in enemy_types) if log.scripted else None
+
+    for step_index, (opcode, argument, enemy_types, hps) in enumerate(log.steps):
+        kind = ACTIONS[opcode]
+        if kind is None:
+            engine.step()
+        elif kind == "attack":
+            engine.step((kind, type_chart.type_names[argument] if argument != NONE else None))
+        elif kind == "switch":
+            engine.step((kind, team[argument]))
+        else:
+            engine.step(kind)
+        if verify and (engine.pokemon.get_hp(), engine.enemy.get_hp()) != hps:
+            raise ReplayMismatch(f"Step {step_index}: HP {engine.pokemon.get_hp()}/{engine.enemy.get_hp()}, "
+                                 f"recorded {hps[0]}/{hps[1]}")
+
+    if verify and log.finished:
+        outcome = (CAPTURED if engine.captured else 0) | (FLED if engine.fled else 0)
+        if (engine.winner, outcome) != (log.winner, log.outcome):
+            raise ReplayMismatch(f"Outcome {engine.winner}/{outcome}, recorded {log.winner}/{log.outcome}")
+        if state_digest(engine) != log.digest:
+            raise ReplayMismatch("Final state differs from the recorded battle")
+    return engine
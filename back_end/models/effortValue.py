@@ -1,6 +1,9 @@
-import math,random
+import math
+from .rng import get_rng
 
 class EffortValue():
+    __slots__ = ('__ev_hp', '__ev_strength', '__ev_defense', '__ev_speed', '__ev_xp')
+
     def __init__(self):
         self.__ev_hp = 0
         self.__ev_strength = 0
@@ -27,7 +30,8 @@ class EffortValue():
 
         return rand_range_hp, rand_range_strength, rand_range_defense, rand_range_speed, rand_range_xp
     
-    def update_ev(self, enemy, pokemon):
+    def update_ev(self, enemy, pokemon, rng=None):
+        rng = rng or get_rng()
         if enemy.get_level() > pokemon.get_level():
             rand_range_hp, rand_range_strength, rand_range_defense,\
                 rand_range_speed, rand_range_xp = self.declare_range_ev(enemy, 6)
@@ -40,38 +44,34 @@ class EffortValue():
             rand_range_hp, rand_range_strength, rand_range_defense,\
                 rand_range_speed, rand_range_xp = self.declare_range_ev(enemy, 12)
 
-        self.set_ev_hp(self.get_ev_hp() + math.floor(random.randrange(rand_range_hp * 2, rand_range_hp * 4)))
-        self.set_ev_strength(self.get_ev_strength() + math.floor(random.randrange(rand_range_strength * 2, rand_range_strength * 4)))
-        self.set_ev_defense(self.get_ev_defense() + math.floor(random.randrange(rand_range_defense * 2, rand_range_defense * 4)))
-        self.set_ev_speed(self.get_ev_speed() + math.floor(random.randrange(rand_range_speed * 2, rand_range_speed * 4)))
-        self.set_ev_xp(self.get_ev_xp() + math.floor(random.randrange(rand_range_xp * 2, rand_range_xp * 4)))
+        self.__ev_hp += rng.randrange(rand_range_hp * 2, rand_range_hp * 4)
+        self.__ev_strength += rng.randrange(rand_range_strength * 2, rand_range_strength * 4)
+        self.__ev_defense += rng.randrange(rand_range_defense * 2, rand_range_defense * 4)
+        self.__ev_speed += rng.randrange(rand_range_speed * 2, rand_range_speed * 4)
+        self.__ev_xp += rng.randrange(rand_range_xp * 2, rand_range_xp * 4)
         self.__update_stats(pokemon)
 
     def __update_stats(self, pokemon):
-        if self.get_ev_hp() > 4:
-            hp = pokemon.get_hp_max() + self.get_ev_hp()//4
-            self.set_ev_hp(self.get_ev_hp()%4)
-            pokemon.set_hp_max(hp)     
+        # Every 4 EV points turn into a stat point once the EV is above 4
+        if self.__ev_hp > 4:
+            pokemon.set_hp_max(pokemon.get_hp_max() + self.__ev_hp//4)
+            self.__ev_hp %= 4
+
+        if self.__ev_strength > 4:
+            pokemon.set_strength(pokemon.get_strength() + self.__ev_strength//4)
+            self.__ev_strength %= 4
+
+        if self.__ev_defense > 4:
+            pokemon.set_defense(pokemon.get_defense() + self.__ev_defense//4)
+            self.__ev_defense %= 4
+
+        if self.__ev_speed > 4:
+            pokemon.set_speed(pokemon.get_speed() + self.__ev_speed//4)
+            self.__ev_speed %= 4
 
-        if self.get_ev_strength() > 4:
-            strength = pokemon.get_strength() + self.get_ev_strength()//4
-            self.set_ev_strength(self.get_ev_strength()%4)
-            pokemon.set_strength(strength)
-            
-        if self.get_ev_defense() > 4:
-            defense = pokemon.get_defense() + self.get_ev_defense()//4
-            self.set_ev_defense(self.get_ev_defense()%4)
-            pokemon.set_defense(defense)
-            
-        if self.get_ev_speed() > 4:
-            speed = pokemon.get_speed() + self.get_ev_speed()//4
-            self.set_ev_speed(self.get_ev_speed()%4)
-            pokemon.set_speed(speed)
-            
-        if self.get_ev_xp() > 4:
-            xp = pokemon.get_xp() + self.get_ev_xp()//4
-            self.set_ev_xp(self.get_ev_xp()%4)
-            pokemon.set_xp(xp)
+        if self.__ev_xp > 4:
+            pokemon.set_xp(pokemon.get_xp() + self.__ev_xp//4)
+            self.__ev_xp %= 4
           
     def get_ev_hp(self):
             return self.__ev_hp
@@ -1,17 +1,51 @@
-import random, json
-from __settings__ import TYPES_PATH, EVOLUTION_STAGE_PATH, ABSOLUTE_IMAGE_PATH
+import sys
+from __settings__ import ABSOLUTE_IMAGE_PATH
+from ..data_access.game_data import get_game_data
+from .type_chart import get_type_chart
+from .xp_curve import get_xp_curve
+from .rng import get_rng
 
 class Evolution():
+    # Fixed layout (no per-instance __dict__): wild pools and teams keep many Pokemon alive
+    __slots__ = ('name', '__stage', '__original_name', '_level', '_type', '_type_ids', '_combo_id',
+                 '__evolution_number')
+
     def __init__(self, name, stage, original_name, type, level):
-        self.name = name
+        # Species names are interned: every Pokemon of a species shares the same strings
+        self.name = sys.intern(name)
         self.__stage = stage
-        self.__original_name = original_name
+        self.__original_name = sys.intern(original_name)
         self._level = level
         self.type = type
         # self.image_path = self.set_image()
         self.__evolution_number = self.get_evolution_name_list()
-        self.image = self.get_image()
-        self.back_image = self.get_back_image()
+
+    @property
+    def image(self):
+        return self.get_image()
+
+    @property
+    def back_image(self):
+        return self.get_back_image()
+
+    @property
+    def type(self):
+        return self._type
+
+    @type.setter
+    def type(self, new_type):
+        # Keep the interned type ids in step with the type names (used by the type chart lookups)
+        type_chart = get_type_chart()
+        self._type_ids = type_chart.get_type_ids(new_type)
+        self._combo_id = type_chart.get_combo_id(self._type_ids)
+        # Own list, made of the chart's shared type name strings
+        self._type = [type_chart.type_names[type_id] for type_id in self._type_ids]
+
+    def get_type_ids(self):
+        return self._type_ids
+
+    def get_combo_id(self):
+        return self._combo_id
 
     def set_stage(self, new_stage):
         self.__stage = new_stage
@@ -31,9 +65,7 @@ class Evolution():
         pass
 
     def get_evolution_stage_json(self):
-        with open(EVOLUTION_STAGE_PATH, 'r') as evolution_stage:
-            data = json.load(evolution_stage)[self.__original_name]
-        return data
+        return get_game_data().get_evolution_stage(self.__original_name)
    
     def get_evolution_name_list(self):
         evolution_stage = self.get_evolution_stage_json()
@@ -47,17 +79,18 @@ class Evolution():
         return evolution_number
     
     def update_name(self, new_name):
-        self.name = new_name
+        self.name = sys.intern(new_name)
 
     def update_evolution_meowth(self):
         if self.type[0] != 'normal':
             self.type = ['dark']
 
-    def update_evolution_eevee(self):
+    def update_evolution_eevee(self, rng=None):
         types = ['water', 'electric', 'fire']
-        new_type = random.choice(types) #Doesn't change type
-        self.type.append(new_type)
-        self.type.pop(self.type.index('normal'))
+        new_type = (rng or get_rng()).choice(types) #Doesn't change type
+        new_type_list = self.type + [new_type]
+        new_type_list.remove('normal')
+        self.type = new_type_list
         # self.__type = [new_type]
         match new_type:
             case 'water':
@@ -72,36 +105,23 @@ class Evolution():
         if self.type[0] == 'psychic':
             self.type = ['poison', 'psychic']
 
-    def update_evolution_stage(self):
-        evolution_stage = self.get_evolution_stage_json()
-
+    def update_evolution_stage(self, rng=None):
         if self.__original_name != 'Eevee':
-            evolution_stage_value = list(evolution_stage.values())
-            new_name = list(evolution_stage.keys())[evolution_stage_value.index(self.__stage)]
+            new_name = get_game_data().get_stage_name(self.__original_name, self.__stage)
             self.update_name(new_name)
-        self.update_type()
+        self.update_type(rng)
         self.get_image()
 
-    def update_type(self):
+    def update_type(self, rng=None):
 
         if len(self.type) == 1 and self.__original_name not in ['Eevee', 'Meowth', 'Slowpoke']:
-            with open(TYPES_PATH, 'r') as file:
-                data = json.load(file)
-                my_pokemon_data = data[self.type[0]]
-
-            data_list = list(my_pokemon_data.keys())
-            
             # For all type except normal type and Eevee
-            for sub_type in data_list:
-                # first_type_list = list(my_pokemon_data[sub_type].keys())
-                if sub_type != "alone":
-                    sub_type_dict = my_pokemon_data[sub_type]
-                    if self.__original_name in sub_type_dict["names"]: 
-                        if self.name in sub_type_dict["names"][self.__original_name]: # .keys()
-                            self.type.append(sub_type)
+            second_types = get_game_data().get_second_types(self.type[0], self.__original_name, self.name)
+            if second_types:
+                self.type = self.type + list(second_types)
         
         if self.__original_name == "Eevee":
-            self.update_evolution_eevee()
+            self.update_evolution_eevee(rng)
 
         if self.__original_name == "Meowth":
             self.update_evolution_meowth()
@@ -109,68 +129,64 @@ class Evolution():
         if self.__original_name == "Slowpoke":
             self.update_evolution_slowpoke()
 
-    def level_up(self, pokemon):
-        level =  self.get_level()
-        xp_value = pokemon.get_xp()
-        add_level = 0
-        while xp_value >= level**3: #TODO balance level up ?
-            add_level += 1
-            xp_value -= level**3
-            level += 1
-            
+    def level_up(self, pokemon, rng=None):
+        # One level per level**3 of XP, resolved on the cumulative XP table
+        add_level = get_xp_curve().resolve_level(self._level, pokemon.get_xp()) - self._level #TODO balance level up ?
         if add_level != 0:
-            self.set_level_up(pokemon, add_level)
+            self.set_level_up(pokemon, add_level, rng)
 
-    def evolve(self):
+    def evolve(self, rng=None):
+        rng = rng or get_rng()
         level = self.get_level()
         if self.__stage < self.__evolution_number:
             if self.__evolution_number == 3:
                 match self.__stage:
                     case 1:
                         if level in range(10, 20):
-                            luck = random.randrange(100)
+                            luck = rng.randrange(100)
                             if luck > 60:
                                 self.__stage += 1
-                                self.update_evolution_stage()
+                                self.update_evolution_stage(rng)
                                 return True
                         elif level >= 20:
                             if self.__stage == 1:
                                 self.__stage += 1
-                                self.update_evolution_stage()
+                                self.update_evolution_stage(rng)
                                 return True
                     case 2:
                         if level in range(22, 32):
-                            luck = random.randrange(100)
+                            luck = rng.randrange(100)
                             if luck > 60:
                                 self.__stage += 1
-                                self.update_evolution_stage()
+                                self.update_evolution_stage(rng)
                                 return True
                         elif level >= 32:
                             if self.__stage == 2:
                                 self.__stage += 1
-                                self.update_evolution_stage()
+                                self.update_evolution_stage(rng)
                                 return True
             if self.__evolution_number == 2: 
                 match self.__stage:
                     case 1:
                         if level in range(17, 25):
-                            luck = random.randrange(100)
+                            luck = rng.randrange(100)
                             if luck > 60:
                                 self.__stage += 1
-                                self.update_evolution_stage()
+                                self.update_evolution_stage(rng)
                                 return True
                         elif level >= 25:
                             if self.__stage == 1:
                                 self.__stage += 1
-                                self.update_evolution_stage()
+                                self.update_evolution_stage(rng)
                                 return True
                 
-    def set_level_up(self, pokemon, add_level):
+    def set_level_up(self, pokemon, add_level, rng=None):
+        rng = rng or get_rng()
         self._level += add_level
-        pokemon.set_strength(pokemon.get_strength() + random.randrange(add_level*5, add_level*15))
-        pokemon.set_defense(pokemon.get_defense() + random.randrange(add_level*5, add_level*15))
-        pokemon.set_speed(pokemon.get_speed() + random.randrange(add_level*5, add_level*15))
-        pokemon.set_hp_max(pokemon.get_hp_max() + random.randrange(add_level*5, add_level*15))
+        pokemon.set_strength(pokemon.get_strength() + rng.randrange(add_level*5, add_level*15))
+        pokemon.set_defense(pokemon.get_defense() + rng.randrange(add_level*5, add_level*15))
+        pokemon.set_speed(pokemon.get_speed() + rng.randrange(add_level*5, add_level*15))
+        pokemon.set_hp_max(pokemon.get_hp_max() + rng.randrange(add_level*5, add_level*15))
         
     def get_level(self):
         return self._level
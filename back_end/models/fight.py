@@ -1,24 +1,30 @@
-import random, math
+import math
 from .fight_info import FightInfo
+from .rng import get_rng
+from .battle_ai import get_default_bot
 from ..data_access.pokemon_pokedex_service import save_pokemon_to_pokedex
 
 class Fight:
-    def __init__(self, pokemon1, pokemon2):
+    def __init__(self, pokemon1, pokemon2, rng=None, bot=None):
         self.first_pokemon = pokemon1
         self.second_pokemon = pokemon2
         self.fightinfo = FightInfo()
+        # Every random draw of the fight comes from this source (same seed, same fight)
+        self.rng = rng or get_rng()
+        # bot(bot pokemon, player pokemon) -> attack type of the wild Pokemon, None for a random type
+        self.bot = bot if bot is not None else get_default_bot()
     
     def set_first_pokemon(self, new_pokemon):
         self.first_pokemon = new_pokemon
 
     def attack(self, pokemon, enemy, attack_type):
         coefficient, efficency = pokemon.attack_efficiency(attack_type, enemy)
-        miss = random.randint(1, 8)
+        miss = self.rng.randint(1, 8)
         
 
         damage = ((pokemon.get_strength() * coefficient) - enemy.get_defense())
         critical_rate = pokemon.get_speed() / 2
-        critical = random.randint(1, 255)
+        critical = self.rng.randint(1, 255)
 
         if miss ==1:
             efficency = "Missed attack..."
@@ -36,7 +42,7 @@ class Fight:
                         final_damage = enemy.get_hp()
                     else:
                         final_damage = 0
-                    pokemon.update_xp(enemy)
+                    pokemon.update_xp(enemy, self.rng)
             else:
                 if critical < critical_rate:
                     efficency = "Critical hit !!"
@@ -63,16 +69,19 @@ class Fight:
     def player_attack(self, attack_type):
         self.attack(self.first_pokemon, self.second_pokemon, attack_type)
 
-    def bot_attack(self):
-        if len(self.second_pokemon.type) == 2:
-            attack_type = random.choice(self.second_pokemon.type)
-        else:
-            attack_type = self.second_pokemon.type[0]
+    def bot_attack(self, attack_type=None):
+        if attack_type is None and self.bot is not None:
+            attack_type = self.bot(self.second_pokemon, self.first_pokemon)
+        if attack_type is None:
+            if len(self.second_pokemon.type) == 2:
+                attack_type = self.rng.choice(self.second_pokemon.type)
+            else:
+                attack_type = self.second_pokemon.type[0]
 
         self.attack(self.second_pokemon, self.first_pokemon, attack_type)
 
     def run_away(self):
-        miss = random.randint(1,7) #1-7
+        miss = self.rng.randint(1,7) #1-7
         if self.second_pokemon.get_state() == "domesticated":
             
             self.fightinfo.set_fail_flee_message()
@@ -97,7 +106,7 @@ class Fight:
 
     def use_pokeball(self, player, bag, pokemon, pokemon_enemy):
         if bag.get_pokeball() > 0:
-            capture = random.randint(1, pokemon_enemy.get_hp_max())
+            capture = self.rng.randint(1, pokemon_enemy.get_hp_max())
             bag.set_pokeball(bag.get_pokeball() - 1)
 
             if capture >= pokemon_enemy.get_hp():
@@ -116,7 +125,7 @@ class Fight:
         else:
             if bag.get_pokeball() > 0:
                 bag_option == "Pokeball"
-                capture = random.randint(1, pokemon_enemy.get_hp())
+                capture = self.rng.randint(1, pokemon_enemy.get_hp())
                 bag.set_pokeball(bag.get_pokeball() - 1)
 
                 if capture <= 10:
@@ -1,10 +1,13 @@
-import random, json, math
+import random, math
 from .effortValue import EffortValue
-from __settings__ import COEFFICIENT_PATH
 from .evolution import Evolution
+from ..data_access.game_data import get_game_data
+from .type_chart import get_type_chart
+from .rng import get_rng
 
 class Pokemon(Evolution):
-    coefficient = json.load(open(COEFFICIENT_PATH))
+    coefficient = get_game_data().coefficients
+    __slots__ = ('__hp', '__hp_max', '__strength', '__defense', '__xp', '__state', '__ev', '__speed', 'pet_name')
     
     def __init__(self, name, original_name, hp, hp_max, strength, defense, type, level, speed, stage):
         super().__init__(name, stage, original_name, type, level)
@@ -100,41 +103,16 @@ class Pokemon(Evolution):
         return self.__state
         
     def get_attack_coefficient(self, attack_type, enemy):
-        if len(enemy.type) == 2:
-            list_coefficient = []
-            
-            for index in range(len(enemy.type)):
-                a_coefficient = Pokemon.coefficient[attack_type][enemy.type[index]]
-                list_coefficient.append(a_coefficient)
-        
-            coefficient = list_coefficient[0] * list_coefficient[1]
-        else:
-            coefficient = Pokemon.coefficient[attack_type][enemy.type[0]]
-
-        return coefficient
+        type_chart = get_type_chart()
+        return type_chart.get_coefficient(type_chart.get_type_id(attack_type), enemy.get_combo_id())
     
     def attack_efficiency(self, chose_attack_type, enemy):
-        coefficient = self.get_attack_coefficient(chose_attack_type, enemy)
-
-        match coefficient:
-            case 4:
-                efficiency = "Super effective attack"
-
-            case 2:
-                efficiency = "Very effective attack"
-
-            case 1:
-                efficiency = "Effective attack"
-            case 0.25 | 0.5:
-                efficiency = "Not so effective attack"
-
-            case 0:
-                efficiency = "Impossible to attack"
-
-        return coefficient, efficiency
+        """Returns (coefficient, efficiency message), precomputed for every attack type x defender types."""
+        type_chart = get_type_chart()
+        return type_chart.get_efficiency(type_chart.get_type_id(chose_attack_type), enemy.get_combo_id())
 
-    def check_evolution(self):
-        is_evolving = self.evolve()
+    def check_evolution(self, rng=None):
+        is_evolving = self.evolve(rng)
         # if is_evolving:
         #     print(f"{self.get_original_name().upper()} evolve into : {self.name.upper()}")
         #     self.set_hp_max(self.get_hp_max() + random.randrange(20, 35))
@@ -158,12 +136,12 @@ class Pokemon(Evolution):
         return xp_gained
 
     
-    def update_xp(self, enemy):
-        xp_gained = self.get_xp_gained(enemy)
-        self.set_xp(self.get_xp() + xp_gained)
-        self.__ev.update_ev(enemy, self)
-        self.level_up(self)
-        self.evolve()
+    def update_xp(self, enemy, rng=None):
+        rng = rng or get_rng()
+        self.__xp += self.get_xp_gained(enemy)
+        self.__ev.update_ev(enemy, self, rng)
+        self.level_up(self, rng)
+        self.evolve(rng)
 
     def __str__(self):
         if len(self.type) > 1:
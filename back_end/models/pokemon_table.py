@@ -0,0 +1,271 @@
+import math
+from array import array
+from .type_chart import get_type_chart
+from .rng import RngService, get_rng
+from .xp_curve import get_xp_curve
+from ..data_access.game_data import get_game_data
+from ..data_access.util import instanciate_pokemon
+
+try:
+    import numpy as np
+except ImportError: # NumPy is optional: columns are array('q') and operations loop in Python
+    np = None
+
+STAT_COLUMNS = ("hp", "hp_max", "strength", "defense", "speed", "xp", "level", "stage")
+EV_COLUMNS = ("ev_hp", "ev_strength", "ev_defense", "ev_speed", "ev_xp")
+ID_COLUMNS = ("species", "original", "first_type", "second_type", "state")
+COLUMNS = STAT_COLUMNS + EV_COLUMNS + ID_COLUMNS
+
+STATES = ("wild", "domesticated")
+
+# EV column -> stat it feeds (EffortValue.__update_stats)
+EV_TARGETS = (("ev_hp", "hp_max"), ("ev_strength", "strength"), ("ev_defense", "defense"),
+              ("ev_speed", "speed"), ("ev_xp", "xp"))
+
+def new_column(values=()):
+    """Integer column: int64 NumPy array when available, array('q') otherwise."""
+    if np is not None:
+        return np.array(list(values), dtype=np.int64)
+    return array('q', values)
+
+def resolve_rng(rng=None):
+    """
+    Random source of the bulk operations: a NumPy Generator (derived from the RngService, the session
+    one by default), or the RngService itself without NumPy.
+    """
+    rng = rng or get_rng()
+    if isinstance(rng, RngService):
+        return rng.numpy() if np is not None else rng
+    return rng
+
+
+class PokemonTable:
+    """
+    Struct-of-arrays view of many Pokemon: one integer column per stat, EV, id and state
+    (species, original species and types are stored as GameData / TypeChart ids, single type
+    Pokemon use TypeChart.no_type as second type). Pet names stay in a plain list.
+    Bulk operations (heal, level up, effort values) work on whole columns instead of Pokemon objects;
+    evolutions still go through the objects (to_pokemons).
+    """
+    def __init__(self, columns=None, pet_names=None):
+        columns = columns or {}
+        self.columns = {name : columns[name] if name in columns else new_column() for name in COLUMNS}
+        self.pet_names = list(pet_names or [])
+
+    def __len__(self):
+        return len(self.pet_names)
+
+    def __getitem__(self, column_name):
+        return self.columns[column_name]
+
+    # --- Converters ---
+
+    @classmethod
+    def from_rows(cls, rows, pet_names):
+        """Builds a table from rows of integers ordered like COLUMNS."""
+        values = {name : [] for name in COLUMNS}
+        for row in rows:
+            for name, value in zip(COLUMNS, row):
+                values[name].append(value)
+        return cls({name : new_column(column) for name, column in values.items()}, pet_names)
+
+    @classmethod
+    def from_dicts(cls, records):
+        """Builds a table from pokemon_dict() records (save files, wild pool)."""
+        game_data = get_game_data()
+        type_chart = get_type_chart()
+        rows, pet_names = [], []
+        for record in records:
+            type_ids = type_chart.get_type_ids(record["type"])
+            ev = record["ev"]
+            rows.append((
+                record["hp"], record["hp_max"], record["strength"], record["defense"], record["speed"],
+                record["xp"], record["level"], record["stage"],
+                ev["hp"], ev["strength"], ev["defense"], ev["speed"], ev["xp"],
+                game_data.get_species_id(record["name"]), game_data.get_species_id(record["original_name"]),
+                type_ids[0], type_ids[1] if len(type_ids) == 2 else type_chart.no_type,
+                STATES.index(record["state"])
+            ))
+            pet_names.append(record["pet_name"])
+        return cls.from_rows(rows, pet_names)
+
+    @classmethod
+    def from_pokemons(cls, pokemons):
+        """Builds a table from Pokemon objects."""
+        game_data = get_game_data()
+        type_chart = get_type_chart()
+        rows, pet_names = [], []
+        for pokemon in pokemons:
+            type_ids = pokemon.get_type_ids()
+            ev = pokemon.get_effort_value()
+            rows.append((
+                pokemon.get_hp(), pokemon.get_hp_max(), pokemon.get_strength(), pokemon.get_defense(),
+                pokemon.get_speed(), pokemon.get_xp(), pokemon.get_level(), pokemon.get_stage(),
+                ev.get_ev_hp(), ev.get_ev_strength(), ev.get_ev_defense(), ev.get_ev_speed(), ev.get_ev_xp(),
+                game_data.get_species_id(pokemon.name), game_data.get_species_id(pokemon.get_original_name()),
+                type_ids[0], type_ids[1] if len(type_ids) == 2 else type_chart.no_type,
+                STATES.index(pokemon.get_state())
+            ))
+            pet_names.append(pokemon.pet_name)
+        return cls.from_rows(rows, pet_names)
+
+    def to_dicts(self):
+        """Returns the rows as pokemon_dict() records, ready to be serialized."""
+        species_names = get_game_data().species_names
+        type_chart = get_type_chart()
+        values = {name : self.columns[name].tolist() for name in COLUMNS}
+        records = []
+        for index, pet_name in enumerate(self.pet_names):
+            pokemon_type = [type_chart.type_names[values["first_type"][index]]]
+            if values["second_type"][index] != type_chart.no_type:
+                pokemon_type.append(type_chart.type_names[values["second_type"][index]])
+            records.append({
+                "name" : species_names[values["species"][index]],
+                "original_name" : species_names[values["original"][index]],
+                "pet_name" : pet_name,
+                "hp_max" : values["hp_max"][index],
+                "hp" : values["hp"][index],
+                "xp" : values["xp"][index],
+                "strength" : values["strength"][index],
+                "defense" : values["defense"][index],
+                "type" : pokemon_type,
+                "level" : values["level"][index],
+                "speed" : values["speed"][index],
+                "stage" : values["stage"][index],
+                "ev" : {
+                    "hp" : values["ev_hp"][index],
+                    "strength" : values["ev_strength"][index],
+                    "defense" : values["ev_defense"][index],
+                    "speed" : values["ev_speed"][index],
+                    "xp" : values["ev_xp"][index]
+                },
+                "state" : STATES[values["state"][index]]
+            })
+        return records
+
+    def to_pokemons(self):
+        """Hydrates every row into a Pokemon object."""
+        return [instanciate_pokemon(record) for record in self.to_dicts()]
+
+    # --- Bulk operations ---
+
+    def heal_all(self, heal=None):
+        """Heals every Pokemon by heal HP (capped at hp_max), or fully when heal is None."""
+        hp, hp_max = self.columns["hp"], self.columns["hp_max"]
+        if np is not None:
+            self.columns["hp"] = hp_max.copy() if heal is None else np.minimum(hp + heal, hp_max)
+        else:
+            for index in range(len(hp)):
+                hp[index] = hp_max[index] if heal is None else min(hp[index] + heal, hp_max[index])
+
+    def level_up(self, rng=None):
+        """
+        Evolution.level_up on every row: a level is gained for each level**3 of XP (XP is kept),
+        and strength, defense, speed and hp_max each gain randrange(5 * levels, 15 * levels).
+        Returns the levels gained per row.
+        """
+        rng = resolve_rng(rng)
+        level = self.columns["level"]
+        new_level = get_xp_curve().resolve_levels(level, self.columns["xp"])
+        if np is not None:
+            add_level = new_level - level
+            gained = add_level > 0
+            for name in ("strength", "defense", "speed", "hp_max"):
+                self.columns[name][gained] += rng.integers(add_level[gained] * 5, add_level[gained] * 15)
+            self.columns["level"] = new_level
+            return add_level
+
+        add_levels = array('q', [0] * len(level))
+        for index in range(len(level)):
+            add_levels[index] = new_level[index] - level[index]
+            if add_levels[index]:
+                for name in ("strength", "defense", "speed", "hp_max"):
+                    self.columns[name][index] += rng.randrange(add_levels[index] * 5, add_levels[index] * 15)
+                level[index] = new_level[index]
+        return add_levels
+
+    def get_xp_gained(self, enemy):
+        """Pokemon.get_xp_gained for every row against the same enemy."""
+        enemy_level = enemy.get_level()
+        # Enemy of a higher level / lower level / same level
+        higher = int(math.floor(100 * enemy_level / (6 if enemy.get_state() == 'wild' else 5)))
+        lower = int(math.floor(100 * enemy_level / 9))
+        same = int(math.floor(100 * enemy_level / 7))
+
+        level = self.columns["level"]
+        if np is not None:
+            return np.where(enemy_level > level, higher, np.where(enemy_level < level, lower, same)).astype(np.int64)
+        return array('q', (higher if enemy_level > row_level else lower if enemy_level < row_level else same
+                           for row_level in level))
+
+    def award_xp(self, xp_gained, rng=None):
+        """
+        Batch XP award: adds xp_gained (a number or a column, one value per row) to every Pokemon,
+        then resolves the level ups in one pass. Returns the levels gained per row.
+        """
+        xp = self.columns["xp"]
+        if np is not None:
+            xp += np.asarray(xp_gained, dtype=np.int64)
+        else:
+            for index in range(len(xp)):
+                xp[index] += xp_gained if isinstance(xp_gained, int) else xp_gained[index]
+        return self.level_up(rng)
+
+    def apply_effort_values(self, enemy, rng=None):
+        """
+        EffortValue.update_ev on every row against the same defeated enemy: each EV gains
+        randrange(2r, 4r) with r = ceil(enemy stat / 6, 9 or 12) depending on the levels, then every
+        4 EV points above 4 turn into one stat point.
+        """
+        rng = resolve_rng(rng)
+        enemy_level = enemy.get_level()
+        enemy_stats = (enemy.get_hp_max(), enemy.get_strength(), enemy.get_defense(), enemy.get_speed(),
+                       enemy.get_xp())
+        level = self.columns["level"]
+
+        if np is not None:
+            divider = np.where(enemy_level > level, 6, np.where(enemy_level == level, 9, 12))
+            for (ev_name, stat_name), enemy_stat in zip(EV_TARGETS, enemy_stats):
+                rand_range = -(-enemy_stat // divider)
+                # randrange(0, 0) has no value: a zero range adds nothing
+                self.columns[ev_name] += rng.integers(rand_range * 2, rand_range * 4 + (rand_range == 0))
+            for ev_name, stat_name in EV_TARGETS:
+                ev, stat = self.columns[ev_name], self.columns[stat_name]
+                converting = ev > 4
+                stat[converting] += ev[converting] // 4
+                ev[converting] %= 4
+            return
+
+        for index in range(len(level)):
+            if enemy_level > level[index]:
+                value = 6
+            elif enemy_level == level[index]:
+                value = 9
+            else:
+                value = 12
+            for (ev_name, stat_name), enemy_stat in zip(EV_TARGETS, enemy_stats):
+                rand_range = math.ceil(enemy_stat / value)
+                if rand_range:
+                    self.columns[ev_name][index] += rng.randrange(rand_range * 2, rand_range * 4)
+            for ev_name, stat_name in EV_TARGETS:
+                ev, stat = self.columns[ev_name], self.columns[stat_name]
+                if ev[index] > 4:
+                    stat[index] += ev[index] // 4
+                    ev[index] %= 4
+
+    # --- Statistics ---
+
+    def type_counts(self):
+        """Number of Pokemon having each type (as first or second type)."""
+        type_chart = get_type_chart()
+        if np is not None:
+            size = type_chart.type_count + 1
+            counts = (np.bincount(self.columns["first_type"], minlength=size)
+                      + np.bincount(self.columns["second_type"], minlength=size)).tolist()
+        else:
+            counts = [0] * (type_chart.type_count + 1)
+            for type_id in self.columns["first_type"]:
+                counts[type_id] += 1
+            for type_id in self.columns["second_type"]:
+                counts[type_id] += 1
+        return {name : counts[type_id] for type_id, name in enumerate(type_chart.type_names) if counts[type_id]}
@@ -0,0 +1,125 @@
+import os, random, sys
+from array import array
+from __settings__ import RNG_SEED, RNG_BLOCK_SIZE
+
+try:
+    import numpy as np
+except ImportError: # NumPy is optional: only needed by the vectorized generators
+    np = None
+
+# 32-bit unsigned words
+WORD_TYPE = 'I' if array('I').itemsize == 4 else 'L'
+
+class RngService:
+    """
+    Seeded random source, injected in fights, generators and models instead of the global random module.
+    Numbers are taken from blocks of 32-bit words pre-drawn from a random.Random (one getrandbits call
+    per block), so two services with the same seed give exactly the same sequence.
+    Exposes the random module functions used by the game (randint, randrange, choice, shuffle, random).
+    """
+    def __init__(self, seed=None, block_size=RNG_BLOCK_SIZE):
+        if seed is None:
+            # 63 bits: fits the saves (SQLite integers are signed 64-bit)
+            seed = int.from_bytes(os.urandom(8), "little") >> 1
+        self.seed = seed
+        self.block_size = block_size
+        self.__random = random.Random(seed)
+        self.__block = array(WORD_TYPE)
+        self.__position = 0
+        self.__numpy = None
+
+    def __refill(self):
+        bits = self.__random.getrandbits(32 * self.block_size)
+        self.__block = array(WORD_TYPE, bits.to_bytes(4 * self.block_size, "little"))
+        if sys.byteorder == "big":
+            self.__block.byteswap()
+        self.__position = 0
+
+    def next_word(self):
+        """Next 32-bit random word of the block."""
+        if self.__position == len(self.__block):
+            self.__refill()
+        word = self.__block[self.__position]
+        self.__position += 1
+        return word
+
+    # --- random module API ---
+
+    def randbelow(self, n):
+        """Random int in [0, n), by multiply-shift on one word (two words for large n)."""
+        if n <= 0:
+            raise ValueError("empty range for randbelow()")
+        if n <= 1 << 16:
+            return (self.next_word() * n) >> 32
+        if n <= 1 << 32:
+            return (((self.next_word() << 32) | self.next_word()) * n) >> 64
+        return self.__random.randrange(n)
+
+    def randint(self, a, b):
+        return a + self.randbelow(b - a + 1)
+
+    def randrange(self, start, stop=None):
+        if stop is None:
+            start, stop = 0, start
+        if stop <= start:
+            raise ValueError(f"empty range for randrange() ({start}, {stop})")
+        return start + self.randbelow(stop - start)
+
+    def choice(self, seq):
+        if not seq:
+            raise IndexError("Cannot choose from an empty sequence")
+        return seq[self.randbelow(len(seq))]
+
+    def shuffle(self, x):
+        for index in range(len(x) - 1, 0, -1):
+            other = self.randbelow(index + 1)
+            x[index], x[other] = x[other], x[index]
+
+    def random(self):
+        """Float in [0, 1) with 53 random bits."""
+        return ((self.next_word() << 21) | (self.next_word() >> 11)) / 9007199254740992.0
+
+    # --- Derived sources ---
+
+    def spawn(self):
+        """Independent service seeded from this one (e.g. one per generator or background thread)."""
+        return RngService((self.next_word() << 32) | self.next_word(), self.block_size)
+
+    def numpy(self):
+        """NumPy Generator derived from this service (for the vectorized generators), None without NumPy."""
+        if np is not None and self.__numpy is None:
+            self.__numpy = np.random.default_rng((self.next_word() << 32) | self.next_word())
+        return self.__numpy
+
+
+_session_rng = None
+# Seed given on the command line (overrides RNG_SEED), and whether to replay the seed recorded in the save
+_seed_options = {"seed" : RNG_SEED, "from_save" : False}
+
+def set_seed_options(seed=None, from_save=False):
+    """Command line seeding: a fixed seed for the run, or the seed recorded in the loaded save."""
+    if seed is not None:
+        _seed_options["seed"] = seed
+        seed_session(seed)
+    _seed_options["from_save"] = from_save
+
+def choose_session_seed(saved_seed=None):
+    """Seed of a new game session: the fixed one, else the saved one when replaying, else None (fresh)."""
+    if _seed_options["seed"] is not None:
+        return _seed_options["seed"]
+    if _seed_options["from_save"]:
+        return saved_seed
+    return None
+
+def get_rng():
+    """Returns the RNG of the current session (seeded with RNG_SEED, or a fresh seed, on first use)."""
+    global _session_rng
+    if _session_rng is None:
+        _session_rng = RngService(_seed_options["seed"])
+    return _session_rng
+
+def seed_session(seed=None):
+    """Starts a new session RNG from seed (fresh seed when None) and returns it."""
+    global _session_rng
+    _session_rng = RngService(seed)
+    return _session_rng
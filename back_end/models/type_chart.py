@@ -0,0 +1,86 @@
+from array import array
+from ..data_access.game_data import get_game_data
+
+try:
+    import numpy as np
+except ImportError: # NumPy is optional: the flat arrays below are used instead
+    np = None
+
+EFFICIENCY_LABELS = {
+    4 : "Super effective attack",
+    2 : "Very effective attack",
+    1 : "Effective attack",
+    0.5 : "Not so effective attack",
+    0.25 : "Not so effective attack",
+    0 : "Impossible to attack"
+}
+
+class TypeChart:
+    """
+    coefficient.json compiled into integer-indexed tables.
+    Every type gets an integer id and every defender type combination (one or two types) a combo id,
+    so the coefficient of an attack is a single index in a precomputed (attack type x combination) table.
+        matrix              -> type x type coefficients (NumPy array when available, flat array otherwise)
+        combo_coefficients  -> attack type x combination coefficients, same storage
+    """
+    def __init__(self, coefficients):
+        self.type_names = tuple(coefficients.keys())
+        self.type_ids = {name : type_id for type_id, name in enumerate(self.type_names)}
+        self.type_count = len(self.type_names)
+        # A single type combination uses the extra "no second type" slot
+        self.no_type = self.type_count
+        self.combo_count = self.type_count * (self.type_count + 1)
+
+        size = self.type_count
+        flat_matrix = [coefficients[attack][defense] for attack in self.type_names for defense in self.type_names]
+
+        # (coefficient, efficiency label) for every attack type x defender combination, kept as Python
+        # values so a single fight gets exactly the numbers the JSON chart gives
+        self.__efficiency = []
+        for attack_id in range(size):
+            for first_id in range(size):
+                first = flat_matrix[attack_id * size + first_id]
+                for second_id in range(size + 1):
+                    coefficient = first if second_id == self.no_type else first * flat_matrix[attack_id * size + second_id]
+                    self.__efficiency.append((coefficient, EFFICIENCY_LABELS[coefficient]))
+        self.efficiency_labels = tuple(label for coefficient, label in self.__efficiency)
+
+        combo_coefficients = [float(coefficient) for coefficient, label in self.__efficiency]
+        if np is not None:
+            self.matrix = np.array(flat_matrix, dtype=np.float64).reshape(size, size)
+            self.combo_coefficients = np.array(combo_coefficients, dtype=np.float64).reshape(size, self.combo_count)
+        else:
+            self.matrix = array('d', flat_matrix)
+            self.combo_coefficients = array('d', combo_coefficients)
+
+    # --- Ids ---
+
+    def get_type_id(self, type_name):
+        return self.type_ids[type_name]
+
+    def get_type_ids(self, type_list):
+        return tuple(self.type_ids[type_name] for type_name in type_list)
+
+    def get_combo_id(self, type_ids):
+        """Combination id of a defender from its type ids (one or two types)."""
+        second_id = type_ids[1] if len(type_ids) == 2 else self.no_type
+        return type_ids[0] * (self.type_count + 1) + second_id
+
+    # --- Lookups ---
+
+    def get_coefficient(self, attack_id, combo_id):
+        return self.__efficiency[attack_id * self.combo_count + combo_id][0]
+
+    def get_efficiency(self, attack_id, combo_id):
+        """Returns (coefficient, efficiency label) for an attack type against a defender combination."""
+        return self.__efficiency[attack_id * self.combo_count + combo_id]
+
+
+_type_chart = None
+
+def get_type_chart():
+    """Returns the process-wide TypeChart, compiled from the game data on first use."""
+    global _type_chart
+    if _type_chart is None:
+        _type_chart = TypeChart(get_game_data().coefficients)
+    return _type_chart
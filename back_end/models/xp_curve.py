@@ -0,0 +1,63 @@
+import math
+from array import array
+from bisect import bisect_right
+
+try:
+    import numpy as np
+except ImportError: # NumPy is optional: batches are resolved one by one with bisect
+    np = None
+
+# Levels covered by the precomputed table, higher ones use the closed form
+TABLE_MAX_LEVEL = 1000
+
+def cumulative_xp(level):
+    """XP needed to go from level 1 to level + 1: 1**3 + ... + level**3 = (level * (level + 1) / 2)**2."""
+    return (level * (level + 1) // 2) ** 2
+
+class XpCurve:
+    """
+    Level curve of the Pokemon: leaving level n costs n**3 XP.
+    Evolution.level_up used to subtract the cubes one level at a time; with the cumulative table
+    the level reached by an amount of XP is a single bisect (or closed form past the table).
+    """
+    def __init__(self, max_level=TABLE_MAX_LEVEL):
+        self.max_level = max_level
+        # cumulative[n] = XP spent to leave levels 1..n
+        self.cumulative = array('q', (cumulative_xp(level) for level in range(max_level + 1)))
+        if np is not None:
+            self.cumulative_array = np.array(self.cumulative, dtype=np.int64)
+
+    def resolve_level(self, level, xp):
+        """
+        Level reached by a Pokemon of that level holding xp points (the XP itself is kept):
+        as many levels as the following cubes fit in xp.
+        """
+        target = xp + cumulative_xp(level - 1)
+        if target < self.cumulative[-1]:
+            return max(bisect_right(self.cumulative, target), level)
+        # Closed form: the largest n with (n(n+1)/2)**2 <= target, then one level more
+        triangle = math.isqrt(target)
+        return max((math.isqrt(8 * triangle + 1) - 1) // 2 + 1, level)
+
+    def resolve_levels(self, levels, xps):
+        """Batch resolve_level over two integer columns (NumPy arrays or sequences)."""
+        if np is None:
+            return array('q', (self.resolve_level(level, xp) for level, xp in zip(levels, xps)))
+
+        levels = np.asarray(levels, dtype=np.int64)
+        targets = np.asarray(xps, dtype=np.int64) + ((levels - 1) * levels // 2) ** 2
+        new_levels = np.maximum(np.searchsorted(self.cumulative_array, targets, side='right'), levels)
+        # Rows past the table (very rare) go through the closed form
+        for index in np.flatnonzero(targets >= self.cumulative[-1]):
+            new_levels[index] = self.resolve_level(int(levels[index]), int(xps[index]))
+        return new_levels
+
+
+_xp_curve = None
+
+def get_xp_curve():
+    """Returns the process-wide XpCurve, building the cumulative table on first use."""
+    global _xp_curve
+    if _xp_curve is None:
+        _xp_curve = XpCurve()
+    return _xp_curve
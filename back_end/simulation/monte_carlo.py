@@ -0,0 +1,283 @@
+"""
+Monte Carlo balance simulator.
+Plays wild battles with the BattleEngine for every (player species, level) x (enemy species, level)
+matchup of the sweep, across a process pool, and reports the win rates, mean turns, XP per battle
+and capture success by enemy HP ratio, as CSV or JSON.
+
+    python -m back_end.simulation.monte_carlo --types fire,water,grass --levels 5,20 --battles 1000
+    python -m back_end.simulation.monte_carlo --species Pikachu --enemy-types rock --player-policy capture:0.5 --format json
+
+Every worker builds its own game data and aggregates its battles locally; the parent only adds up
+the returned counters, so a run scales with the number of cores. Each chunk of battles has its own
+seed drawn from --seed, which makes a run reproducible whatever the number of workers.
+"""
+
+import argparse, csv, io, json, os, sys
+from multiprocessing import Pool
+from ..data_access.game_data import get_game_data
+from ..generate_pokemon.create_pokemon import create_species_pokemon
+from ..models.bag import Bag
+from ..models.battle_engine import BattleEngine
+from ..models.rng import RngService
+from .policies import get_player_policy, get_enemy_policy, PLAYER_POLICIES, ENEMY_POLICIES
+
+# Battles played by one task, at most
+CHUNK_BATTLES = 500
+# Steps after which a battle counts as unfinished
+MAX_TURNS = 1000
+# Capture attempts are counted per tenth of the enemy HP ratio
+HP_RATIO_BUCKETS = 10
+
+# Counters of a matchup, in this order
+MATCHUP_FIELDS = ("battles", "player_wins", "enemy_wins", "captures", "unfinished", "turns", "xp")
+
+def base_species(types=None):
+    """Base species (first stage) names of the game, restricted to those having one of types."""
+    game_data = get_game_data()
+    names = []
+    for name, evolution_stage in game_data.evolution_stages.items():
+        species = game_data.get_base_species(name)
+        if evolution_stage[name] != 1 or species is None:
+            continue
+        if types is None or species[0] in types or species[1] in types:
+            names.append(name)
+    return names
+
+def build_cells(species=None, types=None, levels=(5,)):
+    """(species name, level) cells of a sweep: the given species, else the base species of types."""
+    if species is None:
+        species = base_species(types)
+    for name in species:
+        if get_game_data().get_base_species(name) is None:
+            raise ValueError(f"{name} is not a base species")
+    return [(name, level) for name in species for level in levels]
+
+def new_stats(matchups=()):
+    return {
+        "matchups" : {matchup : [0] * len(MATCHUP_FIELDS) for matchup in matchups},
+        "capture_attempts" : [0] * HP_RATIO_BUCKETS,
+        "capture_successes" : [0] * HP_RATIO_BUCKETS
+    }
+
+def merge_stats(total, stats):
+    """Adds the counters of stats into total."""
+    for matchup, counters in stats["matchups"].items():
+        total_counters = total["matchups"].setdefault(matchup, [0] * len(MATCHUP_FIELDS))
+        for index, value in enumerate(counters):
+            total_counters[index] += value
+    for key in ("capture_attempts", "capture_successes"):
+        for index, value in enumerate(stats[key]):
+            total[key][index] += value
+    return total
+
+def play_battle(player_cell, enemy_cell, player_policy, enemy_policy, rng, stats):
+    """Plays one battle of the matchup and adds its outcome to stats."""
+    pokemon = create_species_pokemon(*player_cell, rng)
+    enemy = create_species_pokemon(*enemy_cell, rng)
+    start_xp = pokemon.get_xp()
+    engine = BattleEngine(pokemon, enemy, Bag(), rng=rng, enemy_policy=enemy_policy)
+
+    turns = 0
+    while not engine.over and turns < MAX_TURNS:
+        if engine.player_turn:
+            action = player_policy(engine)
+            if action == "pokeball":
+                bucket = min(int(enemy.get_hp() / enemy.get_hp_max() * HP_RATIO_BUCKETS), HP_RATIO_BUCKETS - 1)
+                stats["capture_attempts"][bucket] += 1
+                engine.step(action)
+                stats["capture_successes"][bucket] += engine.captured
+            else:
+                engine.step(action)
+        else:
+            engine.step()
+        turns += 1
+
+    counters = stats["matchups"][(player_cell, enemy_cell)]
+    counters[0] += 1
+    counters[1] += engine.winner == "player"
+    counters[2] += engine.winner == "enemy"
+    counters[3] += engine.captured
+    counters[4] += not engine.over
+    counters[5] += turns
+    counters[6] += pokemon.get_xp() - start_xp
+
+
+_worker_options = {}
+
+def init_worker(player_policy, enemy_policy):
+    """Pool initializer: every worker resolves its policies (and loads the game data) once."""
+    _worker_options["player_policy"] = get_player_policy(player_policy)
+    _worker_options["enemy_policy"] = get_enemy_policy(enemy_policy)
+    get_game_data()
+
+def run_task(task):
+    """Plays count battles of one matchup and returns the counters of this task only."""
+    player_cell, enemy_cell, count, seed = task
+    rng = RngService(seed)
+    stats = new_stats([(player_cell, enemy_cell)])
+    for index in range(count):
+        play_battle(player_cell, enemy_cell, _worker_options["player_policy"], _worker_options["enemy_policy"], rng, stats)
+    return stats
+
+def build_tasks(player_cells, enemy_cells, battles, seed=None):
+    """Chunks of at most CHUNK_BATTLES battles per matchup, each with its own seed."""
+    rng = RngService(seed)
+    tasks = []
+    for player_cell in player_cells:
+        for enemy_cell in enemy_cells:
+            for start in range(0, battles, CHUNK_BATTLES):
+                tasks.append((player_cell, enemy_cell, min(CHUNK_BATTLES, battles - start), rng.spawn().seed))
+    return tasks
+
+def simulate(player_cells, enemy_cells, battles, player_policy="best_type", enemy_policy="random_type",
+             workers=None, seed=None):
+    """Plays battles per matchup over workers processes (in this process with workers=1), returns the merged stats."""
+    tasks = build_tasks(player_cells, enemy_cells, battles, seed)
+    total = new_stats()
+    if workers == 1:
+        init_worker(player_policy, enemy_policy)
+        for task in tasks:
+            merge_stats(total, run_task(task))
+        return total
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(tasks) // (workers * 8))
+    with Pool(workers, init_worker, (player_policy, enemy_policy)) as pool:
+        for stats in pool.imap_unordered(run_task, tasks, chunksize):
+            merge_stats(total, stats)
+    return total
+
+# --- Reports ---
+
+def cell_label(cell):
+    return f"{cell[0]} L{cell[1]}"
+
+def matchup_rows(stats):
+    """One dict per matchup with its rates and means."""
+    rows = []
+    for (player_cell, enemy_cell), counters in stats["matchups"].items():
+        values = dict(zip(MATCHUP_FIELDS, counters))
+        battles = values["battles"] or 1
+        rows.append({
+            "player" : player_cell[0],
+            "player_level" : player_cell[1],
+            "enemy" : enemy_cell[0],
+            "enemy_level" : enemy_cell[1],
+            "battles" : values["battles"],
+            "player_win_rate" : round(values["player_wins"] / battles, 4),
+            "enemy_win_rate" : round(values["enemy_wins"] / battles, 4),
+            "capture_rate" : round(values["captures"] / battles, 4),
+            "unfinished" : values["unfinished"],
+            "mean_turns" : round(values["turns"] / battles, 2),
+            "mean_xp" : round(values["xp"] / battles, 2)
+        })
+    return sorted(rows, key=lambda row: (row["player"], row["player_level"], row["enemy"], row["enemy_level"]))
+
+def capture_rows(stats):
+    rows = []
+    for bucket in range(HP_RATIO_BUCKETS):
+        attempts = stats["capture_attempts"][bucket]
+        successes = stats["capture_successes"][bucket]
+        rows.append({
+            "hp_ratio" : f"{bucket / HP_RATIO_BUCKETS:.1f}-{(bucket + 1) / HP_RATIO_BUCKETS:.1f}",
+            "attempts" : attempts,
+            "successes" : successes,
+            "success_rate" : round(successes / attempts, 4) if attempts else None
+        })
+    return rows
+
+def build_report(stats, player_cells, enemy_cells, options):
+    """JSON report: player x enemy matrices (rows follow player_cells, columns enemy_cells) and the capture table."""
+    def matrix(field, rounding):
+        counters = stats["matchups"]
+        return [[round(counters[(player_cell, enemy_cell)][MATCHUP_FIELDS.index(field)]
+                       / (counters[(player_cell, enemy_cell)][0] or 1), rounding)
+                 for enemy_cell in enemy_cells] for player_cell in player_cells]
+
+    return {
+        "options" : options,
+        "battles" : sum(counters[0] for counters in stats["matchups"].values()),
+        "players" : [cell_label(cell) for cell in player_cells],
+        "enemies" : [cell_label(cell) for cell in enemy_cells],
+        "win_rate" : matrix("player_wins", 4),
+        "mean_turns" : matrix("turns", 2),
+        "mean_xp" : matrix("xp", 2),
+        "capture_by_hp_ratio" : capture_rows(stats)
+    }
+
+def to_csv(rows):
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=list(rows[0].keys()) if rows else [])
+    writer.writeheader()
+    writer.writerows(rows)
+    return output.getvalue()
+
+def write_report(stats, player_cells, enemy_cells, options, report_format, path=None):
+    """
+    Writes the report to path (stdout without path).
+    CSV gives one row per matchup, the capture table going to <path>_capture.csv (after a blank line on stdout).
+    """
+    if report_format == "json":
+        text = json.dumps(build_report(stats, player_cells, enemy_cells, options), indent=4)
+        captures = None
+    else:
+        text = to_csv(matchup_rows(stats))
+        captures = to_csv(capture_rows(stats))
+
+    if path is None:
+        sys.stdout.write(text if captures is None else text + "\n" + captures)
+        return
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        file.write(text)
+    if captures is not None:
+        root, extension = os.path.splitext(path)
+        with open(root + "_capture" + (extension or ".csv"), "w", newline="", encoding="utf-8") as file:
+            file.write(captures)
+
+
+def parse_list(text, convert=str):
+    return [convert(value.strip()) for value in text.split(",") if value.strip()] if text else None
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo balance simulator of the wild battles")
+    parser.add_argument("--species", help="player species, comma separated (default: every base species of --types)")
+    parser.add_argument("--types", help="player types, comma separated (default: every type)")
+    parser.add_argument("--levels", default="5", help="player levels, comma separated")
+    parser.add_argument("--enemy-species", help="enemy species (default: the player sweep)")
+    parser.add_argument("--enemy-types", help="enemy types (default: the player sweep)")
+    parser.add_argument("--enemy-levels", help="enemy levels (default: the player levels)")
+    parser.add_argument("--battles", type=int, default=100, help="battles per matchup")
+    parser.add_argument("--player-policy", default="best_type",
+                        help=f"one of {', '.join(PLAYER_POLICIES)} (capture:<hp ratio> to change the threshold)")
+    parser.add_argument("--enemy-policy", default="random_type", choices=list(ENEMY_POLICIES))
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per core, 1 runs in process)")
+    parser.add_argument("--seed", type=int, help="seed of the whole run")
+    parser.add_argument("--format", default="csv", choices=["csv", "json"])
+    parser.add_argument("--output", help="report file (default: stdout)")
+    args = parser.parse_args(argv)
+    try:
+        get_player_policy(args.player_policy)
+    except ValueError as error:
+        parser.error(str(error))
+
+    levels = parse_list(args.levels, int)
+    try:
+        player_cells = build_cells(parse_list(args.species), parse_list(args.types), levels)
+        if args.enemy_species or args.enemy_types or args.enemy_levels:
+            enemy_cells = build_cells(parse_list(args.enemy_species), parse_list(args.enemy_types),
+                                      parse_list(args.enemy_levels, int) or levels)
+        else:
+            enemy_cells = player_cells
+    except ValueError as error:
+        parser.error(str(error))
+    if not player_cells or not enemy_cells:
+        parser.error("the sweep has no species")
+
+    seed = args.seed if args.seed is not None else RngService().seed
+    stats = simulate(player_cells, enemy_cells, args.battles, args.player_policy, args.enemy_policy, args.workers, seed)
+    options = {"seed" : seed, "battles_per_matchup" : args.battles,
+               "player_policy" : args.player_policy, "enemy_policy" : args.enemy_policy}
+    write_report(stats, player_cells, enemy_cells, options, args.format, args.output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Policies of the simulated battles, picked by name on the command line.
+A player policy returns the action given to BattleEngine.step, an enemy policy the attack type
+of the enemy turn (None keeps the game's rule: a random type among the enemy's types, or the
+expectimax bot with BOT_MODE = "expectimax").
+"""
+
+from ..models.battle_engine import ATTACK, POKEBALL, first_type_policy
+from ..models.battle_ai import get_expectimax_bot
+
+# Enemy HP ratio under which the capture policy throws a pokeball
+CAPTURE_HP_RATIO = 0.3
+
+def best_type(pokemon, enemy):
+    """Type of pokemon with the best coefficient against enemy (first listed on ties)."""
+    return max(pokemon.type, key=lambda attack_type: pokemon.get_attack_coefficient(attack_type, enemy))
+
+def best_type_policy(engine):
+    return (ATTACK, best_type(engine.pokemon, engine.enemy))
+
+def random_type_policy(engine):
+    return (ATTACK, engine.fight.rng.choice(engine.pokemon.type))
+
+def capture_policy(engine, hp_ratio=CAPTURE_HP_RATIO):
+    """Best attack until the enemy is under hp_ratio of its HP, then pokeballs (while the bag has some)."""
+    enemy = engine.enemy
+    if engine.bag is not None and engine.bag.get_pokeball() > 0 and enemy.get_hp() <= hp_ratio * enemy.get_hp_max():
+        return POKEBALL
+    return best_type_policy(engine)
+
+def enemy_best_type_policy(engine):
+    return best_type(engine.enemy, engine.pokemon)
+
+def enemy_first_type_policy(engine):
+    return engine.enemy.type[0]
+
+def enemy_expectimax_policy(engine):
+    return get_expectimax_bot().choose_attack(engine.enemy, engine.pokemon)
+
+
+PLAYER_POLICIES = {
+    "first_type" : first_type_policy,
+    "best_type" : best_type_policy,
+    "random_type" : random_type_policy,
+    "capture" : capture_policy
+}
+
+ENEMY_POLICIES = {
+    "random_type" : None,
+    "first_type" : enemy_first_type_policy,
+    "best_type" : enemy_best_type_policy,
+    "expectimax" : enemy_expectimax_policy
+}
+
+def get_player_policy(name):
+    """Player policy by name; "capture:0.5" is the capture policy with another HP ratio."""
+    name, _, argument = name.partition(":")
+    if name not in PLAYER_POLICIES:
+        raise ValueError(f"Unknown player policy: {name} (one of {', '.join(PLAYER_POLICIES)})")
+    if name == "capture" and argument:
+        hp_ratio = float(argument)
+        return lambda engine: capture_policy(engine, hp_ratio)
+    return PLAYER_POLICIES[name]
+
+def get_enemy_policy(name):
+    if name not in ENEMY_POLICIES:
+        raise ValueError(f"Unknown enemy policy: {name} (one of {', '.join(ENEMY_POLICIES)})")
+    return ENEMY_POLICIES[name]
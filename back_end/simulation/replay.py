@@ -0,0 +1,53 @@
+"""
+Replay runner: re-executes the recorded battles of a player headlessly and checks that each one
+ends in the recorded state (HP after every step, outcome and final checksum). A battle that no
+longer replays points to a change of the battle rules. --repeat times the replays.
+
+    python -m back_end.simulation.replay <player> [--repeat N] [--replay-dir DIR]
+"""
+
+import argparse, sys, time
+from ..data_access.replay_store import load_replays
+from ..models.battle_log import BattleLog, ReplayMismatch, replay
+from __settings__ import REPLAY_DIR
+
+def replay_all(replays, verify=True):
+    """Replays every encoded battle, returns the (index, error message) of those that did not match."""
+    mismatches = []
+    for index, data in enumerate(replays):
+        try:
+            replay(data, verify)
+        except ReplayMismatch as error:
+            mismatches.append((index, str(error)))
+    return mismatches
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replays the recorded battles of a player")
+    parser.add_argument("player")
+    parser.add_argument("--repeat", type=int, default=1, help="replays every battle this many times (benchmark)")
+    parser.add_argument("--replay-dir", default=REPLAY_DIR)
+    args = parser.parse_args(argv)
+
+    replays = load_replays(args.player, args.replay_dir)
+    if not replays:
+        print(f"No recorded battle for {args.player}")
+        return 1
+
+    mismatches = replay_all(replays)
+    for index, message in mismatches:
+        print(f"Battle {index}: {message}")
+    steps = sum(len(BattleLog(data).steps) for data in replays)
+    print(f"{len(replays) - len(mismatches)}/{len(replays)} battles replayed identically ({steps} steps)")
+
+    if args.repeat > 1:
+        logs = [BattleLog(data) for data in replays]
+        start = time.perf_counter()
+        for repeat in range(args.repeat):
+            for log in logs:
+                replay(log, verify=False)
+        elapsed = time.perf_counter() - start
+        print(f"{len(logs) * args.repeat / elapsed:.0f} battles/s, {steps * args.repeat / elapsed:.0f} steps/s")
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,227 @@
+import pygame
+from collections import OrderedDict
+from __settings__ import ASSET_CACHE_MAX_BYTES, TRANSFORM_CACHE_MAX_BYTES, BACKGROUND_CACHE_SIZE
+
+class AssetCache:
+    """
+    Decoded images, loaded from disk once per path and converted to the display format
+    (convert_alpha for images with transparency, convert otherwise) so blits need no conversion.
+    Surfaces are evicted least recently used first once their total size exceeds max_bytes.
+    The returned surfaces are shared: callers must not modify them (scale, flip or copy them first).
+    """
+    def __init__(self, max_bytes=ASSET_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__surfaces = OrderedDict()
+
+    def __len__(self):
+        return len(self.__surfaces)
+
+    def __contains__(self, path):
+        return path in self.__surfaces
+
+    def load(self, path):
+        """Returns the surface of the image at path, decoding it on the first request only."""
+        surface = self.__surfaces.get(path)
+        if surface is not None:
+            self.hits += 1
+            self.__surfaces.move_to_end(path)
+            return surface
+
+        self.misses += 1
+        surface = self.__convert(pygame.image.load(path))
+        self.__surfaces[path] = surface
+        self.total_bytes += self.surface_bytes(surface)
+        self.__evict()
+        return surface
+
+    def __convert(self, surface):
+        # convert() needs a display mode (not set yet in tools and at import time)
+        if pygame.display.get_surface() is None:
+            return surface
+        if surface.get_flags() & pygame.SRCALPHA or surface.get_colorkey() is not None:
+            return surface.convert_alpha()
+        return surface.convert()
+
+    def __evict(self):
+        # The surface just loaded stays, even alone above the limit
+        while self.total_bytes > self.max_bytes and len(self.__surfaces) > 1:
+            path, surface = self.__surfaces.popitem(last=False)
+            self.total_bytes -= self.surface_bytes(surface)
+            self.evictions += 1
+
+    @staticmethod
+    def surface_bytes(surface):
+        return surface.get_pitch() * surface.get_height()
+
+    def clear(self):
+        self.__surfaces.clear()
+        self.total_bytes = 0
+
+    def stats(self):
+        """Counters of the cache, e.g. for a debug overlay or a benchmark."""
+        requests = self.hits + self.misses
+        return {
+            "surfaces" : len(self.__surfaces),
+            "bytes" : self.total_bytes,
+            "hits" : self.hits,
+            "misses" : self.misses,
+            "evictions" : self.evictions,
+            "hit_rate" : self.hits / requests if requests else 0.0
+        }
+
+
+class TransformCache:
+    """
+    Flipped, scaled and colorkeyed copies of surfaces, keyed on (source surface, size, flip, colorkey),
+    so a sprite drawn at the same size every frame is transformed once.
+    Sources are matched by identity: pass the shared surfaces of AssetCache, not fresh copies.
+    Sizes depend on the screen: set_screen_size drops every copy when the screen size changes.
+    """
+    def __init__(self, max_bytes=TRANSFORM_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.screen_size = None
+        self.__surfaces = OrderedDict()
+
+    def __len__(self):
+        return len(self.__surfaces)
+
+    def set_screen_size(self, size):
+        if size != self.screen_size:
+            self.clear()
+            self.screen_size = size
+
+    def transform(self, surface, size, flip_x=False, flip_y=False, colorkey=None):
+        """Returns surface flipped, scaled to size then with colorkey (None for none)."""
+        size = (int(size[0]), int(size[1]))
+        key = (id(surface), size, flip_x, flip_y, colorkey)
+        entry = self.__surfaces.get(key)
+        # The entry keeps its source alive, so its id cannot be reused by another surface
+        if entry is not None and entry[0] is surface:
+            self.hits += 1
+            self.__surfaces.move_to_end(key)
+            return entry[1]
+
+        self.misses += 1
+        if entry is not None:
+            self.__discard(key)
+        transformed = surface
+        if flip_x or flip_y:
+            transformed = pygame.transform.flip(transformed, flip_x, flip_y)
+        transformed = pygame.transform.scale(transformed, size)
+        if colorkey is not None:
+            transformed.set_colorkey(colorkey)
+        self.__surfaces[key] = (surface, transformed)
+        self.total_bytes += AssetCache.surface_bytes(transformed)
+        self.__evict()
+        return transformed
+
+    def __discard(self, key):
+        source, transformed = self.__surfaces.pop(key)
+        self.total_bytes -= AssetCache.surface_bytes(transformed)
+
+    def __evict(self):
+        while self.total_bytes > self.max_bytes and len(self.__surfaces) > 1:
+            self.__discard(next(iter(self.__surfaces)))
+            self.evictions += 1
+
+    def clear(self):
+        self.__surfaces.clear()
+        self.total_bytes = 0
+
+    def stats(self):
+        requests = self.hits + self.misses
+        return {
+            "surfaces" : len(self.__surfaces),
+            "bytes" : self.total_bytes,
+            "hits" : self.hits,
+            "misses" : self.misses,
+            "evictions" : self.evictions,
+            "hit_rate" : self.hits / requests if requests else 0.0
+        }
+
+
+class BackgroundCache:
+    """
+    Full-screen backgrounds, scaled to the screen resolution with their black overlay (alpha,
+    None for none) already drawn on, so drawing a background is a single opaque blit.
+    The max_size least recently used are kept.
+    """
+    def __init__(self, assets, max_size=BACKGROUND_CACHE_SIZE):
+        self.assets = assets
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.__surfaces = OrderedDict()
+
+    def __len__(self):
+        return len(self.__surfaces)
+
+    def get(self, path, size, overlay_alpha=None, smooth=False):
+        key = (path, size, overlay_alpha, smooth)
+        surface = self.__surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.__surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+        # Drawn as on the cleared screen: transparent pixels of the image stay black
+        surface = pygame.Surface(size)
+        surface.blit(scale(self.assets.load(path), size), (0, 0))
+        if overlay_alpha is not None:
+            overlay = pygame.Surface(size)
+            overlay.set_alpha(overlay_alpha)
+            surface.blit(overlay, (0, 0))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        self.__surfaces[key] = surface
+        if len(self.__surfaces) > self.max_size:
+            self.__surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.__surfaces.clear()
+
+    def stats(self):
+        requests = self.hits + self.misses
+        return {
+            "surfaces" : len(self.__surfaces),
+            "hits" : self.hits,
+            "misses" : self.misses,
+            "hit_rate" : self.hits / requests if requests else 0.0
+        }
+
+
+_asset_cache = None
+_transform_cache = None
+_background_cache = None
+
+def get_asset_cache():
+    """Returns the process-wide AssetCache."""
+    global _asset_cache
+    if _asset_cache is None:
+        _asset_cache = AssetCache()
+    return _asset_cache
+
+def get_transform_cache():
+    """Returns the process-wide TransformCache."""
+    global _transform_cache
+    if _transform_cache is None:
+        _transform_cache = TransformCache()
+    return _transform_cache
+
+def get_background_cache():
+    """Returns the process-wide BackgroundCache (loading through the AssetCache)."""
+    global _background_cache
+    if _background_cache is None:
+        _background_cache = BackgroundCache(get_asset_cache())
+    return _background_cache
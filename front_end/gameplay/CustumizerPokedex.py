@@ -1,5 +1,6 @@
 import pygame
 from .pokedexUIbase import PokedexUIBase
+from front_end.text_cache import get_font_registry, get_text_cache
 
 
 class CustomizerPokedex(PokedexUIBase):
@@ -219,7 +220,7 @@ class CustomizerPokedex(PokedexUIBase):
 
         gap = 8
         count = len(types)
-        font = pygame.font.Font(None, 20)
+        font = get_font_registry().get(None, 20)
 
         # Calculate the required width for each badge based on text length
         widths = []
@@ -233,7 +234,7 @@ class CustomizerPokedex(PokedexUIBase):
             w = widths[i]
             rect = pygame.Rect(cur_x, y, w, badge_h)
             pygame.draw.rect(screen, self.get_type_color(t_norm), rect, border_radius=badge_h // 2)
-            txt = font.render(t_norm.upper(), True, self.colors['white'])
+            txt = get_text_cache().render(t_norm.upper(), None, 20, self.colors['white'])
             screen.blit(txt, txt.get_rect(center=rect.center))
             cur_x += w + gap
 
@@ -5,12 +5,14 @@ from .player import Player
 from .CustumizerPokedex import CustomizerPokedex
 from .pokedexButton import PokedexButton
 from front_end.menu.pause_menu import PauseMenu
+from back_end.controller import flush_saves, start_session_rng
 
 
 class Game:
     def __init__(self, screen, player_name, pokemon, pokedex):
         self.running = True
         self.screen = screen
+        start_session_rng(player_name)
         self.map: Map = Map(self.screen)
         self.keylistener = KeyListener()
         self.player: Player = Player(self.keylistener, self.screen, 100, 300, player_name, pokemon)
@@ -54,8 +56,8 @@ class Game:
         new_discoveries = 0
         unresolved = []
 
-        for poke in pokemon_to_process:
-            pokemon_id = self._resolve_id_from_save(poke)
+        pokemon_ids = self.pokedex.get_species_resolver().resolve(pokemon_to_process)
+        for poke, pokemon_id in zip(pokemon_to_process, pokemon_ids):
             if pokemon_id:
                 if self.discover_pokemon(pokemon_id):
                     new_discoveries += 1
@@ -70,27 +72,7 @@ class Game:
             print(f"⚠ Unresolved Pokémon (missing from POKEMON_NAME_TO_ID): {unresolved}")
 
     def _resolve_id_from_save(self, poke) -> int | None:
-        def get_attr(key):
-            if isinstance(poke, dict):
-                return poke.get(key, '')
-            return str(getattr(poke, key, ''))
-
-        pid = get_attr('id')
-        if pid:
-            try:
-                return int(pid)
-            except (ValueError, TypeError):
-                pass
-
-        all_pokemon = {p.get('name', '').lower(): p.get('id')
-                       for p in self.pokedex.get_all_pokemon()}
-
-        for field in ('name', 'original_name'):
-            name = get_attr(field).strip().lower()
-            if name and name in all_pokemon:
-                return all_pokemon[name]
-
-        return None
+        return self.pokedex.get_species_resolver().resolve_one(poke)
 
     # ─────────────────────────────────────────────────────────────
     #  Main loop
@@ -167,6 +149,7 @@ class Game:
         result_player, result_pokemon, result_pokedex = pause_menu.display()
         if result_player is None and result_pokemon is None:
             print(" Returning to main menu...")
+            flush_saves()
             self.running = False
         else:
             if result_player:
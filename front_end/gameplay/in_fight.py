@@ -6,9 +6,10 @@ from front_end.menu.attack_type_menu import AttackMenu
 from front_end.menu.infomenu import InfoMenu
 from front_end.menu.change_pokemon_infight import ChangePokemonInFight
 from front_end.gameplay.healthdisplay import HealthDisplay
-from back_end.models.fight import Fight
+from back_end.models.battle_engine import BattleEngine, ATTACK, POTION, POKEBALL, SWITCH, FLEE
 from back_end.controller import save_pokemon_to_pokedex, get_random_wild_pokemon,\
-    get_bag_from_pokedex, save_bag_to_pokedex, save_wild_pokemon
+    get_bag_from_pokedex, save_bag_to_pokedex, save_wild_pokemon, flush_saves,\
+    new_battle_rng, new_battle_recorder, save_battle_replay
 
 class InFight():
     def __init__(self, screen, player, pokemon):
@@ -32,14 +33,15 @@ class InFight():
             self.pokemon = pokemon
 
         self.bag = get_bag_from_pokedex(self.player)
-        self.fight = Fight(self.pokemon, self.pokemon_enemy)
+        self.recorder = new_battle_recorder()
+        self.engine = BattleEngine(self.pokemon, self.pokemon_enemy, self.bag, self.team,
+                                   rng=new_battle_rng(), recorder=self.recorder)
         self.util = UtilTool()
         self.fleeing = False
         self.healthbar = HealthDisplay()
 
     def display(self):
         battle_floor = self.util.load_image(BATTLE_FLOOR)
-        battle_floor2 = pygame.transform.flip(battle_floor, True, False)
         
         pokemon_enemy = self.util.load_image(self.pokemon_enemy.image)
         time_count = 0
@@ -49,10 +51,8 @@ class InFight():
         win = False
         message_damage = None
         message_attack = None
-        another_option = ""
         level = self.pokemon.get_level()
         name = self.pokemon.name
-        winner = ""
         pokemon_hp_max = self.pokemon.get_hp_max()
         pokemon_enemy_hp_max = self.pokemon_enemy.get_hp_max()
       
@@ -61,10 +61,6 @@ class InFight():
         pokemon_enemy_x = int(self.screen.width // 10 * 7.5)               
         pokemon_enemy_y = int(self.screen.height // 10)
 
-        player_turn = False
-        if self.fight.is_player_first():
-            player_turn = True
-
         while self.running: 
             pokemon = self.util.load_image(self.pokemon.get_back_image())
             
@@ -73,7 +69,7 @@ class InFight():
                 time_count += speed
                 x_movement = int(var_y * math.sin(time_count * 0.1))
                 y_movement = int(var_x * math.sin(time_count * 0.08))
-            self.util.display_assets_and_background_in_fight(self.screen, x_movement, y_movement, battle_floor, battle_floor2, pokemon_enemy, pokemon)
+            self.util.display_assets_and_background_in_fight(self.screen, x_movement, y_movement, battle_floor, pokemon_enemy, pokemon)
           
             self.healthbar.draw_health_bar(my_pokemon_x, my_pokemon_y, self.pokemon, pokemon_hp_max,\
                                            self.screen, (self.screen.width // 16 * 2.5, self.screen.height // 20 * 2))
@@ -92,20 +88,15 @@ class InFight():
             if win:
                 self.options[-1] = "Exit"
                 self.fleeing = False
-                if winner == "enemy":
+                if self.engine.winner == "enemy":
                     self.util.draw_win_bot_screen(self.screen)
-                elif another_option == "Success":
+                elif self.engine.captured:
                     self.util.draw_win_capture_screen(self.pokemon_enemy, self.pokemon, level, name, self.screen)
                 else:
                     self.util.draw_win_player_screen(self.pokemon, self.pokemon_enemy, level, name, self.screen)
 
             if message_attack and message_damage and not win:
-                now_time = pygame.time.get_ticks()
-                message_time = 0
-                while message_time - now_time < 1000:
-                    message_time = pygame.time.get_ticks()
-                    self.util.draw_info_attack_screen(self.screen, message_attack, message_damage)
-                    pygame.display.update()
+                self.show_for(lambda: self.util.draw_info_attack_screen(self.screen, message_attack, message_damage))
                 message_attack = None
                 message_damage = None
                 
@@ -116,7 +107,7 @@ class InFight():
                     pygame.quit()
                     sys.exit()
                     
-                if player_turn:
+                if self.engine.player_turn:
                     if event.type == pygame.KEYDOWN:
                         if event.key == pygame.K_RIGHT or event.key == pygame.K_DOWN:
                             self.selected_index = (self.selected_index + 1) % len(self.options)
@@ -127,65 +118,31 @@ class InFight():
                                 case 0:  # Attack
                                     if win:
                                         self.selected_index = 4
-                                    elif self.pokemon.get_hp() > 0:
-                                        attack_type = AttackMenu(self.screen, self.pokemon, self.pokemon_enemy).display()
-                                        if attack_type == "Back":
-                                            player_turn = True
-                                        else:
-                                            self.fight.player_attack(attack_type)
-                                            if self.pokemon_enemy.get_hp() > 0:
-                                                message_attack = self.fight.fightinfo.set_who_attack_message(self.pokemon)
-                                                message_damage = self.fight.fightinfo.get_damage_message()
-                                                player_turn = False
-                                            else:
-                                                self.pokemon.update_xp(self.pokemon_enemy)
-                                                player_turn = True
-                                                winner = "player"
-                                                pokemon = pygame.transform.flip(self.util.load_image(self.pokemon.image), True, False)
-                                                win = True
                                     else:
-                                        win = True
+                                        attack_type = None
+                                        if self.pokemon.get_hp() > 0:
+                                            attack_type = AttackMenu(self.screen, self.pokemon, self.pokemon_enemy).display()
+                                        if attack_type != "Back":
+                                            message_attack, message_damage = self.last_attack(self.engine.step((ATTACK, attack_type)))
+                                            win = self.engine.over
+                                            if self.engine.winner == "player":
+                                                pokemon = pygame.transform.flip(self.util.load_image(self.pokemon.image), True, False)
                                         
                                 case 1:  # Bag
                                     if win:
                                         self.selected_index = 4
                                     else:
                                         bag_option = BagMenu(self.screen, self.pokemon, self.pokemon_enemy, self.bag).display()
-                                        if bag_option:
-                                            match bag_option:
-                                                case "Potions":
-                                                    another_option = self.fight.use_potion(self.pokemon, self.bag)
-                                                    if another_option:
-                                                        player_turn == True
-                                                    else:
-                                                        player_turn = False
-                                                case "Pokeball":
-                                                    another_option = self.fight.use_pokeball(self.player, self.bag, self.pokemon, self.pokemon_enemy)
-                                                    match another_option:
-                                                        case "Success":
-                                                            self.pokemon.update_xp(self.pokemon_enemy)
+                                        match bag_option:
+                                            case "Potions":
+                                                self.engine.step(POTION)
+                                            case "Pokeball":
+                                                for battle_event in self.engine.step(POKEBALL):
+                                                    if battle_event.kind in ("capture", "capture_failed"):
+                                                        if battle_event.kind == "capture":
                                                             pokemon = pygame.transform.flip(self.util.load_image(self.pokemon.image), True, False)
-                                                            now_time = pygame.time.get_ticks()
-                                                            success_time = 0
-                                                            while success_time - now_time < 1000:
-                                                                success_time = pygame.time.get_ticks()
-                                                                self.capture_message("The pokemon has been captured successfully !")
-                                                                pygame.display.update()
-                                                            player_turn = True
-                                                            winner = "player"
-                                                            win = True
-                                                        case "Fail":
-                                                            now_time = pygame.time.get_ticks()
-                                                            failed_capture_time = 0
-                                                            while failed_capture_time - now_time < 1000:
-                                                                failed_capture_time = pygame.time.get_ticks()
-                                                                self.capture_message(f"You failed to capture {self.pokemon_enemy.name}...")
-                                                                pygame.display.update()
-                                                            player_turn = False
-                                                        case "Back":
-                                                            player_turn = True
-                                                case "Back":
-                                                    player_turn = True
+                                                        self.show_for(lambda: self.capture_message(battle_event.message))
+                                                win = self.engine.over
 
                                 case 2:  # Team
                                     if win:
@@ -196,18 +153,17 @@ class InFight():
                                             self.player, self.pokemon, self.pokemon_enemy,
                                             self.screen, pokemon_list=self.team
                                         ).display()
-                                        self.fight.set_first_pokemon(self.pokemon)
+                                        self.engine.step((SWITCH, self.pokemon))
                                         pokemon_hp_max = self.pokemon.get_hp_max()
                                         name = self.pokemon.name
                                         level = self.pokemon.get_level()
 
                                 case 3:  # Info
                                     InfoMenu(self.screen, self.pokemon, self.pokemon_enemy).display()
-                                    player_turn = True  
 
                                 case 4:  # Exit or Flee
                                     if win:
-                                        if another_option == "Success":
+                                        if self.engine.captured:
                                             if len(self.pokemon_enemy.pet_name.split()) == 1:
                                                 new_pet_name = self.pokemon_enemy.pet_name + " " + str(time.time())
                                                 self.pokemon_enemy.set_pet_name(new_pet_name)
@@ -216,42 +172,37 @@ class InFight():
                                             self.save()
                                         return self.fleeing
                                     else:
-                                        self.fleeing = self.fight.run_away()
-                                        player_turn = False
+                                        flee_message = self.engine.step(FLEE)[-1].message
+                                        self.fleeing = self.engine.fled
                                         if self.fleeing:
                                             self.save()
-                                            now_time = pygame.time.get_ticks()
-                                            failed_flee_time = 0
-                                            while failed_flee_time - now_time < 1000:
-                                                failed_flee_time = pygame.time.get_ticks()
-                                                self.message_pop_up(self.fight.fightinfo.flee_message)
-                                                pygame.display.update()
+                                        self.show_for(lambda: self.message_pop_up(flee_message))
+                                        if self.fleeing:
                                             return self.fleeing
-                                        else:
-                                            now_time = pygame.time.get_ticks()
-                                            failed_flee_time = 0
-                                            while failed_flee_time - now_time < 1000:
-                                                failed_flee_time = pygame.time.get_ticks()
-                                                self.message_pop_up(self.fight.fightinfo.flee_message)
-                                                pygame.display.update()
 
-                elif not player_turn and not win:
+                elif not win:
                     pygame.time.wait(800)
-                    if self.pokemon.get_hp() > 0:
-                        self.fight.bot_attack()
-                        message_attack = self.fight.fightinfo.set_who_attack_message(self.pokemon_enemy)
-                        message_damage = self.fight.fightinfo.get_damage_message()
-                        if self.pokemon.get_hp() == 0 or self.pokemon.get_hp() < 0:
-                            self.pokemon_enemy.update_xp(self.pokemon)
-                            pokemon_enemy = self.util.load_image(self.pokemon_enemy.get_image())
-                            winner = "enemy"
-                            win = True
-                    else:
-                        self.pokemon_enemy.update_xp(self.pokemon)
-                        winner = "enemy"
+                    message_attack, message_damage = self.last_attack(self.engine.step())
+                    if self.engine.over:
+                        pokemon_enemy = self.util.load_image(self.pokemon_enemy.get_image())
                         win = True
-                    player_turn = True
          
+    def last_attack(self, battle_events):
+        """(who attacks message, damage message) of the last announced attack of a step, (None, None) without one."""
+        for battle_event in reversed(battle_events):
+            if battle_event.kind == "attack":
+                return battle_event.message, battle_event.damage_message
+        return None, None
+
+    def show_for(self, draw, duration=1000):
+        """Redraws a message pop-up for duration milliseconds (the battle waits meanwhile)."""
+        now_time = pygame.time.get_ticks()
+        message_time = 0
+        while message_time - now_time < duration:
+            message_time = pygame.time.get_ticks()
+            draw()
+            pygame.display.update()
+
     def capture_message(self, message):
         self.util.draw_info_capture_screen(self.screen, message)
     
@@ -263,13 +214,17 @@ class InFight():
         self.pokemon_enemy.set_hp(self.pokemon_enemy.get_hp_max())
 
     def save_all_to_pokedex(self):
+        save_battle_replay(self.player, self.recorder)
         self.reset_hp()
         save_pokemon_to_pokedex(self.player, self.pokemon)
         save_bag_to_pokedex(self.player, self.bag)
         save_pokemon_to_pokedex(self.player, self.pokemon_enemy)
+        flush_saves()
     
     def save(self):
+        save_battle_replay(self.player, self.recorder)
         self.reset_hp()
         save_pokemon_to_pokedex(self.player, self.pokemon)
         save_bag_to_pokedex(self.player, self.bag)
-        save_wild_pokemon(self.pokemon_enemy)
\ No newline at end of file
+        save_wild_pokemon(self.pokemon_enemy)
+        flush_saves()
\ No newline at end of file
@@ -5,6 +5,7 @@ from front_end.screen import Screen
 from .switch import Switch
 from front_end.gameplay.in_fight import InFight
 from front_end.sounds import Sounds
+from back_end.controller import flush_saves
 
 sounds = Sounds()
 
@@ -24,6 +25,7 @@ class Map:
         self.map_world = "map_0"
 
     def switch_map(self, switch: Switch):
+        flush_saves() # Scene change: write pending saves
         self.tmx_data = pytmx.load_pygame(f"./assets/map/{switch.name}.tmx")
         map_data = pyscroll.data.TiledMapData(self.tmx_data)
         self.map_layer = pyscroll.BufferedRenderer(map_data, self.screen.get_size())
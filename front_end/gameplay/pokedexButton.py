@@ -1,6 +1,7 @@
 import pygame
 import os
 from .pokedexUIbase import PokedexUIBase
+from front_end.text_cache import get_text_cache
 
 
 class PokedexButton(PokedexUIBase):
@@ -167,6 +168,5 @@ class PokedexButton(PokedexUIBase):
         self.draw_not_owned_pokeball(screen, center_x, center_y, radius)
 
         # Draw a central "P" for Pokedex
-        font = pygame.font.Font(None, int(self.size * 0.5))
-        text = font.render("P", True, (255, 255, 255))
+        text = get_text_cache().render("P", None, int(self.size * 0.5), (255, 255, 255))
         screen.blit(text, text.get_rect(center=(center_x, center_y)))
\ No newline at end of file
@@ -2,13 +2,89 @@ import json
 from typing import Dict, List, Optional
 
 
+class SpeciesResolver:
+    """
+    Maps team members (Pokemon objects or save dictionaries) to Pokedex ids.
+    Built once per Pokedex: every entry name is indexed in lowercase and without punctuation
+    ("Mr. Mime" / "mr mime"), and resolved names are memoized.
+    """
+
+    def __init__(self, pokemon_data: List[Dict]):
+        self._ids: Dict[str, int] = {}
+        for p in pokemon_data:
+            self._ids.setdefault(p.get('name', '').strip().lower(), p.get('id'))
+        for p in pokemon_data:
+            self._ids.setdefault(self._compact(p.get('name', '')), p.get('id'))
+        self._ids.pop('', None)
+        self._memo: Dict[str, Optional[int]] = {}
+
+    @staticmethod
+    def _compact(name: str) -> str:
+        return ''.join(c for c in name.lower() if c.isalnum())
+
+    @staticmethod
+    def _get_field(poke, key: str) -> str:
+        """Reads a field from a save dictionary or a Pokemon object."""
+        if isinstance(poke, dict):
+            return str(poke.get(key) or '')
+        if key == 'original_name' and hasattr(poke, 'get_original_name'):
+            return str(poke.get_original_name() or '')
+        return str(getattr(poke, key, '') or '')
+
+    def resolve_name(self, name: str) -> Optional[int]:
+        """Returns the Pokedex id of a species name, None if unknown."""
+        if name not in self._memo:
+            key = name.strip().lower()
+            pokemon_id = self._ids.get(key)
+            if pokemon_id is None:
+                pokemon_id = self._ids.get(self._compact(key))
+            self._memo[name] = pokemon_id
+        return self._memo[name]
+
+    def resolve_one(self, poke) -> Optional[int]:
+        """
+        Resolves a team member: explicit id first, then its name, then the first stage of its
+        evolution line (original_name) for evolutions missing from the Pokedex.
+        """
+        pid = self._get_field(poke, 'id')
+        if pid:
+            try:
+                return int(pid)
+            except (ValueError, TypeError):
+                pass
+
+        for field in ('name', 'original_name'):
+            name = self._get_field(poke, field)
+            if name:
+                pokemon_id = self.resolve_name(name)
+                if pokemon_id is not None:
+                    return pokemon_id
+        return None
+
+    def resolve(self, team) -> List[Optional[int]]:
+        """Resolves a whole team, in order (None for unresolved members)."""
+        return [self.resolve_one(poke) for poke in team]
+
+
 class Pokedex:
-    """Class to manage Pokedex data loaded from a JSON file."""
+    """
+    Class to manage Pokedex data loaded from a JSON file.
+    Entries are indexed by id, lowercase name and type. Discovery is kept as a bitset over the
+    entry positions, with the found count and type distribution updated on every change
+    (the 'found' flag of each entry is kept in sync for the UI).
+    """
 
     def __init__(self, json_path: str = "back_end/data/pokedex.json"):
         self.json_path = json_path
         self.pokemon_data: List[Dict] = []
         self.selected_pokemon: Optional[Dict] = None
+        self._by_id: Dict[int, int] = {}
+        self._by_name: Dict[str, int] = {}
+        self._by_type: Dict[str, List[int]] = {}
+        self._found_bits = 0
+        self._found_count = 0
+        self._found_types: Dict[str, int] = {}
+        self._resolver: Optional[SpeciesResolver] = None
         self.load_data()
 
     #  Persistence 
@@ -33,6 +109,27 @@ class Pokedex:
         except json.JSONDecodeError as e:
             print(f"⚠ JSON read error: {e}")
             self.pokemon_data = []
+        self._build_indexes()
+
+    def _build_indexes(self):
+        """Indexes the entries by id, lowercase name and lowercase type, and clears the discoveries."""
+        self._by_id = {}
+        self._by_name = {}
+        self._by_type = {}
+        self._resolver = None
+        for position, p in enumerate(self.pokemon_data):
+            # First entry wins, like the former linear scans
+            self._by_id.setdefault(p.get('id'), position)
+            self._by_name.setdefault(p.get('name', '').lower(), position)
+            for t in dict.fromkeys(t.lower() for t in self._normalize_types(p.get('type', []))):
+                self._by_type.setdefault(t, []).append(position)
+
+        self._found_bits = 0
+        self._found_count = 0
+        self._found_types = {}
+        for position, p in enumerate(self.pokemon_data):
+            if p.get('stats', {}).get('found', False):
+                self._set_found(position, True)
 
     def save_data(self):
         """Saves current memory state back to the JSON file."""
@@ -46,11 +143,9 @@ class Pokedex:
     def load_save_state(self, saved_pokedex: List[Dict]):
         """Updates the Pokedex state using data from a save file."""
         for pokemon_save in saved_pokedex or []:
-            pokemon = self.get_pokemon_by_id(pokemon_save.get('id'))
-            if pokemon:
-                pokemon.setdefault('stats', {})['found'] = (
-                    pokemon_save.get('stats', {}).get('found', False)
-                )
+            position = self._by_id.get(pokemon_save.get('id'))
+            if position is not None:
+                self._set_found(position, bool(pokemon_save.get('stats', {}).get('found', False)))
         print("✓ Pokedex state updated from save file")
 
     def get_save_data(self) -> List[Dict]:
@@ -68,28 +163,31 @@ class Pokedex:
 
     def get_pokemon_by_id(self, pokemon_id: int) -> Optional[Dict]:
         """Finds a Pokémon by its unique ID."""
-        return next((p for p in self.pokemon_data if p.get('id') == pokemon_id), None)
+        position = self._by_id.get(pokemon_id)
+        return None if position is None else self.pokemon_data[position]
 
     def get_pokemon_by_name(self, name: str) -> Optional[Dict]:
         """Finds a Pokémon by its name (case-insensitive)."""
-        name_lower = name.lower()
-        return next((p for p in self.pokemon_data if p.get('name', '').lower() == name_lower), None)
+        position = self._by_name.get(name.lower())
+        return None if position is None else self.pokemon_data[position]
+
+    def get_species_resolver(self) -> SpeciesResolver:
+        """Returns the name -> id resolver of this Pokedex, built on first use."""
+        if self._resolver is None:
+            self._resolver = SpeciesResolver(self.pokemon_data)
+        return self._resolver
 
     def get_pokemon_by_type(self, pokemon_type: str) -> List[Dict]:
         """Returns a list of Pokémon matching a specific type."""
-        type_lower = pokemon_type.lower()
-        return [
-            p for p in self.pokemon_data
-            if type_lower in [t.lower() for t in self._normalize_types(p.get('type', []))]
-        ]
+        return [self.pokemon_data[position] for position in self._by_type.get(pokemon_type.lower(), [])]
 
     def get_found_pokemon(self) -> List[Dict]:
         """Returns all Pokémon marked as discovered."""
-        return [p for p in self.pokemon_data if p.get('stats', {}).get('found', False)]
+        return [p for position, p in enumerate(self.pokemon_data) if self._found_bits >> position & 1]
 
     def get_unfound_pokemon(self) -> List[Dict]:
         """Returns all Pokémon that haven't been discovered yet."""
-        return [p for p in self.pokemon_data if not p.get('stats', {}).get('found', False)]
+        return [p for position, p in enumerate(self.pokemon_data) if not self._found_bits >> position & 1]
 
     #  Selection 
 
@@ -109,31 +207,46 @@ class Pokedex:
 
     def is_found(self, pokemon_id: int) -> bool:
         """Checks if a specific Pokémon ID has been discovered."""
-        pokemon = self.get_pokemon_by_id(pokemon_id)
-        return bool(pokemon and pokemon.get('stats', {}).get('found', False))
+        position = self._by_id.get(pokemon_id)
+        return position is not None and bool(self._found_bits >> position & 1)
 
     def mark_as_found(self, pokemon_id: int) -> bool:
         """Marks a Pokémon as found. Returns True if it was previously undiscovered."""
-        pokemon = self.get_pokemon_by_id(pokemon_id)
-        if not pokemon:
+        position = self._by_id.get(pokemon_id)
+        if position is None:
             return False
-        pokemon.setdefault('stats', {})
-        is_new_discovery = not pokemon['stats'].get('found', False)
-        pokemon['stats']['found'] = True
-        return is_new_discovery
+        return self._set_found(position, True)
 
     def reset_progression(self):
         """Resets all Pokémon discovery statuses to False."""
-        for p in self.pokemon_data:
-            p.setdefault('stats', {})['found'] = False
+        for position in range(len(self.pokemon_data)):
+            self._set_found(position, False)
         print("✓ Progression reset")
 
     def unlock_all(self):
         """Cheat/Debug: Marks every Pokémon in the data as found."""
-        for p in self.pokemon_data:
-            p.setdefault('stats', {})['found'] = True
+        for position in range(len(self.pokemon_data)):
+            self._set_found(position, True)
         print("✓ All Pokémon unlocked")
 
+    def _set_found(self, position: int, found: bool) -> bool:
+        """
+        Updates the discovery bit of an entry, its 'found' flag, the found count and the type distribution.
+        Returns True if the state changed.
+        """
+        pokemon = self.pokemon_data[position]
+        pokemon.setdefault('stats', {})['found'] = found
+        if bool(self._found_bits >> position & 1) == found:
+            return False
+
+        self._found_bits ^= 1 << position
+        step = 1 if found else -1
+        self._found_count += step
+        for t in self._normalize_types(pokemon.get('type', [])):
+            t_cap = t.capitalize()
+            self._found_types[t_cap] = self._found_types.get(t_cap, 0) + step
+        return True
+
     # Statistics 
 
     def total_count(self) -> int:
@@ -142,7 +255,7 @@ class Pokedex:
 
     def found_count(self) -> int:
         """Returns the count of discovered Pokémon."""
-        return len(self.get_found_pokemon())
+        return self._found_count
 
     def completion_percentage(self) -> float:
         """Calculates the percentage of the Pokedex completed."""
@@ -151,18 +264,12 @@ class Pokedex:
 
     def get_statistics(self) -> Dict:
         """Compiles a comprehensive report of Pokedex progress."""
-        found_list = self.get_found_pokemon()
-        type_distribution: Dict[str, int] = {}
-        
-        for p in found_list:
-            for t in self._normalize_types(p.get('type', [])):
-                t_cap = t.capitalize()
-                type_distribution[t_cap] = type_distribution.get(t_cap, 0) + 1
-                
+        type_distribution = {t: count for t, count in self._found_types.items() if count}
+
         return {
             'total': self.total_count(),
-            'found': len(found_list),
-            'missing': self.total_count() - len(found_list),
+            'found': self._found_count,
+            'missing': self.total_count() - self._found_count,
             'percentage': self.completion_percentage(),
             'type_distribution': type_distribution,
         }
@@ -34,7 +34,6 @@ class ChangePokemonInFight():
 
     def display(self):
         battle_floor = self.util.load_image(BATTLE_FLOOR)
-        battle_floor2 = pygame.transform.flip(battle_floor, True, False)
         
         pokemon_enemy = self.util.load_image(self.pokemon_enemy.get_image())
         time_count = 0
@@ -51,14 +50,14 @@ class ChangePokemonInFight():
 
         while self.running:
            
-            pokemon = pygame.transform.flip(self.util.load_image(self.pokemon.get_image()), True, False)
+            pokemon = self.util.load_image(self.pokemon.get_image())
 
             self.screen.update()
             if not win:
                 time_count += speed
                 x_movement = int(var_y * math.sin(time_count * 0.1))
                 y_movement = int(var_x * math.sin(time_count * 0.08))
-            self.util.display_assets_and_background(self.screen, x_movement, y_movement, battle_floor, battle_floor2, pokemon_enemy, pokemon)
+            self.util.display_assets_and_background(self.screen, x_movement, y_movement, battle_floor, pokemon_enemy, pokemon, flip_pokemon=True)
 
             self.util.draw_window_with_background(self.screen, self.screen.width//2, self.screen.height //2)
 
@@ -26,7 +26,7 @@ class PokemonStat():
 
             y_position = self.screen.height // 2
 
-            image = pygame.transform.scale(pygame.image.load(self.pokemon.get_image()), (self.screen.height//3, self.screen.height//3) )
+            image = pygame.transform.scale(self.util.load_image(self.pokemon.get_image()), (self.screen.height//3, self.screen.height//3) )
             image_rect = image.get_rect(center = (self.screen.width //4, self.screen.height //2))
             self.screen.display.blit(image, image_rect)
             font_size = self.screen.width // 30
@@ -20,6 +20,9 @@ class SelectPokemon():
 
         self.options = []
         self.options_rect = []
+        # Starter images at their two display sizes, scaled once instead of every frame
+        self.small_options = []
+        self.selected_options = []
         my_x = 0.5
         for pokemon in self.pokemons:
             option = self.load_image(pokemon.get_image(), (self.screen.width // 6, self.screen.width //  6))
@@ -27,12 +30,15 @@ class SelectPokemon():
             my_x += 1
             self.options.append(option)
             self.options_rect.append(option_rect)
+            image = self.util.load_image(pokemon.get_image())
+            self.small_options.append(pygame.transform.smoothscale(image, (self.screen.width // 6, self.screen.width //  6)))
+            self.selected_options.append(pygame.transform.smoothscale(image, (self.screen.width // 4, self.screen.width //  4)))
 
         self.selected_index = 0
         self.running = True
 
     def load_image(self, path, scaling):
-        img = pygame.image.load(path).convert_alpha()
+        img = self.util.load_image(path)
         img = pygame.transform.scale(img, (scaling))
         return img
 
@@ -79,14 +85,10 @@ class SelectPokemon():
             for i, option in enumerate(self.options):
                 font_size = self.screen.height // 15
                 if i == self.selected_index:
-                    option = pygame.transform.smoothscale(pygame.image.load(self.pokemons[i].get_image()), (self.screen.width // 4, self.screen.width //  4))
-                    option.get_rect(center= (self.screen.width // 3 * 0.5+i, self.screen.height // 5*2.5))
-                    self.screen.display.blit(option, self.options_rect[i])
+                    self.screen.display.blit(self.selected_options[i], self.options_rect[i])
                     self.util.draw_text(self.pokemons[i].name, REGULAR_FONT, font_size, self.screen, (self.screen.width // 2, self.screen.height // 5*1.5), "white")
                 else:
-                    option = pygame.transform.smoothscale(pygame.image.load(self.pokemons[i].get_image()), (self.screen.width // 6, self.screen.width //  6))
-                    option.get_rect(center= (self.screen.width // 3 * 0.5+i, self.screen.height // 5*2.5))
-                    self.screen.display.blit(option, self.options_rect[i])
+                    self.screen.display.blit(self.small_options[i], self.options_rect[i])
 
             #  instructions
             instructions = "Flèches: Choisir | ENTRÉE: Confirmer le starter"
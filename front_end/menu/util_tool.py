@@ -1,22 +1,21 @@
 import pygame
 from __settings__ import REGULAR_FONT, BACKGROUND, DARK_GREEN, BATTLE_BACKGROUND
+from front_end.asset_cache import get_asset_cache, get_transform_cache
+from front_end.text_cache import get_text_cache
 
 class UtilTool():
     def draw_text(self, text, font, font_size, screen, my_center, color=DARK_GREEN):
-        font_load = pygame.font.Font(font, font_size)
-        dialog = font_load.render(text, True, color)
+        dialog = get_text_cache().render(text, font, font_size, color)
         dialog_rect = dialog.get_rect(center = my_center)
         screen.display.blit(dialog, dialog_rect)
 
     def draw_text_from_top_left(self, text, font, font_size, screen, my_position, color=DARK_GREEN):
-        font_load = pygame.font.Font(font, font_size)
-        dialog = font_load.render(text, True, color)
+        dialog = get_text_cache().render(text, font, font_size, color)
         dialog_rect = dialog.get_rect(topleft = my_position)
         screen.display.blit(dialog, dialog_rect)
 
     def draw_text_from_bottom_right(self, text, font, font_size, screen, my_position, color=DARK_GREEN):
-        font_load = pygame.font.Font(font, font_size)
-        dialog = font_load.render(text, True, color)
+        dialog = get_text_cache().render(text, font, font_size, color)
         dialog_rect = dialog.get_rect(bottomright = my_position)
         screen.display.blit(dialog, dialog_rect)
 
@@ -28,29 +27,32 @@ class UtilTool():
         screen.display.blit(background_screen, background_rect)
 
     def load_image(self, image):
-        return pygame.image.load(image)
+        """Shared surface of an image file, decoded once (see AssetCache): copy it before modifying it."""
+        return get_asset_cache().load(image)
     
-    def display_asset_battle(self, screen, image, scale_x, scale_y, x, y):
-        image.set_colorkey((255, 255, 255))
-        battle_floor = pygame.transform.scale(image, (scale_x, scale_y))
+    def display_asset_battle(self, screen, image, scale_x, scale_y, x, y, flip_x=False):
+        """Blits image scaled to (scale_x, scale_y) with white as transparent, the copy being cached (see TransformCache)."""
+        transform_cache = get_transform_cache()
+        transform_cache.set_screen_size((screen.width, screen.height))
+        battle_floor = transform_cache.transform(image, (scale_x, scale_y), flip_x, colorkey=(255, 255, 255))
         battle_floor_rect = battle_floor.get_rect(center = (x, y))
         screen.display.blit(battle_floor, battle_floor_rect)
 
-    def display_assets_and_background_in_fight(self, screen, x_movement, y_movement, battle_floor, battle_floor2, pokemon_enemy, pokemon):
+    def display_assets_and_background_in_fight(self, screen, x_movement, y_movement, battle_floor, pokemon_enemy, pokemon, flip_pokemon=False):
         screen.set_background_without_black(BATTLE_BACKGROUND)
         floor1 = self.display_asset_battle(screen, battle_floor, screen.width // 5, screen.height // 7, screen.width // 10 * 7.5, screen.height // 7 * 3.2)
-        floor = self.display_asset_battle(screen, battle_floor2, screen.width // 3, screen.height // 5, screen.width // 10 * 2, screen.height // 7 * 6.6)
+        floor = self.display_asset_battle(screen, battle_floor, screen.width // 3, screen.height // 5, screen.width // 10 * 2, screen.height // 7 * 6.6, flip_x=True)
 
         enemy = self.display_asset_battle(screen, pokemon_enemy, screen.width //6, screen.width //6, screen.width // 10 * 7.5 + x_movement, screen.height // 7 * 3)
-        my_pokemon = self.display_asset_battle(screen, pokemon, screen.width // 4.5, screen.width // 4.5, screen.width // 10 * 2, screen.height // 7 * 6.3 + y_movement)
+        my_pokemon = self.display_asset_battle(screen, pokemon, screen.width // 4.5, screen.width // 4.5, screen.width // 10 * 2, screen.height // 7 * 6.3 + y_movement, flip_pokemon)
 
-    def display_assets_and_background(self, screen, x_movement, y_movement, battle_floor, battle_floor2, pokemon_enemy, pokemon):
+    def display_assets_and_background(self, screen, x_movement, y_movement, battle_floor, pokemon_enemy, pokemon, flip_pokemon=False):
         screen.set_background_without_black(BATTLE_BACKGROUND)
         floor1 = self.display_asset_battle(screen, battle_floor, screen.width // 5, screen.height // 7, screen.width // 10 * 7.5, screen.height // 7 * 3.2)
-        floor = self.display_asset_battle(screen, battle_floor2, screen.width // 3, screen.height // 5, screen.width // 10 * 2.5, screen.height // 7 * 6.6)
+        floor = self.display_asset_battle(screen, battle_floor, screen.width // 3, screen.height // 5, screen.width // 10 * 2.5, screen.height // 7 * 6.6, flip_x=True)
 
         enemy = self.display_asset_battle(screen, pokemon_enemy, screen.width //6, screen.width //6, screen.width // 10 * 7.5 + x_movement, screen.height // 7 * 3)
-        my_pokemon = self.display_asset_battle(screen, pokemon, screen.width // 3, screen.width // 3, screen.width // 10 * 2.5, screen.height // 7 * 6.4 + y_movement)
+        my_pokemon = self.display_asset_battle(screen, pokemon, screen.width // 3, screen.width // 3, screen.width // 10 * 2.5, screen.height // 7 * 6.4 + y_movement, flip_pokemon)
 
 
     def draw_window_with_background(self, screen, width, height, color=BACKGROUND):
@@ -1,6 +1,10 @@
 import pygame
 import cv2
 import numpy as np
+from front_end.asset_cache import get_background_cache
+
+# Alpha of the black overlay darkening the backgrounds of the menus
+OVERLAY_ALPHA = 155
 
 class Screen:
     def __init__(self, width=1200, height=720):
@@ -57,19 +61,18 @@ class Screen:
             # Display the first frame
             self._update_video_frame()
             self._draw_video_background()
+
+            # Add a transparent black overlay
+            background_screen = pygame.Surface((self.width, self.height))
+            background_rect = background_screen.get_rect(center = (self.width //2, self.height // 2))
+            background_screen.set_alpha(OVERLAY_ALPHA)
+            pygame.draw.rect(background_screen, "black", background_rect)
+            self.display.blit(background_screen, background_rect)
         else:
-            # It's an image (original behavior)
+            # It's an image, with the transparent black overlay already drawn on
             self.is_video_background = False
-            background = pygame.transform.scale(pygame.image.load(background_path), (self.width, self.height))
-            background_rect = background.get_rect()
-            self.display.blit(background, background_rect)
-
-        # Add a transparent black overlay
-        background_screen = pygame.Surface((self.width, self.height))
-        background_rect = background_screen.get_rect(center = (self.width //2, self.height // 2))
-        background_screen.set_alpha(155)
-        pygame.draw.rect(background_screen, "black", background_rect)
-        self.display.blit(background_screen, background_rect)
+            background = get_background_cache().get(background_path, (self.width, self.height), OVERLAY_ALPHA)
+            self.display.blit(background, (0, 0))
 
     def _update_video_frame(self):
         """Updates the current video frame"""
@@ -104,7 +107,7 @@ class Screen:
             # Add a transparent black overlay
             background_screen = pygame.Surface((self.width, self.height))
             background_rect = background_screen.get_rect(center = (self.width //2, self.height // 2))
-            background_screen.set_alpha(155)
+            background_screen.set_alpha(OVERLAY_ALPHA)
             pygame.draw.rect(background_screen, "black", background_rect)
             self.display.blit(background_screen, background_rect)
 
@@ -131,11 +134,10 @@ class Screen:
             self._update_video_frame()
             self._draw_video_background()
         else:
-            # It's an image (original behavior)
+            # It's an image, scaled once per resolution
             self.is_video_background = False
-            background = pygame.transform.smoothscale(pygame.image.load(background_path), (self.width, self.height))
-            background_rect = background.get_rect()
-            self.display.blit(background, background_rect)
+            background = get_background_cache().get(background_path, (self.width, self.height), smooth=True)
+            self.display.blit(background, (0, 0))
 
     def cleanup(self):
         """Releases video resources"""
@@ -0,0 +1,97 @@
+import pygame
+from collections import OrderedDict
+from __settings__ import TEXT_CACHE_SIZE
+
+class FontRegistry:
+    """Fonts by (path, size), each file opened and parsed once (path None is pygame's default font)."""
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.__fonts = {}
+
+    def __len__(self):
+        return len(self.__fonts)
+
+    def get(self, path, size):
+        key = (path, size)
+        font = self.__fonts.get(key)
+        if font is not None:
+            self.hits += 1
+            return font
+        self.misses += 1
+        font = self.__fonts[key] = pygame.font.Font(path, size)
+        return font
+
+    def clear(self):
+        self.__fonts.clear()
+
+
+class TextCache:
+    """
+    Rendered strings keyed on (text, font path, size, color, antialias), so a menu redrawing the
+    same labels every frame renders each of them once. The max_size least recently used are kept.
+    The returned surfaces are shared: callers must not draw on them.
+    """
+    def __init__(self, fonts, max_size=TEXT_CACHE_SIZE):
+        self.fonts = fonts
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__surfaces = OrderedDict()
+
+    def __len__(self):
+        return len(self.__surfaces)
+
+    def render(self, text, font, size, color, antialias=True):
+        """Returns text rendered with the font file font (None for the default) at size."""
+        if isinstance(color, list):
+            color = tuple(color)
+        key = (text, font, size, color, antialias)
+        surface = self.__surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.__surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.__surfaces[key] = self.fonts.get(font, size).render(text, antialias, color)
+        if len(self.__surfaces) > self.max_size:
+            self.__surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        self.__surfaces.clear()
+
+    def stats(self):
+        """Counters of the cache and of its fonts, e.g. to check the hit rate of a menu."""
+        requests = self.hits + self.misses
+        font_requests = self.fonts.hits + self.fonts.misses
+        return {
+            "surfaces" : len(self.__surfaces),
+            "hits" : self.hits,
+            "misses" : self.misses,
+            "evictions" : self.evictions,
+            "hit_rate" : self.hits / requests if requests else 0.0,
+            "fonts" : len(self.fonts),
+            "font_hit_rate" : self.fonts.hits / font_requests if font_requests else 0.0
+        }
+
+
+_font_registry = None
+_text_cache = None
+
+def get_font_registry():
+    """Returns the process-wide FontRegistry."""
+    global _font_registry
+    if _font_registry is None:
+        _font_registry = FontRegistry()
+    return _font_registry
+
+def get_text_cache():
+    """Returns the process-wide TextCache (rendering with the FontRegistry)."""
+    global _text_cache
+    if _text_cache is None:
+        _text_cache = TextCache(get_font_registry())
+    return _text_cache
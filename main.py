@@ -1,13 +1,21 @@
-import pygame
+import argparse, pygame
 from front_end.menu.menu import Menu
 from front_end.screen import Screen
 from front_end.sounds import Sounds
+from back_end.models.rng import set_seed_options
 
 pygame.init()
 sounds = Sounds()
 sounds.play_background_music(volume=0.1)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pokemon")
+    parser.add_argument("--seed", type=int, help="seed of every random draw (reproducible session)")
+    parser.add_argument("--replay-seed", action="store_true",
+                        help="replay the last session of the loaded player (seed recorded in the save)")
+    args = parser.parse_args()
+    set_seed_options(args.seed, args.replay_seed)
+
     screen = Screen()
     menu = Menu(screen)
     
@@ -0,0 +1,160 @@
+"""
+Behavioral suite shared by the two save backends (JSON SaveStore and SQLite), each one running
+in a temporary directory. "reopen" drops every in-memory state so reads come back from disk.
+"""
+
+import json, os, types
+import pytest
+import back_end.data_access.save_store as save_store
+import back_end.data_access.sqlite_service as sqlite_service
+import back_end.data_access.player_pokedex_service as player_pokedex_service
+import back_end.data_access.pokemon_pokedex_service as pokemon_pokedex_service
+import back_end.data_access.bag_pokedex_service as bag_pokedex_service
+from back_end.data_access.player_pokedex_service import create_specific_starter
+from back_end.data_access.player_shards import shard_file_name
+from back_end.models.bag import Bag
+from back_end.models.rng import RngService
+
+DISCOVERIES = [
+    {"id" : 4, "name" : "Charmander", "type" : ["Feu"],
+     "stats" : {"hp" : 39, "attack" : 52, "defense" : 43, "speed" : 65, "found" : True},
+     "sprite" : "assets/imagePokedex/Spr_1b_004.png"},
+    {"id" : 1, "name" : "Bulbasaur", "type" : ["Plante", "Poison"],
+     "stats" : {"hp" : 45, "attack" : 49, "defense" : 49, "speed" : 45, "found" : False},
+     "sprite" : "assets/imagePokedex/Spr_1b_001.png"}
+]
+
+def new_save_store(directory):
+    return save_store.SaveStore(
+        index_path=os.path.join(directory, "index.json"), save_dir=os.path.join(directory, "players"),
+        legacy_path=os.path.join(directory, "player_pokedex.json"),
+        journal_path=os.path.join(directory, "journal.log"), flush_delay=None)
+
+@pytest.fixture(params=["json", "sqlite"])
+def backend(request, tmp_path, monkeypatch):
+    # The SQLite backend imports the JSON saves when it creates its database: both start empty
+    monkeypatch.setattr(save_store, "_save_store", new_save_store(tmp_path))
+    if request.param == "json":
+        service = types.SimpleNamespace(**{
+            name : getattr(module, name)
+            for module in (player_pokedex_service, pokemon_pokedex_service, bag_pokedex_service)
+            for name in dir(module) if not name.startswith("_")})
+
+        def reopen():
+            save_store._save_store.close()
+            save_store._save_store = new_save_store(tmp_path)
+    else:
+        path = os.path.join(tmp_path, "saves.sqlite3")
+        monkeypatch.setattr(sqlite_service, "_connection", None)
+        sqlite_service.get_connection(path)
+        service = sqlite_service
+
+        def reopen():
+            sqlite_service._connection.close()
+            sqlite_service._connection = None
+            sqlite_service.get_connection(path)
+
+    service.reopen = reopen
+    yield service
+    if request.param == "sqlite":
+        sqlite_service._connection.close()
+
+def new_pokemon(name="Charmander", types=("fire",), seed=1):
+    return create_specific_starter(name, name, list(types), 1, RngService(seed))
+
+def test_create_and_get_players(backend):
+    assert backend.get_player_names() == []
+    assert not backend.does_player_exist("Red")
+    backend.create_player("Red", new_pokemon())
+    backend.create_player("Blue", new_pokemon("Squirtle", ("water",)))
+    backend.reopen()
+    assert list(backend.get_player_names()) == ["Red", "Blue"]
+    assert backend.does_player_exist("Red")
+    assert not backend.does_player_exist("Green")
+
+def test_create_existing_player_keeps_it(backend):
+    backend.create_player("Red", new_pokemon())
+    backend.create_player("Red", new_pokemon("Squirtle", ("water",)))
+    assert list(backend.get_player_pokemons("Red")) == ["Jean-Luc"]
+    assert backend.get_first_pokemon("Red").name == "Charmander"
+
+def test_save_and_update_pokemons(backend):
+    starter = new_pokemon()
+    backend.create_player("Red", starter)
+    caught = new_pokemon("Pidgey", ("normal", "flying"), seed=2)
+    caught.pet_name = "Piou"
+    backend.save_pokemon_to_pokedex("Red", caught)
+    caught.set_hp(3)
+    caught.set_xp(1000)
+    backend.save_pokemon_to_pokedex("Red", caught)
+    backend.reopen()
+
+    assert list(backend.get_player_pokemons("Red")) == ["Jean-Luc", "Piou"]
+    assert backend.get_first_pokemon("Red").pokemon_dict() == starter.pokemon_dict()
+    stored = backend.get_pokemon_from_pokedex("Red", "Piou")
+    assert stored.pokemon_dict() == caught.pokemon_dict()
+    assert stored.get_state() == "domesticated"
+    assert [pokemon.pet_name for pokemon in backend.get_all_pokemons_from_pokedex("Red")] == ["Jean-Luc", "Piou"]
+    assert backend.get_pokemon_from_pokedex("Red", "Missing") is None
+
+def test_bag_round_trip(backend):
+    backend.create_player("Red", new_pokemon())
+    default_bag = Bag()
+    assert backend.get_bag_from_pokedex("Red").get_dict() == default_bag.get_dict()
+
+    bag = Bag()
+    bag.set_potion(2)
+    bag.set_pokeball(7)
+    backend.save_bag_to_pokedex("Red", bag)
+    backend.reopen()
+    assert backend.get_bag_from_pokedex("Red").get_dict() == bag.get_dict()
+
+def test_discoveries_round_trip(backend):
+    backend.create_player("Red", new_pokemon())
+    assert backend.get_discoveries("Red") == []
+    backend.save_discoveries("Red", DISCOVERIES)
+    backend.reopen()
+    assert backend.get_discoveries("Red") == DISCOVERIES
+
+    backend.save_discoveries("Red", DISCOVERIES[:1])
+    assert backend.get_discoveries("Red") == DISCOVERIES[:1]
+
+def test_rng_seed(backend):
+    backend.create_player("Red", new_pokemon())
+    assert backend.get_rng_seed("Red") is None
+    backend.save_rng_seed("Red", 2 ** 40 + 7)
+    backend.reopen()
+    assert backend.get_rng_seed("Red") == 2 ** 40 + 7
+
+def test_players_differing_by_case_are_kept_apart(backend):
+    backend.create_player("Red", new_pokemon())
+    backend.create_player("red", new_pokemon("Squirtle", ("water",)))
+    bag = Bag()
+    bag.set_potion(1)
+    backend.save_bag_to_pokedex("red", bag)
+    backend.reopen()
+
+    assert list(backend.get_player_names()) == ["Red", "red"]
+    assert backend.get_first_pokemon("Red").name == "Charmander"
+    assert backend.get_first_pokemon("red").name == "Squirtle"
+    assert backend.get_bag_from_pokedex("Red").get_dict() == Bag().get_dict()
+    assert backend.get_bag_from_pokedex("red").get_dict() == bag.get_dict()
+
+def test_shard_names_are_case_insensitively_unique(tmp_path):
+    names = ["Red", "red", "RED", "CON", "nul", "Sacha/..", "Ékaterina"]
+    shards = [shard_file_name(name) for name in names]
+    assert len({shard.casefold() for shard in shards}) == len(names)
+    assert all(shard.startswith("player-") and shard.isascii() for shard in shards)
+    # A shard already taken in the index is never reused
+    assert shard_file_name("Red", {"Other" : shards[0].upper()}) != shards[0]
+
+    legacy_path = os.path.join(tmp_path, "player_pokedex.json")
+    with open(legacy_path, "w", encoding="UTF-8") as file:
+        json.dump({"Sacha" : {"bag" : {"potions" : 1}, "pokemons" : {}},
+                   "sacha" : {"bag" : {"potions" : 2}, "pokemons" : {}}}, file)
+    store = new_save_store(tmp_path)
+    assert store.get_bag("Sacha") == {"potions" : 1}
+    assert store.get_bag("sacha") == {"potions" : 2}
+    with open(os.path.join(tmp_path, "index.json"), "r", encoding="UTF-8") as file:
+        migrated_shards = json.load(file)["players"].values()
+    assert len({shard.casefold() for shard in migrated_shards}) == 2